@@ -0,0 +1,184 @@
+"""
+Замеры скорости и пиковой памяти операций всех хранилищ на синтетических библиотеках.
+
+Для каждого хранилища и размера библиотеки замеряются `create` (одной книги и пачкой),
+`read_list`, `read_detail`, `search` по каждому полю, `udate` и `delete`. Время берется по
+`repeat` вызовам без трассировки памяти, пиковая память - отдельным вызовом под `tracemalloc`.
+Результаты сохраняются в JSON; с `--compare` выводится сравнение с прошлым запуском.
+
+Запуск:
+    python3 -m benchmarks.bench_managers --sizes 1000 100000 1000000 --output bench_managers.json
+    python3 -m benchmarks.bench_managers --sizes 1000 --compare bench_managers.json
+"""
+
+import gc
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable
+
+from benchmarks.bench_models import get_rows
+from core.binary_manager import BinaryDataManager
+from core.data_types import Book
+from core.indexes import SortedIndex, TrigramIndex
+from core.interfaces import DataManager
+from core.managers import (
+    CachedCSVDataManager,
+    CSVDataManager,
+    IndexedCSVDataManager,
+    JournaledCSVDataManager,
+    LogCSVDataManager,
+)
+from core.sharded_manager import ShardedCSVDataManager
+from core.sqlite_manager import SQLiteDataManager
+
+FIELDS = Book.get_fields()
+
+MANAGERS: dict[str, Callable[[str], DataManager]] = {
+    'csv': lambda path: CSVDataManager(f'{path}.csv', FIELDS),
+    'csv-indexes': lambda path: CSVDataManager(
+        f'{path}.csv', FIELDS, indexes=[TrigramIndex('title'), TrigramIndex('author'), SortedIndex('year')]
+    ),
+    'cached': lambda path: CachedCSVDataManager(f'{path}.csv', FIELDS),
+    'log': lambda path: LogCSVDataManager(f'{path}.csv', FIELDS),
+    'journaled': lambda path: JournaledCSVDataManager(f'{path}.csv', FIELDS),
+    'indexed': lambda path: IndexedCSVDataManager(f'{path}.csv', FIELDS),
+    'sharded': lambda path: ShardedCSVDataManager(f'{path}.shards', FIELDS),
+    'sqlite': lambda path: SQLiteDataManager(
+        f'{path}.sqlite3', FIELDS, fts_fields=['title', 'author'], indexed_fields=['year']
+    ),
+    'binary': lambda path: BinaryDataManager(f'{path}.bin'),
+}
+
+
+def get_peak_memory(func: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def create_in_new(name: str, path: str, books: list[Book]) -> None:
+    with MANAGERS[name](path) as manager:
+        manager.create(books)
+
+
+def measure(operation: str, calls: list[Callable[[], Any]], memory_call: Callable[[], Any]) -> dict[str, Any]:
+    """Замеряет время каждого вызова из `calls` и пиковую память `memory_call`."""
+    times = []
+    for call in calls:
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return {
+        'operation': operation,
+        'calls': len(times),
+        'total': sum(times),
+        'mean': sum(times) / len(times),
+        'min': min(times),
+        'peak_memory': get_peak_memory(memory_call),
+    }
+
+
+def bench_manager(name: str, size: int, repeat: int, directory: str) -> list[dict[str, Any]]:
+    rows = get_rows(size)
+    books = [Book.from_row(row) for row in rows]
+    rng = random.Random(size)
+    book = Book(title='Новая книга', author='Новый автор', year=2000)
+    manager = MANAGERS[name](os.path.join(directory, name))
+    results = [
+        measure(
+            'create_bulk',
+            [lambda: manager.create(books)],
+            lambda: create_in_new(name, os.path.join(directory, f'{name}-memory'), books),
+        )
+    ]
+    results.append(measure('create', [lambda: manager.create(book)] * repeat, lambda: manager.create(book)))
+    results.append(measure('read_list', [manager.read_list] * min(repeat, 3), manager.read_list))
+    ids = [rng.randint(1, size) for _ in range(3 * repeat + 1)]
+    detail_ids, update_ids, delete_ids = ids[:repeat], ids[repeat : 2 * repeat], list(dict.fromkeys(ids[2 * repeat :]))
+    results.append(
+        measure(
+            'read_detail',
+            [partial(manager.read_detail, id) for id in detail_ids],
+            lambda: manager.read_detail(detail_ids[0]),
+        )
+    )
+    queries = {'title': rows[size // 2]['title'], 'author': rows[size // 3]['author'], 'year': rows[0]['year']}
+    for field, value in queries.items():
+        results.append(
+            measure(
+                f'search_{field}',
+                [partial(manager.search, field, value)] * repeat,
+                partial(manager.search, field, value),
+            )
+        )
+    results.append(
+        measure(
+            'udate',
+            [partial(manager.udate, id, book) for id in update_ids],
+            lambda: manager.udate(update_ids[0], book),
+        )
+    )
+    results.append(
+        measure(
+            'delete',
+            [partial(manager.delete, id) for id in delete_ids[:-1]],
+            lambda: manager.delete(delete_ids[-1]),
+        )
+    )
+    manager.close()
+    return [{'manager': name, 'size': size} | result for result in results]
+
+
+def compare(results: list[dict[str, Any]], path: str, threshold: float) -> None:
+    """Выводит операции, которые стали медленнее прошлого запуска больше чем в `threshold` раз."""
+    with open(path, encoding='utf-8') as file:
+        previous = {(row['manager'], row['size'], row['operation']): row for row in json.load(file)['results']}
+    for row in results:
+        old = previous.get((row['manager'], row['size'], row['operation']))
+        if old is None or not old['mean']:
+            continue
+        ratio = row['mean'] / old['mean']
+        mark = 'МЕДЛЕННЕЕ' if ratio > threshold else ''
+        print(f'{row["manager"]:<12} {row["size"]:>9,} {row["operation"]:<14} {ratio:6.2f}x {mark}')
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Замеры операций хранилищ.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000], help='Размеры библиотек.')
+    parser.add_argument('--managers', nargs='+', choices=MANAGERS, default=list(MANAGERS), help='Хранилища.')
+    parser.add_argument('--repeat', type=int, default=5, help='Количество вызовов каждой операции.')
+    parser.add_argument('--output', default='bench_managers.json', help='Файл для результатов в JSON.')
+    parser.add_argument('--compare', help='JSON прошлого запуска для сравнения.')
+    parser.add_argument('--threshold', type=float, default=1.2, help='Порог замедления при сравнении.')
+    args = parser.parse_args()
+    results = []
+    for size in args.sizes:
+        for name in args.managers:
+            with tempfile.TemporaryDirectory() as directory:
+                for row in bench_manager(name, size, args.repeat, directory):
+                    results.append(row)
+                    print(
+                        f'{name:<12} {size:>9,} {row["operation"]:<14} '
+                        f'{row["mean"] * 1000:12.3f} мс {row["peak_memory"] / 2**20:10.1f} МБ'
+                    )
+    meta = {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+    }
+    with open(args.output, mode='w', encoding='utf-8') as file:
+        json.dump({'meta': meta, 'results': results}, file, ensure_ascii=False, indent=2)
+    if args.compare:
+        compare(results, args.compare, args.threshold)
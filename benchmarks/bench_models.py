@@ -0,0 +1,78 @@
+"""
+Сравнение памяти и скорости прежнего и компактного представления книги.
+
+Запуск:
+    python3 -m benchmarks.bench_models --count 1000000
+"""
+
+import gc
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+from core.data_types import Book, Status
+
+
+@dataclass
+class LegacyBook:
+    """Прежнее представление книги: обычный dataclass с `__dict__` и `asdict`."""
+
+    title: str
+    author: str
+    year: int | str
+    status: str = Status.IN_STOCK.value
+
+    validate_fields = Book.validate_fields
+    validate_title = Book.validate_title
+    validate_author = Book.validate_author
+    validate_year = Book.validate_year
+    validate_status = Book.validate_status
+
+    def __post_init__(self) -> None:
+        self.validate_fields()  # type: ignore[misc]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def get_rows(count: int) -> list[dict[str, str]]:
+    """Строки в том виде, в котором их читает CSVDataManager."""
+    statuses = [Status.IN_STOCK.value, Status.GIVEN.value]
+    return [
+        {'title': f'Книга {i}', 'author': f'Автор {i % 1000}', 'year': str(1900 + i % 120), 'status': statuses[i % 2]}
+        for i in range(count)
+    ]
+
+
+def measure(name: str, rows: list[dict[str, str]], load: Callable[[dict[str, str]], object]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    books = [load(row) for row in rows]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del books
+    gc.collect()
+    start = time.perf_counter()
+    books = [load(row) for row in rows]
+    load_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for book in books:
+        book.to_dict()  # type: ignore[attr-defined]
+    dump_time = time.perf_counter() - start
+    print(
+        f'{name:<24} память: {memory / 2**20:8.1f} МБ | '
+        f'загрузка: {len(rows) / load_time:12,.0f} зап/с | to_dict: {len(rows) / dump_time:12,.0f} зап/с'
+    )
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Сравнение представлений модели Book.')
+    parser.add_argument('--count', type=int, default=1_000_000, help='Количество записей.')
+    args = parser.parse_args()
+    rows = get_rows(args.count)
+    print(f'Записей: {args.count:,}')
+    measure('LegacyBook(**row)', rows, lambda row: LegacyBook(**row))
+    measure('Book(**row)', rows, lambda row: Book(**row))
+    measure('Book.from_row(row)', rows, Book.from_row)
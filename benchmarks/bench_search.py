@@ -0,0 +1,50 @@
+"""
+Ускорение параллельного поиска по CSV в зависимости от числа процессов.
+
+Библиотека из `count` книг записывается во временный файл, после чего поиск по названию
+выполняется последовательно и в пуле из 1, 2, 4, ... процессов (до числа ядер).
+
+Запуск:
+    python3 -m benchmarks.bench_search --count 2000000
+"""
+
+import os
+import tempfile
+import time
+from argparse import ArgumentParser
+
+from benchmarks.bench_models import get_rows
+from core.data_types import Book
+from core.managers import CSVDataManager
+
+
+def measure(manager: CSVDataManager, value: str, repeat: int) -> float:
+    """Возвращает лучшее время поиска из `repeat` вызовов."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        manager.search('title', value)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Замеры параллельного поиска.')
+    parser.add_argument('--count', type=int, default=2_000_000, help='Количество книг.')
+    parser.add_argument('--repeat', type=int, default=3, help='Количество вызовов поиска.')
+    args = parser.parse_args()
+    cores = os.cpu_count() or 1
+    workers = sorted({2**power for power in range(cores.bit_length()) if 2**power <= cores} | {cores})
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'books.csv')
+        manager = CSVDataManager(path, Book.get_fields(), parallel_threshold=None)
+        manager._append([{'id': i} | row for i, row in enumerate(get_rows(args.count), start=1)])
+        value = f'Книга {args.count // 2}'
+        print(f'Файл: {os.path.getsize(path) / 2**20:.1f} МБ, ядер: {cores}')
+        serial = measure(manager, value, args.repeat)
+        print(f'{"последовательно":<16} {serial * 1000:10.1f} мс')
+        for count in workers:
+            with CSVDataManager(path, Book.get_fields(), parallel_threshold=0, search_workers=count) as manager:
+                manager.search('title', value)
+                elapsed = measure(manager, value, args.repeat)
+            print(f'{count:>2} процесса(ов)   {elapsed * 1000:10.1f} мс {serial / elapsed:6.2f}x')
@@ -0,0 +1,116 @@
+"""
+Нагрузочный тест HTTP-сервера: число запросов в секунду и задержки p50/p99.
+
+Без `--url` сервер запускается в отдельном процессе на временной библиотеке из `count` книг
+(`CachedCSVDataManager` с индексами). Клиенты - потоки с постоянными соединениями, каждый
+выполняет свою долю из `requests` запросов: чтение книги по ID, поиск по названию и,
+с долей `write_ratio`, смену статуса.
+
+Запуск:
+    python3 -m benchmarks.bench_server --count 100000 --concurrency 16 --requests 20000
+    python3 -m benchmarks.bench_server --url http://127.0.0.1:8000 --count 1000
+"""
+
+import json
+import multiprocessing
+import os
+import random
+import tempfile
+import threading
+import time
+from argparse import ArgumentParser
+from http.client import HTTPConnection
+from multiprocessing.queues import Queue
+from typing import Any
+from urllib.parse import quote, urlsplit
+
+from benchmarks.bench_models import get_rows
+from core.data_types import Book, Status
+from core.indexes import SortedIndex, TrigramIndex
+from core.managers import CachedCSVDataManager
+from core.server import BookHTTPService
+
+
+def serve(directory: str, count: int, queue: Queue) -> None:
+    """Заполняет библиотеку и запускает сервер на свободном порту, сообщая порт через `queue`."""
+    path = os.path.join(directory, 'books.csv')
+    indexes = [TrigramIndex('title'), TrigramIndex('author'), SortedIndex('year')]
+    CachedCSVDataManager(path, Book.get_fields())._append(
+        [{'id': i} | row for i, row in enumerate(get_rows(count), start=1)]
+    )
+    with CachedCSVDataManager(path, Book.get_fields(), indexes=indexes) as manager:
+        server = BookHTTPService(manager, port=0).create_server()
+        queue.put(server.server_address[1])
+        server.serve_forever()
+
+
+def get_request(count: int, write_ratio: float) -> tuple[str, str, Any]:
+    id = random.randint(1, count)
+    if random.random() < write_ratio:
+        status = random.choice([status.value for status in Status])
+        return 'POST', '/books/status', {'ids': [id], 'status': status}
+    if random.random() < 0.8:
+        return 'GET', f'/books/{id}', None
+    return 'GET', f'/books/search?field=title&value={quote(f"Книга {id}")}&limit=20', None
+
+
+def run_client(host: str, port: int, requests: int, count: int, write_ratio: float, results: list) -> None:
+    """Выполняет `requests` запросов через одно соединение и дописывает в `results` задержки и число ошибок."""
+    connection = HTTPConnection(host, port)
+    latencies, errors = [], 0
+    for _ in range(requests):
+        method, path, body = get_request(count, write_ratio)
+        start = time.perf_counter()
+        connection.request(method, path, body=None if body is None else json.dumps(body))
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        errors += response.status >= 400
+    connection.close()
+    results.append((latencies, errors))
+
+
+def run(host: str, port: int, args: Any) -> None:
+    results: list[tuple[list[float], int]] = []
+    per_client = args.requests // args.concurrency
+    clients = [
+        threading.Thread(target=run_client, args=(host, port, per_client, args.count, args.write_ratio, results))
+        for _ in range(args.concurrency)
+    ]
+    start = time.perf_counter()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.perf_counter() - start
+    latencies = sorted(latency for client_latencies, _ in results for latency in client_latencies)
+    errors = sum(client_errors for _, client_errors in results)
+    print(f'Запросов: {len(latencies)}, ошибок: {errors}, клиентов: {args.concurrency}, время: {elapsed:.2f} с')
+    print(f'RPS: {len(latencies) / elapsed:.0f}')
+    for name, value in (('p50', 0.5), ('p99', 0.99)):
+        print(f'{name}: {latencies[min(int(len(latencies) * value), len(latencies) - 1)] * 1000:.2f} мс')
+    print(f'max: {latencies[-1] * 1000:.2f} мс')
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Нагрузочный тест HTTP-сервера.')
+    parser.add_argument('--url', help='Адрес запущенного сервера. Без него сервер запускается локально.')
+    parser.add_argument('--count', type=int, default=10_000, help='Количество книг (ID запросов берутся из 1..count).')
+    parser.add_argument('--concurrency', type=int, default=8, help='Количество клиентов.')
+    parser.add_argument('--requests', type=int, default=10_000, help='Общее количество запросов.')
+    parser.add_argument('--write-ratio', type=float, default=0.1, help='Доля запросов на смену статуса.')
+    args = parser.parse_args()
+    if args.url:
+        url = urlsplit(args.url)
+        run(url.hostname or '127.0.0.1', url.port or 80, args)
+    else:
+        context = multiprocessing.get_context('spawn')
+        with tempfile.TemporaryDirectory() as directory:
+            queue = context.Queue()
+            process = context.Process(target=serve, args=(directory, args.count, queue), daemon=True)
+            process.start()
+            try:
+                run('127.0.0.1', queue.get(timeout=600), args)
+            finally:
+                process.terminate()
+                process.join()
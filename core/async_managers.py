@@ -0,0 +1,68 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterator, Sequence
+
+from core.data_types import Model
+from core.interfaces import AsyncDataManager, DataManager
+
+
+@dataclass
+class ThreadPoolDataManager(AsyncDataManager):
+    """
+    Асинхронный адаптер для синхронного хранилища.
+
+    Каждая операция `manager` выполняется в пуле потоков, поэтому медленная перезапись файла
+    не блокирует цикл событий. Потокобезопасность операций обеспечивает само хранилище
+    (CSV-менеджеры сериализуют запись блокировкой). Ленивые выборки читаются из пула
+    пачками по `chunk_size` записей.
+    """
+
+    manager: DataManager
+    max_workers: int | None = None
+    chunk_size: int = 100
+
+    def __post_init__(self) -> None:
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='data-manager')
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, partial(func, *args))
+
+    async def _iter_chunks(self, func: Callable[..., Iterator[Any]], *args: Any) -> AsyncIterator[Any]:
+        rows = await self._run(func, *args)
+        while chunk := await self._run(lambda: list(islice(rows, self.chunk_size))):
+            for row in chunk:
+                yield row
+
+    async def close(self) -> None:
+        await self._run(self.manager.close)
+        self.executor.shutdown(wait=True)
+
+    async def create(self, data: Model | Sequence[Model]) -> Any:
+        return await self._run(self.manager.create, data)
+
+    async def read_list(self) -> Any:
+        return await self._run(self.manager.read_list)
+
+    def iter_list(self, offset: int = 0, limit: int | None = None) -> AsyncIterator[Any]:
+        return self._iter_chunks(self.manager.iter_list, offset, limit)
+
+    async def read_detail(self, id: int) -> Any:
+        return await self._run(self.manager.read_detail, id)
+
+    async def udate(self, id: int, data: Model) -> Any:
+        return await self._run(self.manager.udate, id, data)
+
+    async def delete(self, id: int) -> Any:
+        return await self._run(self.manager.delete, id)
+
+    async def search(self, field: str, value: str) -> Any:
+        return await self._run(self.manager.search, field, value)
+
+    def iter_search(self, field: str, value: str, offset: int = 0, limit: int | None = None) -> AsyncIterator[Any]:
+        return self._iter_chunks(self.manager.iter_search, field, value, offset, limit)
+
+    async def search_range(self, field: str, start: int, end: int) -> Any:
+        return await self._run(self.manager.search_range, field, start, end)
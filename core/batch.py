@@ -0,0 +1,178 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, TextIO
+
+from core.data_types import Book
+from core.exceptions import IDErorr
+from core.interfaces import BaseService, DataManager
+from core.query import Predicate
+
+
+@dataclass
+class BookCommands:
+    """
+    Команды для работы с книгами без диалога.
+
+    Команда задается словарем параметров с именем в поле `command`, например
+    `{"command": "add", "title": "...", "author": "...", "year": 2000}`. Используется
+    пакетным режимом и HTTP-сервером.
+    """
+
+    manager: DataManager
+
+    def __post_init__(self) -> None:
+        self.commands: dict[str, Callable[[dict[str, Any]], Any]] = {
+            'add': self.add_book,
+            'get': self.get_detail,
+            'update': self.update_book,
+            'list': self.get_list,
+            'search': self.search_book,
+            'range': self.search_book_range,
+            'fuzzy': self.search_book_fuzzy,
+            'query': self.search_book_query,
+            'status': self.change_status,
+            'delete': self.delete_book,
+            'status_many': self.change_status_many,
+            'delete_many': self.delete_book_many,
+        }
+
+    def get_param(self, params: dict[str, Any], name: str, default: Any = ...) -> Any:
+        if params.get(name) is None:
+            if default is ...:
+                raise ValueError(f'Не заполнено поле `{name}`.')
+            return default
+        return params[name]
+
+    def get_intenger(self, params: dict[str, Any], name: str, default: Any = ...) -> Any:
+        value = self.get_param(params, name, default)
+        if value is None or isinstance(value, int):
+            return value
+        if isinstance(value, str) and value.isdigit():
+            return int(value)
+        raise ValueError(f'Поле `{name}` должно быть числом.')
+
+    def add_book(self, params: dict[str, Any]) -> Any:
+        title, author = self.get_param(params, 'title'), self.get_param(params, 'author')
+        return self.manager.create(Book(title=title, author=author, year=self.get_intenger(params, 'year')))
+
+    def get_detail(self, params: dict[str, Any]) -> Any:
+        return self.manager.read_detail(self.get_intenger(params, 'id'))
+
+    def get_list(self, params: dict[str, Any]) -> Any:
+        offset, limit = self.get_intenger(params, 'offset', 0), self.get_intenger(params, 'limit', None)
+        return list(self.manager.iter_list(offset, limit))
+
+    def search_book(self, params: dict[str, Any]) -> Any:
+        field, value = self.get_param(params, 'field'), str(self.get_param(params, 'value'))
+        offset, limit = self.get_intenger(params, 'offset', 0), self.get_intenger(params, 'limit', None)
+        return list(self.manager.iter_search(field, value, offset, limit))
+
+    def search_book_range(self, params: dict[str, Any]) -> Any:
+        field = self.get_param(params, 'field', 'year')
+        return self.manager.search_range(field, self.get_intenger(params, 'start'), self.get_intenger(params, 'end'))
+
+    def search_book_fuzzy(self, params: dict[str, Any]) -> Any:
+        field, value = self.get_param(params, 'field'), str(self.get_param(params, 'value'))
+        return self.manager.fuzzy_search(field, value, self.get_intenger(params, 'limit', 10))
+
+    def search_book_query(self, params: dict[str, Any]) -> Any:
+        where = self.get_param(params, 'where')
+        if not isinstance(where, list) or not all(isinstance(item, dict) for item in where):
+            raise ValueError('Поле `where` должно быть списком условий.')
+        offset, limit = self.get_intenger(params, 'offset', 0), self.get_intenger(params, 'limit', None)
+        return list(self.manager.query([Predicate.from_dict(item) for item in where], offset, limit))
+
+    def get_ids(self, params: dict[str, Any]) -> list[int]:
+        ids = self.get_param(params, 'ids')
+        if not isinstance(ids, list) or not ids:
+            raise ValueError('Поле `ids` должно быть непустым списком.')
+        return [self.get_intenger({'ids': id}, 'ids') for id in ids]
+
+    def get_book(self, params: dict[str, Any]) -> Book:
+        title, author, status = (self.get_param(params, name) for name in ('title', 'author', 'status'))
+        return Book(title=title, author=author, year=self.get_intenger(params, 'year'), status=status)
+
+    def update_book(self, params: dict[str, Any]) -> Any:
+        return self.manager.udate(self.get_intenger(params, 'id'), self.get_book(params))
+
+    def change_status(self, params: dict[str, Any]) -> Any:
+        id = self.get_intenger(params, 'id')
+        book_dict = self.manager.read_detail(id)
+        book = Book(
+            title=book_dict['title'],
+            author=book_dict['author'],
+            year=int(book_dict['year']),
+            status=self.get_param(params, 'status'),
+        )
+        return self.manager.udate(id, book)
+
+    def change_status_many(self, params: dict[str, Any]) -> Any:
+        """Меняет статус у всех книг из `ids` одной записью; при отсутствующем ID не меняется ни одна."""
+        status = self.get_param(params, 'status')
+        book_dicts = self.manager.read_many(self.get_ids(params))
+        books = {
+            int(book_dict['id']): Book(
+                title=book_dict['title'], author=book_dict['author'], year=int(book_dict['year']), status=status
+            )
+            for book_dict in book_dicts
+        }
+        return self.manager.udate_many(books)
+
+    def delete_book(self, params: dict[str, Any]) -> Any:
+        return self.manager.delete(self.get_intenger(params, 'id'))
+
+    def delete_book_many(self, params: dict[str, Any]) -> Any:
+        return self.manager.delete_many(self.get_ids(params))
+
+    def run(self, params: dict[str, Any]) -> Any:
+        """Выполняет команду и возвращает ее результат. Ошибки (ValueError, IDErorr) не перехватываются."""
+        name = params.get('command')
+        command = self.commands.get(name) if isinstance(name, str) else None
+        if command is None:
+            raise ValueError(f'Неизвестная команда `{name}`.')
+        return command(params)
+
+
+@dataclass
+class BookBatchService(BookCommands, BaseService):
+    """
+    Неинтерактивный режим работы с книгами.
+
+    Читает из `source` команды в формате JSONL (по объекту на строку), выполняет их
+    в одной сессии хранилища и пишет в `output` по JSON-объекту с результатом на каждую команду.
+    Ошибка в одной команде, в том числе непредвиденная, попадает в ее результат и не прерывает
+    обработку остальных.
+    """
+
+    source: TextIO
+    output: TextIO
+
+    def execute(self, line: str) -> dict[str, Any]:
+        """Выполняет одну команду и возвращает ее результат."""
+        try:
+            params = json.loads(line)
+            if not isinstance(params, dict):
+                raise ValueError('Команда должна быть объектом.')
+            return {'ok': True, 'result': self.run(params)}
+        except json.JSONDecodeError as e:
+            return {'ok': False, 'error': f'Некорректный JSON: {e.msg}.'}
+        except IDErorr as e:
+            return {'ok': False, 'error': e.message}
+        except ValueError as e:
+            return {'ok': False, 'error': str(e)}
+        except Exception as e:
+            return {'ok': False, 'error': f'Внутренняя ошибка: {type(e).__name__}: {e}.'}
+
+    def iter_results(self) -> Iterator[dict[str, Any]]:
+        for number, line in enumerate(self.source, start=1):
+            if line.strip():
+                yield {'line': number} | self.execute(line)
+
+    def act(self) -> int:
+        """Выполняет все команды и возвращает число команд, завершившихся ошибкой."""
+        errors = 0
+        for result in self.iter_results():
+            errors += not result['ok']
+            self.output.write(json.dumps(result, ensure_ascii=False) + '\n')
+        self.output.flush()
+        return errors
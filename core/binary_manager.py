@@ -0,0 +1,189 @@
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from core.data_types import Book, Model, ModelDict, Status
+from core.exceptions import IDErorr
+from core.interfaces import DataManager
+from core.text import normalize
+
+STATUSES = [status.value for status in Status]
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+
+@dataclass
+class BinaryDataManager(DataManager):
+    """
+    Хранилище книг в бинарном файле с записями фиксированной ширины.
+
+    Файл начинается с заголовка (сигнатура, версия, ширина записи, число записей), за которым
+    идут записи: id, год, признак удаления и код статуса упакованы целыми числами, название и автор
+    хранятся в полях ограниченной ширины в UTF-8. Запись с id N лежит по смещению
+    `HEADER_SIZE + (N - 1) * record_size`, поэтому поиск по id - это арифметика над отображенным
+    в память (`mmap`) файлом, а изменение записи - запись нескольких байт на месте.
+    """
+
+    path: str | Path
+    title_width: int = 192
+    author_width: int = 96
+    initial_capacity: int = 1024
+
+    MAGIC = b'LBDB'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHHI')
+    HEADER_SIZE = 16
+    YEAR_OFFSET = 4
+    LIVE_OFFSET = 6
+    STATUS_OFFSET = 7
+
+    def __post_init__(self) -> None:
+        self.fieldnames = Book.get_fields()
+        self.record = struct.Struct(f'<IHBB{self.title_width}s{self.author_width}s')
+        self.year_field = struct.Struct('<H')
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        if not os.path.exists(self.path) or not os.path.getsize(self.path):
+            with open(self.path, mode='wb') as file:
+                file.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.record.size, 0).ljust(self.HEADER_SIZE))
+                file.truncate(self.HEADER_SIZE + self.initial_capacity * self.record.size)
+        self.file = open(self.path, mode='r+b')
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        magic, version, record_size, self.count = self.HEADER.unpack_from(self.map, 0)
+        if magic != self.MAGIC or version != self.VERSION or record_size != self.record.size:
+            self.close()
+            raise ValueError(f'Файл {self.path} не является файлом библиотеки этого формата.')
+
+    def _get_offset(self, id: int) -> int:
+        if not 0 < id <= self.count:
+            raise IDErorr(message=f'ID {id} не существует.')
+        return self.HEADER_SIZE + (id - 1) * self.record.size
+
+    def _encode(self, value: str, width: int, name: str) -> bytes:
+        raw = value.encode()
+        if len(raw) > width:
+            raise ValueError(f'Поле `{name}` не должно превышать {width} байт в UTF-8.')
+        return raw
+
+    def _pack(self, id: int, values: ModelDict) -> bytes:
+        return self.record.pack(
+            id,
+            int(values['year']),
+            1,
+            STATUS_CODES[values['status']],
+            self._encode(values['title'], self.title_width, 'Название'),
+            self._encode(values['author'], self.author_width, 'Автор'),
+        )
+
+    def _unpack(self, offset: int) -> ModelDict | None:
+        """Читает запись по смещению, возвращая None для удаленной записи."""
+        id, year, is_live, status, title, author = self.record.unpack_from(self.map, offset)
+        if not is_live:
+            return None
+        return {
+            'id': id,
+            'title': title.rstrip(b'\0').decode(),
+            'author': author.rstrip(b'\0').decode(),
+            'year': year,
+            'status': STATUSES[status],
+        }
+
+    def _iter_rows(self) -> Iterator[ModelDict]:
+        for offset in range(self.HEADER_SIZE, self.HEADER_SIZE + self.count * self.record.size, self.record.size):
+            row = self._unpack(offset)
+            if row is not None:
+                yield row
+
+    def _reserve(self, count: int) -> None:
+        """Увеличивает файл вдвое, если новые записи в него не помещаются."""
+        size = self.HEADER_SIZE + count * self.record.size
+        current_size = len(self.map)
+        if size <= current_size:
+            return
+        self.map.close()
+        self.file.truncate(max(size, 2 * current_size))
+        self.map = mmap.mmap(self.file.fileno(), 0)
+
+    def close(self) -> None:
+        if not self.file.closed:
+            if not self.map.closed:
+                self.map.flush()
+                self.map.close()
+            self.file.close()
+
+    def _write_header(self) -> None:
+        self.HEADER.pack_into(self.map, 0, self.MAGIC, self.VERSION, self.record.size, self.count)
+
+    def migrate(self, source: DataManager) -> int:
+        """Однократно переносит записи из другого хранилища с сохранением id, если файл пуст."""
+        if self.count:
+            return 0
+        rows = source.read_list()
+        self.count = max((int(row['id']) for row in rows), default=0)
+        self._reserve(self.count)
+        for row in rows:
+            id = int(row['id'])
+            offset = self._get_offset(id)
+            self.map[offset : offset + self.record.size] = self._pack(id, row)
+        self._write_header()
+        return len(rows)
+
+    def create(self, data: Model | Sequence[Model]) -> ModelDict | list[ModelDict]:
+        models = data if isinstance(data, Sequence) else [data]
+        write_data = [model.to_dict() | {'id': self.count + number} for number, model in enumerate(models, start=1)]
+        records = b''.join(self._pack(values['id'], values) for values in write_data)
+        self._reserve(self.count + len(write_data))
+        offset = self.HEADER_SIZE + self.count * self.record.size
+        self.map[offset : offset + len(records)] = records
+        self.count += len(write_data)
+        self._write_header()
+        return write_data if isinstance(data, Sequence) else write_data[0]
+
+    def read_list(self) -> list[ModelDict]:
+        return list(self._iter_rows())
+
+    def iter_list(self, offset: int = 0, limit: int | None = None) -> Iterator[ModelDict]:
+        return islice(self._iter_rows(), offset, None if limit is None else offset + limit)
+
+    def read_detail(self, id: int) -> ModelDict:
+        row = self._unpack(self._get_offset(id))
+        if row is None:
+            raise IDErorr(message=f'ID {id} не существует.')
+        return row
+
+    def udate(self, id: int, data: Model) -> ModelDict:
+        offset = self._get_offset(id)
+        row = self.read_detail(id)
+        model_data = {'id': id} | data.to_dict()
+        if all(row[name] == model_data[name] for name in ('title', 'author', 'year')):
+            self.map[offset + self.STATUS_OFFSET] = STATUS_CODES[model_data['status']]
+        else:
+            self.map[offset : offset + self.record.size] = self._pack(id, model_data)
+        return model_data
+
+    def delete(self, id: int) -> ModelDict:
+        row = self.read_detail(id)
+        self.map[self._get_offset(id) + self.LIVE_OFFSET] = 0
+        return row
+
+    def search(self, field: str, value: str) -> list[ModelDict]:
+        return list(self.iter_search(field, value))
+
+    def iter_search(self, field: str, value: str, offset: int = 0, limit: int | None = None) -> Iterator[ModelDict]:
+        if field not in self.fieldnames:
+            raise ValueError('Поля %s нет в файле.' % field)
+        value = normalize(value)
+        rows = (row for row in self._iter_rows() if value in normalize(row[field]))
+        return islice(rows, offset, None if limit is None else offset + limit)
+
+    def search_range(self, field: str, start: int, end: int) -> list[ModelDict]:
+        if field != 'year':
+            raise ValueError('Поиск по диапазону поддерживается только для поля year.')
+        rows = []
+        for offset in range(self.HEADER_SIZE, self.HEADER_SIZE + self.count * self.record.size, self.record.size):
+            (year,) = self.year_field.unpack_from(self.map, offset + self.YEAR_OFFSET)
+            if start <= year <= end and (row := self._unpack(offset)) is not None:
+                rows.append(row)
+        return sorted(rows, key=lambda row: row['year'])
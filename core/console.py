@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
 
 from core.constants import (
     BOOK,
@@ -7,40 +8,78 @@ from core.constants import (
     BOOK_DELETE,
     BOOK_GET,
     BOOK_ID,
+    BOOK_IDS,
     BOOK_INPUT,
     BOOK_LIST,
     BOOK_TITLE,
     BOOK_UPDATE,
     BOOK_YEAR,
+    BOOKS_STATUS_UPDATE,
     ERORR_CHOISE,
+    FUZZY_LIMIT,
     GREETING,
+    MAX_BOOK_IDS,
     MENU,
     MENU_BUTTON,
     MENU_GET_BOOK,
+    MENU_PAGE,
     MENU_SEARCH_BOOK,
     MENU_STATUS_BOOK,
+    PAGE_SIZE,
+    QUERY_AUTHOR,
+    QUERY_EMPTY,
+    QUERY_STATUS,
+    QUERY_TITLE,
+    QUERY_YEAR_END,
+    QUERY_YEAR_START,
+    RANGE_END,
+    RANGE_START,
     SEARCH_DICT,
+    SEARCH_FUZZY_DICT,
+    SEARCH_QUERY,
+    SEARCH_RANGE_DICT,
+    STATS_EMPTY,
+    STATS_HEADER,
+    STATS_ROW,
     STATUS_DICT,
 )
 from core.data_types import Book, ModelDict, TextFormat
 from core.exceptions import IDErorr
-from core.interfaces import ConsoleService
-from core.managers import CSVDataManager
+from core.interfaces import ConsoleService, DataManager
+from core.metrics import Metrics
+from core.query import Predicate
 
 
 @dataclass
 class BookConsoleService(ConsoleService):
-    manager: CSVDataManager
+    manager: DataManager
+    metrics: Metrics = field(default_factory=Metrics)
 
     def is_correct_menu_intenger(self, value: str, text: str) -> bool:
         """Проверяет, что введен правильный вариант ответа (int)."""
         return value in text and value.isdigit()
 
-    def get_intenger(self, value: str) -> int:
+    def get_intenger(self, value: str, message: str = 'ID должно быть числом.') -> int:
         """Возвращает число, если это возможно."""
         if value.isdigit():
             return int(value)
-        raise ValueError('ID должно быть числом.')
+        raise ValueError(message)
+
+    def get_ids(self, value: str) -> list[int]:
+        """Возвращает список ID из строки вида `1,2,5-10` без повторов и в порядке ввода."""
+        message = 'ID должны быть числами или диапазонами, например 1,2,5-10.'
+        ids: dict[int, None] = {}
+        for part in value.replace(' ', '').split(','):
+            start, separator, end = part.partition('-')
+            first = self.get_intenger(start, message)
+            last = self.get_intenger(end, message) if separator else first
+            if first > last:
+                raise ValueError(message)
+            # Длина диапазона проверяется до того, как он разворачивается в набор ID.
+            if last - first + 1 > MAX_BOOK_IDS or len(ids.keys() | range(first, last + 1)) > MAX_BOOK_IDS:
+                raise ValueError(f'За один раз можно указать не больше {MAX_BOOK_IDS} ID.')
+            ids.update(dict.fromkeys(range(first, last + 1)))
+        return list(ids)
 
     def handle_menu(self, menu: str) -> None | str:
         """Обработчик главного меню."""
@@ -62,15 +101,22 @@ class BookConsoleService(ConsoleService):
     def handle_action(self, value: str) -> None:
         match value:
             case '1':
-                self.add_book()
+                action = self.add_book
             case '2':
-                self.handle_get_book_menu()
+                action = self.handle_get_book_menu
             case '3':
-                self.search_book()
+                action = self.search_book
             case '4':
-                self.change_status()
+                action = self.change_status
             case '5':
-                self.delete_book()
+                action = self.delete_book
+            case '6':
+                action = self.show_stats
+            case '7':
+                action = self.change_status_many
+            case _:
+                return
+        self.metrics.measure(f'action:{action.__name__}', action)
 
     def add_book(self) -> None:
         title = self.input(BOOK_TITLE, TextFormat.BLUE)
@@ -87,13 +133,29 @@ class BookConsoleService(ConsoleService):
             self.write('\nПо вашему запросу ничего не найдено.', TextFormat.YELLOW)
             return
         self.write('\nКниги:', TextFormat.GREEN)
-        for book_dict in book_dicts:
-            self.write(BOOK_LIST.format(**book_dict), TextFormat.GREEN)
+        self.write_many((BOOK_LIST.format(**book_dict) for book_dict in book_dicts), TextFormat.GREEN)
         self.write('\n')
 
+    def show_pages(self, get_page: Callable[[int, int], Iterable[ModelDict]]) -> None:
+        """Выводит результаты постранично, запрашивая у хранилища только текущую страницу."""
+        page = 0
+        while True:
+            book_dicts = list(get_page(page * PAGE_SIZE, PAGE_SIZE + 1))
+            has_next = len(book_dicts) > PAGE_SIZE
+            self.show_list(book_dicts[:PAGE_SIZE])
+            if page == 0 and not has_next:
+                return
+            self.write(MENU_PAGE.format(page + 1), TextFormat.BLUE)
+            match self.input(MENU_BUTTON, TextFormat.YELLOW):
+                case '1' if has_next:
+                    page += 1
+                case '2' if page > 0:
+                    page -= 1
+                case _:
+                    return
+
     def get_list(self) -> None:
-        book_dicts = self.manager.read_list()
-        self.show_list(book_dicts)
+        self.show_pages(self.manager.iter_list)
 
     def request_id(self) -> int:
         str_id = self.input(BOOK_ID, TextFormat.BLUE)
@@ -108,10 +170,52 @@ class BookConsoleService(ConsoleService):
         text = self.handle_menu(MENU_SEARCH_BOOK)
         if not text:
             return
+        if text in SEARCH_RANGE_DICT:
+            self.search_book_range(SEARCH_RANGE_DICT[text][0])
+            return
+        if text in SEARCH_FUZZY_DICT:
+            self.search_book_fuzzy(SEARCH_FUZZY_DICT[text][0])
+            return
+        if text == SEARCH_QUERY:
+            self.search_book_query()
+            return
         field = SEARCH_DICT[text][0]
         value = self.input(BOOK_INPUT.format(SEARCH_DICT[text][1].lower()), TextFormat.BLUE)
-        book_dicts = self.manager.search(field, value)
-        self.show_list(book_dicts)
+        self.show_pages(lambda offset, limit: self.manager.iter_search(field, value, offset, limit))
+
+    def search_book_range(self, field: str) -> None:
+        message = 'Границы диапазона должны быть числами.'
+        start = self.get_intenger(self.input(RANGE_START, TextFormat.BLUE), message)
+        end = self.get_intenger(self.input(RANGE_END, TextFormat.BLUE), message)
+        book_dicts = self.manager.search_range(field, start, end)
+        self.show_pages(lambda offset, limit: book_dicts[offset : offset + limit])
+
+    def search_book_fuzzy(self, field: str) -> None:
+        """Выводит книги, ближайшие к запросу с учетом опечаток, начиная с самых похожих."""
+        value = self.input(BOOK_TITLE if field == 'title' else BOOK_AUTHOR, TextFormat.BLUE)
+        self.show_list(self.manager.fuzzy_search(field, value, FUZZY_LIMIT))
+
+    def search_book_query(self) -> None:
+        """Спрашивает условия по нескольким полям (пустой ввод пропускает условие) и ищет книги, подходящие под все."""
+        predicates = []
+        if title := self.input(QUERY_TITLE, TextFormat.BLUE).strip():
+            predicates.append(Predicate.contains('title', title))
+        if author := self.input(QUERY_AUTHOR, TextFormat.BLUE).strip():
+            predicates.append(Predicate.contains('author', author))
+        if status := self.input(QUERY_STATUS, TextFormat.BLUE).strip():
+            if status not in STATUS_DICT:
+                raise ValueError(ERORR_CHOISE.strip())
+            predicates.append(Predicate.eq('status', STATUS_DICT[status]))
+        message = 'Границы диапазона должны быть числами.'
+        start = self.input(QUERY_YEAR_START, TextFormat.BLUE).strip()
+        end = self.input(QUERY_YEAR_END, TextFormat.BLUE).strip()
+        if start or end:
+            start_year = self.get_intenger(start, message) if start else None
+            end_year = self.get_intenger(end, message) if end else None
+            predicates.append(Predicate.range('year', start_year, end_year))
+        if not predicates:
+            raise ValueError(QUERY_EMPTY)
+        self.show_pages(lambda offset, limit: self.manager.query(predicates, offset, limit))
 
     def change_status(self) -> None:
         id = self.request_id()
@@ -130,19 +234,70 @@ class BookConsoleService(ConsoleService):
         book_dict = self.manager.udate(id, book)
         self.write(BOOK_UPDATE.format(**book_dict), TextFormat.GREEN)
 
+    def change_status_many(self) -> None:
+        """Меняет статус у списка книг: все ID проверяются заранее, изменения записываются за один проход."""
+        ids = self.get_ids(self.input(BOOK_IDS, TextFormat.BLUE))
+        book_dicts = self.manager.read_many(ids)
+        text = self.handle_menu(MENU_STATUS_BOOK)
+        if not text:
+            return
+        status = STATUS_DICT[text]
+        books = {}
+        for book_dict in book_dicts:
+            if book_dict['status'] != status:
+                fields = {name: value for name, value in book_dict.items() if name not in ('id', 'status')}
+                books[int(book_dict['id'])] = Book(status=status, **fields)
+        if books:
+            self.manager.udate_many(books)
+        skipped = [book_dict['id'] for book_dict in book_dicts if int(book_dict['id']) not in books]
+        self.write(
+            BOOKS_STATUS_UPDATE.format(
+                status=status,
+                changed=', '.join(map(str, books)) or '-',
+                skipped=', '.join(map(str, skipped)) or '-',
+            ),
+            TextFormat.GREEN,
+        )
+
     def delete_book(self) -> None:
         id = self.request_id()
         book_dict = self.manager.delete(id)
         self.write(BOOK_DELETE.format(**book_dict), TextFormat.GREEN)
 
+    def show_stats(self) -> None:
+        """Выводит статистику операций хранилища и действий меню."""
+        if not self.metrics.operations:
+            self.write(STATS_EMPTY, TextFormat.YELLOW)
+            return
+        rows = []
+        for name, stats in sorted(self.metrics.operations.items()):
+            p95 = stats.percentile(0.95)
+            rows.append(
+                STATS_ROW.format(
+                    name,
+                    stats.calls,
+                    stats.errors,
+                    stats.mean * 1000,
+                    f'<= {p95 * 1000:g}' if p95 != float('inf') else '> 5000',
+                    stats.rows,
+                    stats.bytes_read / 1024,
+                    stats.bytes_written / 1024,
+                )
+            )
+        self.write(STATS_HEADER, TextFormat.GREEN)
+        self.write_many(rows, TextFormat.GREEN)
+
     def act(self) -> None:
         self.write(GREETING, TextFormat.GREEN)
-        while True:
-            menu = self.handle_menu(MENU)
-            if not menu:
-                continue
-            try:
-                self.handle_action(menu)
-                self.input('Нажмите любую кнопку для продолжения', TextFormat.YELLOW)
-            except (ValueError, IDErorr) as e:
-                self.write('\n%s\n' % str(e), TextFormat.RED)
+        try:
+            while True:
+                menu = self.handle_menu(MENU)
+                if not menu:
+                    continue
+                try:
+                    self.handle_action(menu)
+                    self.input('Нажмите любую кнопку для продолжения', TextFormat.YELLOW)
+                except (ValueError, IDErorr) as e:
+                    self.write('\n%s\n' % str(e), TextFormat.RED)
+        finally:
+            self.flush()
@@ -10,17 +10,26 @@ MENU = '''
 3. Поиск книги
 4. Изменение статуса книги
 5. Удаление книги
+6. Статистика
+7. Изменение статуса нескольких книг
 '''
 MENU_GET_BOOK = '''
 1. Показать всю библиотеку
 2. Найти книгу по ID
 '''
 SEARCH_DICT = {'1': ('title', 'Название'), '2': ('author', 'Автор'), '3': ('year', 'Год издания')}
+SEARCH_RANGE_DICT = {'4': ('year', 'Год издания в диапазоне')}
+SEARCH_FUZZY_DICT = {'5': ('title', 'Название с опечатками'), '6': ('author', 'Автор с опечатками')}
+SEARCH_QUERY = '7'
 MENU_SEARCH_BOOK = f'''
 Найти книгу по полю:
 1. {SEARCH_DICT['1'][1]}
 2. {SEARCH_DICT['2'][1]}
 3. {SEARCH_DICT['3'][1]}
+4. {SEARCH_RANGE_DICT['4'][1]}
+5. {SEARCH_FUZZY_DICT['5'][1]}
+6. {SEARCH_FUZZY_DICT['6'][1]}
+{SEARCH_QUERY}. Расширенный поиск по нескольким полям
 '''
 
 STATUS_DICT = {'1': Status.IN_STOCK.value, '2': Status.GIVEN.value}
@@ -29,16 +38,39 @@ MENU_STATUS_BOOK = f'''На какой статус изменить:
 2. {STATUS_DICT['2']}
 '''
 
+PAGE_SIZE = 20
+FUZZY_LIMIT = 10
+MAX_BOOK_IDS = 1000
+MENU_PAGE = '''Страница {}
+1. Следующая страница
+2. Предыдущая страница
+Любая другая клавиша - выход
+'''
+
 MENU_BUTTON = 'Введите номер пункта меню: '
 
+STATS_HEADER = '| Операция | Вызовы | Ошибки | Среднее, мс | p95, мс | Строки | Прочитано, КБ | Записано, КБ |'
+STATS_ROW = '| {} | {} | {} | {:.3f} | {} | {} | {:.1f} | {:.1f} |'
+STATS_EMPTY = '\nСтатистика пока пуста.'
+
 ERORR_CHOISE = '\nНеверно выбран пункт меню.'
 
 BOOK_INPUT = '\nВведите {} книги: '
 BOOK_ID = BOOK_INPUT.format('ID')
+BOOK_IDS = '\nВведите ID книг через запятую или диапазоном, например 1,2,5-10: '
 BOOK_TITLE = BOOK_INPUT.format('название')
 BOOK_AUTHOR = BOOK_INPUT.format('автора')
 BOOK_YEAR = BOOK_INPUT.format('год издания')
 BOOK_STATUS = BOOK_INPUT.format('статус')
+RANGE_START = '\nВведите начало диапазона: '
+RANGE_END = '\nВведите конец диапазона: '
+QUERY_SKIP = ' (Enter - пропустить): '
+QUERY_TITLE = '\nНазвание содержит' + QUERY_SKIP
+QUERY_AUTHOR = '\nАвтор содержит' + QUERY_SKIP
+QUERY_YEAR_START = '\nГод издания от' + QUERY_SKIP
+QUERY_YEAR_END = '\nГод издания до' + QUERY_SKIP
+QUERY_STATUS = f'\nСтатус: 1 - {STATUS_DICT["1"]}, 2 - {STATUS_DICT["2"]}' + QUERY_SKIP
+QUERY_EMPTY = 'Не задано ни одного условия поиска.'
 BOOK = '''
 ID - `{id}`
 Название - `{title}`
@@ -65,6 +97,7 @@ BOOK_UPDATE = (
 '''
     + BOOK
 )
+BOOKS_STATUS_UPDATE = '\nСтатус `{status}` установлен у книг: {changed}, уже был у книг: {skipped}.'
 BOOK_DELETE = (
     '''
 Книга удалена:
@@ -1,20 +1,56 @@
-from dataclasses import asdict, dataclass
+from dataclasses import MISSING, dataclass, fields
 from datetime import datetime
 from enum import Enum
+from typing import Any, Self
 
 ModelDict = dict
 
 
-@dataclass
+FIELD_DEFAULTS: dict[type, tuple[tuple[str, Any], ...]] = {}
+
+
+def get_field_defaults(cls: type) -> tuple[tuple[str, Any], ...]:
+    """Возвращает пары (имя поля, значение по умолчанию) модели, вычисляя их один раз на класс."""
+    if cls not in FIELD_DEFAULTS:
+        FIELD_DEFAULTS[cls] = tuple((model_field.name, model_field.default) for model_field in fields(cls))
+    return FIELD_DEFAULTS[cls]
+
+
+@dataclass(slots=True)
 class Model:
     """Базовая модель."""
 
     @classmethod
     def get_fields(cls) -> list[str]:
-        return list(cls.__annotations__.keys())
+        return [name for name, _ in get_field_defaults(cls)]
+
+    @classmethod
+    def construct(cls, **values: Any) -> Self:
+        """Создает экземпляр без вызова `__post_init__`, то есть без валидации."""
+        obj = cls.__new__(cls)
+        for name, default in get_field_defaults(cls):
+            value = values.get(name, default)
+            if value is MISSING:
+                raise ValueError(f'Не заполнено поле `{name}`.')
+            object.__setattr__(obj, name, value)
+        return obj
+
+    @classmethod
+    def from_row(cls, row: ModelDict) -> Self:
+        """Создает экземпляр из уже проверенной записи хранилища без валидации."""
+        return cls.construct(**row)
+
+    @classmethod
+    def get_bounds(cls) -> dict[str, Any]:
+        """Возвращает заранее вычисленные границы для пакетной валидации."""
+        return {}
+
+    def validate_fields(self, **bounds: Any) -> None:
+        """Проверяет поля модели."""
 
     def to_dict(self) -> ModelDict:
-        return asdict(self)
+        """Возвращает поля модели в виде словаря без рекурсивного копирования значений."""
+        return {name: getattr(self, name) for name, _ in get_field_defaults(type(self))}
 
 
 class Status(Enum):
@@ -22,7 +58,10 @@ class Status(Enum):
     GIVEN = 'Выдана'
 
 
-@dataclass
+STATUS_VALUES = {status.value: status.value for status in Status}
+
+
+@dataclass(slots=True)
 class Book(Model):
     """Модель описывающая книгу."""
 
@@ -34,10 +73,24 @@ class Book(Model):
     def __post_init__(self) -> None:
         self.validate_fields()
 
-    def validate_fields(self):
+    @classmethod
+    def from_row(cls, row: ModelDict) -> Self:
+        """Создает книгу из строки хранилища: год приводится к числу, статус - к общему экземпляру строки."""
+        book = cls.__new__(cls)
+        book.title = row['title']
+        book.author = row['author']
+        book.year = int(row['year'])
+        book.status = STATUS_VALUES.get(row['status'], row['status'])
+        return book
+
+    @classmethod
+    def get_bounds(cls) -> dict[str, Any]:
+        return {'max_year': datetime.now().year}
+
+    def validate_fields(self, **bounds: Any) -> None:
         self.validate_title()
         self.validate_author()
-        self.validate_year()
+        self.validate_year(bounds.get('max_year'))
         self.validate_status()
 
     def validate_title(self) -> None:
@@ -48,10 +101,14 @@ class Book(Model):
         if not isinstance(self.author, str) or not self.author.strip():
             raise ValueError(f'Поле `Автор` должно быть непустой строкой.\nПолучено: {self.author}')
 
-    def validate_year(self) -> None:
-        year = datetime.now().year
+    def validate_year(self, max_year: int | None = None) -> None:
+        year = datetime.now().year if max_year is None else max_year
         error = ValueError(f'Поле `Год издания` должно быть целым числом в диапазоне 0-{year}.\nПолучено: {self.year}')
-        if isinstance(self.year, str) and not self.year.isdigit():
+        if isinstance(self.year, bool) or not isinstance(self.year, (int, float, str)):
+            raise error
+        if isinstance(self.year, str) and not self.year.isdecimal():
+            raise error
+        if isinstance(self.year, float) and not self.year.is_integer():
             raise error
         self.year = int(self.year)
         if self.year < 0 or self.year > year:
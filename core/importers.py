@@ -0,0 +1,79 @@
+import json
+from csv import DictReader
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator
+
+from core.data_types import Book, Model
+from core.interfaces import DataManager
+
+
+@dataclass
+class ImportReport:
+    """Итог пакетного импорта: число созданных записей и отклоненные строки источника."""
+
+    created: int = 0
+    rejects: list[tuple[int, str]] = field(default_factory=list)
+
+
+@dataclass
+class BulkImporter:
+    """
+    Потоковый импорт записей из CSV или JSONL в хранилище.
+
+    Источник читается построчно и обрабатывается пачками по `batch_size` строк. Границы для
+    валидации вычисляются один раз на пачку, прошедшие проверку записи создаются одним вызовом
+    `create`, а ошибочные строки попадают в отчет и не прерывают импорт.
+    """
+
+    manager: DataManager
+    model: type[Model] = Book
+    batch_size: int = 1000
+    encoding: str = 'utf-8'
+
+    def iter_source(self, path: str | Path) -> Iterator[tuple[int, Any]]:
+        """Отдает пары (номер строки, данные строки или ошибка ее разбора)."""
+        suffix = Path(path).suffix.lower()
+        if suffix not in ('.csv', '.jsonl', '.ndjson'):
+            raise ValueError(f'Файл {path} должен быть в формате CSV или JSONL.')
+        with open(path, mode='r', encoding=self.encoding, newline='') as file:
+            if suffix == '.csv':
+                reader = DictReader(file)
+                for row in reader:
+                    yield reader.line_num, row
+            else:
+                for number, line in enumerate(file, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield number, json.loads(line)
+                    except json.JSONDecodeError as e:
+                        yield number, ValueError(f'Некорректный JSON: {e.msg}.')
+
+    def validate(self, row: Any, bounds: dict[str, Any]) -> Model:
+        """Проверяет строку источника и возвращает модель без повторной валидации в `__post_init__`."""
+        if isinstance(row, ValueError):
+            raise row
+        if not isinstance(row, dict):
+            raise ValueError('Строка должна быть объектом.')
+        values = {name: row[name] for name in self.model.get_fields() if row.get(name) not in (None, '')}
+        obj = self.model.construct(**values)
+        obj.validate_fields(**bounds)
+        return obj
+
+    def run(self, path: str | Path) -> ImportReport:
+        report = ImportReport()
+        source = self.iter_source(path)
+        while batch := list(islice(source, self.batch_size)):
+            bounds = self.model.get_bounds()
+            models = []
+            for number, row in batch:
+                try:
+                    models.append(self.validate(row, bounds))
+                except (TypeError, ValueError) as e:
+                    report.rejects.append((number, str(e)))
+            if models:
+                self.manager.create(models)
+                report.created += len(models)
+        return report
@@ -0,0 +1,197 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any
+
+from core.data_types import ModelDict
+from core.interfaces import Index
+from core.query import Operator, Predicate
+from core.text import fuzzy_distance, get_max_distance, normalize
+
+
+@dataclass
+class TrigramIndex(Index):
+    """
+    Инвертированный индекс триграмм для поиска подстроки в текстовом поле.
+
+    Для запроса из трех и более символов кандидаты получаются пересечением списков id
+    по всем триграммам запроса, после чего проверяются по сохраненным нормализованным ключам
+    (см. `core.text.normalize`).
+    """
+
+    field: str
+    size: int = 3
+
+    VERSION = 2
+
+    def __post_init__(self) -> None:
+        self.keys: dict[int, str] = {}
+        self.postings: dict[str, set[int]] = {}
+
+    def get_key(self, value: object) -> str:
+        """Приводит значение поля к виду, по которому ведется поиск."""
+        return normalize(value)
+
+    def get_ngrams(self, key: str) -> set[str]:
+        return {key[i : i + self.size] for i in range(len(key) - self.size + 1)}
+
+    def build(self, rows: dict[int, ModelDict]) -> None:
+        self.keys = {}
+        self.postings = {}
+        for id, row in rows.items():
+            self.add(id, row)
+
+    def get_state(self) -> Any:
+        """Сохраняются только ключи записей: списки id по триграммам восстанавливаются из них."""
+        return list(self.keys.items())
+
+    def set_state(self, state: Any) -> None:
+        keys = {int(id): str(key) for id, key in state}
+        self.keys, self.postings = {}, {}
+        for id, key in keys.items():
+            self.keys[id] = key
+            for ngram in self.get_ngrams(key):
+                self.postings.setdefault(ngram, set()).add(id)
+
+    def add(self, id: int, row: ModelDict) -> None:
+        key = self.get_key(row[self.field])
+        self.keys[id] = key
+        for ngram in self.get_ngrams(key):
+            self.postings.setdefault(ngram, set()).add(id)
+
+    def remove(self, id: int, row: ModelDict) -> None:
+        key = self.keys.pop(id, None)
+        if key is None:
+            return
+        for ngram in self.get_ngrams(key):
+            ids = self.postings.get(ngram)
+            if ids is None:
+                continue
+            ids.discard(id)
+            if not ids:
+                del self.postings[ngram]
+
+    def search(self, value: str) -> list[int] | None:
+        query = self.get_key(value)
+        if len(query) < self.size:
+            return None
+        postings = sorted((self.postings.get(ngram, set()) for ngram in self.get_ngrams(query)), key=len)
+        candidates = set.intersection(*postings)
+        return sorted(id for id in candidates if query in self.keys[id])
+
+    def fuzzy_search(self, value: str, limit: int) -> list[int]:
+        """
+        Возвращает до `limit` id записей, ближайших к запросу по расстоянию редактирования.
+
+        При k опечатках совпадение сохраняет не меньше `n - size * k` из n триграмм запроса, поэтому
+        по числу общих триграмм c расстояние не меньше `(n - c) / size`. Кандидаты проверяются
+        от большего числа общих триграмм к меньшему, пока эта оценка не превысит расстояние
+        последнего из `limit` найденных; записи без общих триграмм проверяются в последнюю очередь.
+        """
+        if limit <= 0:
+            return []
+        query = self.get_key(value)
+        max_distance = get_max_distance(query)
+        ngrams = self.get_ngrams(query)
+        counts = Counter(id for ngram in ngrams for id in self.postings.get(ngram, ()))
+        candidates = chain(
+            sorted(counts.items(), key=lambda item: (-item[1], item[0])),
+            ((id, 0) for id in self.keys if id not in counts),
+        )
+        ranked: list[tuple[int, int]] = []
+        for id, count in candidates:
+            bound = -(-(len(ngrams) - count) // self.size)
+            if bound > max_distance or (len(ranked) >= limit and bound > ranked[limit - 1][0]):
+                break
+            distance = fuzzy_distance(query, self.keys[id], max_distance)
+            if distance <= max_distance:
+                insort(ranked, (distance, id))
+        return [id for _, id in ranked[:limit]]
+
+    def estimate(self, predicate: Predicate) -> int | None:
+        """Число кандидатов не больше самого короткого списка id среди триграмм значения."""
+        if predicate.operator is Operator.RANGE or len(predicate.key) < self.size:
+            return None
+        return min(len(self.postings.get(ngram, ())) for ngram in self.get_ngrams(predicate.key))
+
+    def lookup(self, predicate: Predicate) -> list[int]:
+        return self.search(predicate.value) or []
+
+
+@dataclass
+class SortedIndex(Index):
+    """
+    Отсортированный индекс по целочисленному полю.
+
+    Поиск по значению, как и без индекса, ищет подстроку в записи числа, но не читает файл данных,
+    а `range` возвращает записи из диапазона двоичным поиском за O(log N + k).
+    """
+
+    field: str
+
+    def __post_init__(self) -> None:
+        self.entries: list[tuple[int, int]] = []
+        self.values: dict[int, int] = {}
+
+    def build(self, rows: dict[int, ModelDict]) -> None:
+        self.values = {id: int(row[self.field]) for id, row in rows.items()}
+        self.entries = sorted((value, id) for id, value in self.values.items())
+
+    def get_state(self) -> Any:
+        return self.entries
+
+    def set_state(self, state: Any) -> None:
+        self.entries = [(int(value), int(id)) for value, id in state]
+        self.values = {id: value for value, id in self.entries}
+
+    def add(self, id: int, row: ModelDict) -> None:
+        value = int(row[self.field])
+        self.values[id] = value
+        insort(self.entries, (value, id))
+
+    def remove(self, id: int, row: ModelDict) -> None:
+        value = self.values.pop(id, None)
+        if value is None:
+            return
+        position = bisect_left(self.entries, (value, id))
+        if position < len(self.entries) and self.entries[position] == (value, id):
+            del self.entries[position]
+
+    def search(self, value: str) -> list[int] | None:
+        value = normalize(value)
+        return sorted(id for id, field_value in self.values.items() if value in str(field_value))
+
+    def range(self, start: float, end: float) -> list[int]:
+        """Возвращает id записей со значением поля в диапазоне [start, end], упорядоченные по значению."""
+        left, right = self.get_bounds(start, end)
+        return [id for _, id in self.entries[left:right]]
+
+    def get_bounds(self, start: float, end: float) -> tuple[int, int]:
+        return bisect_left(self.entries, (start, -1)), bisect_right(self.entries, (end, float('inf')))
+
+    def get_predicate_range(self, predicate: Predicate) -> tuple[float, float] | None:
+        """Переводит условие в диапазон значений поля или возвращает None, если условие не числовое."""
+        if predicate.operator is Operator.RANGE:
+            return (
+                float('-inf') if predicate.start is None else predicate.start,
+                float('inf') if predicate.end is None else predicate.end,
+            )
+        if predicate.operator is Operator.EQ:
+            try:
+                value = int(predicate.value)
+            except ValueError:
+                return None
+            return value, value
+        return None
+
+    def estimate(self, predicate: Predicate) -> int | None:
+        bounds = self.get_predicate_range(predicate)
+        if bounds is None:
+            return None
+        left, right = self.get_bounds(*bounds)
+        return right - left
+
+    def lookup(self, predicate: Predicate) -> list[int]:
+        bounds = self.get_predicate_range(predicate)
+        return [] if bounds is None else self.range(*bounds)
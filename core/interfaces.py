@@ -1,9 +1,16 @@
+import heapq
+import json
 import sys
 from abc import ABC, abstractmethod
-from typing import Any, Sequence
+from functools import cached_property
+from itertools import islice
+from operator import itemgetter
+from typing import IO, Any, AsyncIterator, Iterable, Iterator, Mapping, Self, Sequence
 
 from core.constants import GOOD_BAY
-from core.data_types import Model, TextFormat
+from core.data_types import Model, ModelDict, TextFormat
+from core.query import Predicate
+from core.text import fuzzy_distance, get_max_distance, normalize
 
 
 class BaseService(ABC):
@@ -48,23 +55,60 @@ class BaseService(ABC):
 
 
 class ConsoleService(BaseService):
-    """Сервис для работы с выводом данных в консоль."""
+    """
+    Сервис для работы с выводом данных в консоль.
+
+    Выводимые строки копятся в буфере и печатаются одним вызовом перед запросом ввода
+    или при вызове `flush`. Если stdout не терминал, цвета не выводятся.
+    """
+
+    PREFIXES = {
+        (text_format, bold): f'{TextFormat.BOLD.value if bold else ''}{text_format.value}'
+        for text_format in TextFormat
+        for bold in (True, False)
+    }
+
+    @cached_property
+    def use_colors(self) -> bool:
+        return sys.stdout.isatty()
+
+    @cached_property
+    def buffer(self) -> list[str]:
+        return []
 
     def _get_fmt_text(self, data: str, text_format: TextFormat, bold: bool):
-        return f'{TextFormat.BOLD.value if bold else ''}{text_format.value}{data}{TextFormat.RESET.value}'
+        if not self.use_colors:
+            return data
+        return f'{self.PREFIXES[text_format, bold]}{data}{TextFormat.RESET.value}'
 
     def write(self, data: str, text_format: TextFormat = TextFormat.RESET, bold: bool = True) -> None:
         """Выводит данные в консоль с указанным цветом."""
-        text = self._get_fmt_text(data, text_format, bold)
-        print(text)
+        self.buffer.append(self._get_fmt_text(data, text_format, bold))
+
+    def write_many(self, lines: Iterable[str], text_format: TextFormat = TextFormat.RESET, bold: bool = True) -> None:
+        """Выводит несколько строк одним цветом."""
+        if not self.use_colors:
+            self.buffer.extend(lines)
+            return
+        prefix, reset = self.PREFIXES[text_format, bold], TextFormat.RESET.value
+        self.buffer.extend(f'{prefix}{line}{reset}' for line in lines)
+
+    def flush(self) -> None:
+        """Печатает накопленный вывод."""
+        if self.buffer:
+            sys.stdout.write('\n'.join(self.buffer) + '\n')
+            self.buffer.clear()
+        sys.stdout.flush()
 
     def input(self, data: str, text_format: TextFormat = TextFormat.RESET, bold: bool = True) -> str:
         """Выводит данные в консоль с указанным цветом."""
         try:
+            self.flush()
             text = self._get_fmt_text(data, text_format, bold)
             return input(text).strip()
         except KeyboardInterrupt:
             self.write(GOOD_BAY, TextFormat.GREEN)
+            self.flush()
             sys.exit(0)
 
 
@@ -74,6 +118,26 @@ class DataManager(ABC):
     Каждая реализация должна предоставить конкретные методы для работы с данными.
     """
 
+    fieldnames: list[str]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Сохраняет служебные данные и освобождает ресурсы источника данных."""
+
+    def _check_field(self, name: str) -> None:
+        if name not in self.fieldnames:
+            raise ValueError('Поля %s нет в файле.' % name)
+
+    def _check_page(self, offset: int, limit: int | None) -> None:
+        """Проверяет параметры страницы, чтобы все пути поиска одинаково отвергали отрицательные значения."""
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError('`offset` и `limit` не могут быть отрицательными.')
+
     @abstractmethod
     def create(self, data: Model | Sequence[Model]) -> Any:  # type: ignore
         """Создает новую запись или записи в источнике данных."""
@@ -84,6 +148,11 @@ class DataManager(ABC):
         """Читает и возвращает список записей из источника данных."""
         return NotImplemented
 
+    @abstractmethod
+    def iter_list(self, offset: int = 0, limit: int | None = None) -> Iterator[Any]:
+        """Лениво отдает записи, начиная с `offset`, не более `limit` штук."""
+        return NotImplemented
+
     @abstractmethod
     def read_detail(self, id: int) -> Any:
         """Читает и возвращает одну запись из источника данных."""
@@ -103,3 +172,194 @@ class DataManager(ABC):
     def search(self, field: str, value: str) -> Any:
         """Ищет объекты по определенному полю."""
         return NotImplemented
+
+    @abstractmethod
+    def iter_search(self, field: str, value: str, offset: int = 0, limit: int | None = None) -> Iterator[Any]:
+        """Лениво отдает страницу результатов поиска по определенному полю."""
+        return NotImplemented
+
+    @abstractmethod
+    def search_range(self, field: str, start: int, end: int) -> Any:
+        """Ищет объекты, у которых значение числового поля лежит в диапазоне [start, end]."""
+        return NotImplemented
+
+    def read_many(self, ids: Sequence[int]) -> list[Any]:
+        """Возвращает объекты с указанными id; если какого-то id нет, вызывает IDErorr."""
+        return [self.read_detail(id) for id in dict.fromkeys(ids)]
+
+    def udate_many(self, data: Mapping[int, Model]) -> list[Any]:
+        """
+        Обновляет несколько объектов: ключи `data` - id, значения - новые версии объектов.
+
+        Реализация по умолчанию обновляет объекты по одному; файловые хранилища проверяют,
+        что все id существуют, и записывают изменения за один проход.
+        """
+        return [self.udate(id, model) for id, model in data.items()]
+
+    def delete_many(self, ids: Sequence[int]) -> list[Any]:
+        """Удаляет несколько объектов. Реализация по умолчанию удаляет их по одному."""
+        return [self.delete(id) for id in dict.fromkeys(ids)]
+
+    def fuzzy_search(self, field: str, value: str, limit: int = 10) -> list[Any]:
+        """
+        Ищет с учетом опечаток: до `limit` объектов, поле которых ближе всего к `value` по расстоянию редактирования.
+
+        Реализация по умолчанию сравнивает запрос со всеми записями; хранилища с индексом по полю
+        сначала отбирают кандидатов по индексу. При `limit <= 0` возвращается пустой список.
+        """
+        self._check_field(field)
+        if limit <= 0:
+            return []
+        query = normalize(value)
+        max_distance = get_max_distance(query)
+        ranked = []
+        for obj in self.iter_list():
+            distance = fuzzy_distance(query, normalize(obj[field]), max_distance)
+            if distance <= max_distance:
+                ranked.append((distance, obj))
+        return [obj for _, obj in heapq.nsmallest(limit, ranked, key=itemgetter(0))]
+
+    def query(self, predicates: Sequence[Predicate], offset: int = 0, limit: int | None = None) -> Iterator[Any]:
+        """
+        Лениво отдает страницу объектов, подходящих под все условия `predicates`.
+
+        Реализация по умолчанию проверяет условия за один проход по всем записям;
+        хранилища с индексами сначала сужают выборку по самому избирательному индексу.
+        """
+        for predicate in predicates:
+            self._check_field(predicate.field)
+        stop = None if limit is None else offset + limit
+        rows = (obj for obj in self.iter_list() if all(predicate.matches(obj) for predicate in predicates))
+        return islice(rows, offset, stop)
+
+
+class AsyncDataManager(ABC):
+    """
+    Асинхронный вариант интерфейса `DataManager` с тем же набором CRUD-операций и поиска.
+
+    Позволяет одному процессу обслуживать много клиентов: пока одна операция ждет диска,
+    цикл событий продолжает обрабатывать остальные.
+    """
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Сохраняет служебные данные и освобождает ресурсы источника данных."""
+
+    @abstractmethod
+    async def create(self, data: Model | Sequence[Model]) -> Any:
+        """Создает новую запись или записи в источнике данных."""
+
+    @abstractmethod
+    async def read_list(self) -> Any:
+        """Читает и возвращает список записей из источника данных."""
+
+    @abstractmethod
+    def iter_list(self, offset: int = 0, limit: int | None = None) -> AsyncIterator[Any]:
+        """Лениво отдает записи, начиная с `offset`, не более `limit` штук."""
+
+    @abstractmethod
+    async def read_detail(self, id: int) -> Any:
+        """Читает и возвращает одну запись из источника данных."""
+
+    @abstractmethod
+    async def udate(self, id: int, data: Model) -> Any:
+        """Обновляет существующую запись в источнике данных."""
+
+    @abstractmethod
+    async def delete(self, id: int) -> Any:
+        """Удаляет запись из источника данных."""
+
+    @abstractmethod
+    async def search(self, field: str, value: str) -> Any:
+        """Ищет объекты по определенному полю."""
+
+    @abstractmethod
+    def iter_search(self, field: str, value: str, offset: int = 0, limit: int | None = None) -> AsyncIterator[Any]:
+        """Лениво отдает страницу результатов поиска по определенному полю."""
+
+    @abstractmethod
+    async def search_range(self, field: str, start: int, end: int) -> Any:
+        """Ищет объекты, у которых значение числового поля лежит в диапазоне [start, end]."""
+
+
+class Index(ABC):
+    """
+    Определяет интерфейс вторичного индекса по одному полю записей.
+
+    Индекс сужает поиск до набора кандидатов и сам проверяет, подходит ли запись под запрос.
+    Состояние индекса сохраняется в JSON-файл вместе с отпечатком файла данных, по которому он построен.
+    """
+
+    field: str
+
+    # Версия формата состояния: индексы, сохраненные в другой версии, перестраиваются.
+    VERSION = 1
+
+    @property
+    def name(self) -> str:
+        """Имя индекса, используемое в пути файла индекса."""
+        return f'{type(self).__name__.lower()}-{self.field}'
+
+    @abstractmethod
+    def build(self, rows: dict[int, ModelDict]) -> None:
+        """Строит индекс по всем записям."""
+
+    @abstractmethod
+    def add(self, id: int, row: ModelDict) -> None:
+        """Добавляет запись в индекс."""
+
+    @abstractmethod
+    def remove(self, id: int, row: ModelDict) -> None:
+        """Удаляет запись из индекса."""
+
+    @abstractmethod
+    def get_state(self) -> Any:
+        """Возвращает состояние индекса в виде, который можно сохранить в JSON."""
+
+    @abstractmethod
+    def set_state(self, state: Any) -> None:
+        """Восстанавливает индекс из состояния, полученного `get_state`."""
+
+    @abstractmethod
+    def search(self, value: str) -> list[int] | None:
+        """Возвращает id подходящих записей или None, если индекс не может обработать запрос."""
+        return NotImplemented
+
+    def estimate(self, predicate: Predicate) -> int | None:
+        """Оценивает сверху число кандидатов для условия или возвращает None, если индекс его не поддерживает."""
+        return None
+
+    def lookup(self, predicate: Predicate) -> list[int]:
+        """
+        Возвращает id кандидатов для условия, которое индекс поддерживает (см. `estimate`).
+
+        По умолчанию индекс не поддерживает ни одного условия, поэтому кандидатов нет.
+        """
+        return []
+
+    def save(self, file: IO, stamp: Any) -> None:
+        """Записывает в файл состояние индекса вместе с отпечатком файла данных."""
+        data = {'version': self.VERSION, 'field': self.field, 'stamp': stamp, 'state': self.get_state()}
+        json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+
+    def load(self, path: str, stamp: Any) -> bool:
+        """
+        Загружает состояние индекса, если оно построено по файлу с тем же отпечатком.
+
+        Отсутствующий, испорченный или сохраненный в другой версии файл считается устаревшим: возвращается False.
+        """
+        try:
+            with open(path, encoding='utf-8') as file:
+                data = json.load(file)
+            saved_stamp = None if data['stamp'] is None else tuple(data['stamp'])
+            if saved_stamp != stamp or data['version'] != self.VERSION or data['field'] != self.field:
+                return False
+            self.set_state(data['state'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return True
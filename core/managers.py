@@ -1,12 +1,57 @@
+import json
+import multiprocessing
 import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from csv import DictReader, DictWriter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from io import StringIO
+from itertools import islice
 from pathlib import Path
-from typing import Sequence
+from typing import IO, Container, Iterable, Iterator, Mapping, Sequence
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
 
 from core.data_types import Model, ModelDict
 from core.exceptions import IDErorr
-from core.interfaces import DataManager
+from core.indexes import SortedIndex, TrigramIndex
+from core.interfaces import DataManager, Index
+from core.query import Predicate
+from core.text import normalize
+
+PARALLEL_SEARCH_THRESHOLD = 32 * 2**20
+META_VERSION = 1
+
+# Изменение записи в транзакции: id, версия до транзакции и последняя версия (None - записи нет).
+Change = tuple[int, ModelDict | None, ModelDict | None]
+
+
+def create_search_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Создает пул процессов для параллельного поиска.
+
+    Процессы запускаются через `spawn`, поэтому не наследуют открытые файлы родителя,
+    в том числе файлы блокировок `fcntl.flock`.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+def search_chunk(
+    path: str | Path, encoding: str, fieldnames: list[str], start: int, end: int | None, field: str, value: str
+) -> list[ModelDict]:
+    """Ищет нормализованную подстроку `value` в поле `field` записей файла между байтами `start` и `end`."""
+    with open(path, mode='rb') as file:
+        file.seek(start)
+        data = file.read(-1 if end is None else end - start).decode(encoding)
+    reader = DictReader(StringIO(data, newline=''), fieldnames=fieldnames)
+    if start == 0:
+        next(reader, None)
+    return [row for row in reader if value in normalize(row[field])]
 
 
 @dataclass
@@ -14,17 +59,215 @@ class CSVDataManager(DataManager):
     path: str | Path
     fieldnames: list[str]
     id_field: str = 'id'
+    encoding: str = 'utf-8'
+    indexes: list[Index] = field(default_factory=list)
+    parallel_threshold: int | None = PARALLEL_SEARCH_THRESHOLD
+    search_workers: int | None = None
+
+    # Файл можно делить на диапазоны байт: каждая строка - актуальная запись.
+    PARALLEL_SEARCH = True
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Проверяем после создания эксземпляра класса, что файл существует и является CSV."""
         if not self._is_csv():
             raise ValueError(f'Файл {self.path} не является CSV файлом.')
         if not os.path.exists(self.path):
             os.makedirs(os.path.dirname(self.path), exist_ok=True)
-            with open(self.path, 'a'):
+            with open(self.path, 'a', encoding=self.encoding):
                 ...
+        self._mutex = threading.RLock()
+        self._lock_depth = 0
+        self._lock_exclusive = False
+        self._search_pool: ProcessPoolExecutor | None = None
         self.fields = [self.id_field] + self.fieldnames
-        self.max_id = self.get_max_id()
+        self.max_id = self.row_count = 0
+        self._meta_stamp: tuple[int, ...] | None = None
+        self._staged: dict[int, ModelDict] | None = None
+        self._changes: dict[int, tuple[ModelDict | None, ModelDict | None]] = {}
+        with self._lock():
+            if not self._load_meta():
+                self._scan()
+                self._save_meta()
+            self._max_id_stamp = self._get_stamp()
+            self._load_indexes()
+
+    @contextmanager
+    def _lock(self, exclusive: bool = False) -> Iterator[None]:
+        """
+        Блокирует файл данных для других процессов через `fcntl.flock` на файле `<path>.lock`.
+
+        Чтение берет разделяемую блокировку, запись - монопольную. При взятии монопольной блокировки
+        максимальный id перепроверяется, поэтому процессы не выдают одинаковые id. Потоки одного процесса
+        сериализуются через RLock, а вложенные вызовы используют уже взятую блокировку.
+        """
+        with self._mutex:
+            if self._lock_depth:
+                if exclusive and not self._lock_exclusive:
+                    raise RuntimeError('Нельзя повысить разделяемую блокировку до монопольной.')
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+            with open(self._get_sidecar_path('.lock'), mode='a') as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                self._lock_depth, self._lock_exclusive = 1, exclusive
+                try:
+                    if exclusive:
+                        self._refresh_max_id()
+                    yield
+                    if exclusive:
+                        self._save_meta()
+                finally:
+                    if exclusive:
+                        self._max_id_stamp = self._get_stamp()
+                    self._lock_depth, self._lock_exclusive = 0, False
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _atomic_write(self, path: str | Path, mode: str = 'w') -> Iterator[IO]:
+        """
+        Пишет во временный файл и подменяет им `path`.
+
+        Читатели не видят файл наполовину записанным, а сбой во время записи оставляет прежний файл целым:
+        временный файл и каталог сбрасываются на диск (`fsync`) до и после подмены.
+        """
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        encoding = None if 'b' in mode else self.encoding
+        try:
+            with open(temp_path, mode=mode, encoding=encoding) as file:
+                yield file
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, path)
+            directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Откладывает запись изменений до конца блока `with`.
+
+        Блок держит монопольную блокировку. Изменения применяются к копии записей в памяти, чтение внутри
+        блока идет из нее, а при выходе все изменения записываются за одну операцию. Если в блоке возникло
+        исключение, изменения отбрасываются. Вложенный блок становится частью внешнего.
+        """
+        with self._lock(exclusive=True):
+            if self._staged is not None:
+                yield
+                return
+            self._sync_indexes()
+            original = self._read()
+            counters = self.max_id, self.row_count
+            self._staged, self._changes = dict(original), {}
+            try:
+                yield
+                staged, self._staged = self._staged, None
+                changes = [(id, old, new) for id, (old, new) in self._changes.items() if old or new]
+                if changes:
+                    self._commit(staged, changes)
+                    if self.indexes:
+                        self._indexes_stamp = self._get_stamp()
+            except BaseException:
+                self._staged = None
+                self.max_id, self.row_count = counters
+                self._rollback(original)
+                raise
+            finally:
+                self._changes = {}
+
+    def _check_not_staged(self) -> None:
+        """Запрещает контрольную точку и уплотнение внутри транзакции: изменения еще не записаны в файл."""
+        if self._staged is not None:
+            raise RuntimeError('Операция недоступна внутри транзакции.')
+
+    def _stage(self, id: int, old: ModelDict | None, new: ModelDict | None) -> None:
+        """Применяет изменение к записям транзакции, запоминая версию записи до начала транзакции."""
+        assert self._staged is not None
+        if id in self._changes:
+            old = self._changes[id][0]
+        self._changes[id] = (old, new)
+        if new is None:
+            self._staged.pop(id, None)
+        else:
+            self._staged[id] = self._to_row(new)
+
+    def _commit(self, rows: dict[int, ModelDict], changes: list[Change]) -> None:
+        """Записывает изменения транзакции: новые записи дописываются в конец файла, иначе файл переписывается."""
+        if all(old is None for _, old, _ in changes):
+            self._append([new for _, _, new in changes if new is not None])
+        else:
+            self._write(rows)
+
+    def _rollback(self, rows: dict[int, ModelDict]) -> None:
+        """Возвращает индексы к состоянию до транзакции."""
+        for index in self.indexes:
+            index.build(rows)
+        self._indexes_stamp = self._get_stamp()
+
+    def _refresh_max_id(self) -> None:
+        """Перепроверяет максимальный id под блокировкой, если файл с тех пор менял другой процесс."""
+        if self._get_stamp() != self._max_id_stamp and not self._load_meta():
+            self._scan()
+
+    def _scan(self) -> None:
+        """Находит максимальный id и число записей, прочитав файл целиком."""
+        rows = self._read()
+        self.max_id = max(self.max_id, max(rows, default=0))
+        self.row_count = len(rows)
+
+    def _load_meta(self) -> bool:
+        """
+        Берет максимальный id и число записей из `<path>.meta`.
+
+        Метаданные используются, только если версия формата, поля и отпечаток файла данных совпадают
+        с текущими, иначе возвращается False и нужен полный проход по файлу.
+        """
+        try:
+            with open(self._get_sidecar_path('.meta'), encoding='utf-8') as file:
+                meta = json.load(file)
+            stamp = tuple(meta['stamp'])
+            if meta['version'] != META_VERSION or meta['fields'] != self.fields or stamp != self._get_stamp():
+                return False
+            self.max_id = max(self.max_id, meta['max_id'])
+            self.row_count = meta['row_count']
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        self._meta_stamp = stamp
+        return True
+
+    def _save_meta(self) -> None:
+        """
+        Сохраняет метаданные файла данных, если он изменился с прошлого сохранения.
+
+        Файл не сбрасывается на диск: после сбоя устаревшие или испорченные метаданные
+        не совпадут с отпечатком файла данных, и максимальный id будет найден полным проходом.
+        """
+        stamp = self._get_stamp()
+        if stamp is None or stamp == self._meta_stamp:
+            return
+        meta = {
+            'version': META_VERSION,
+            'fields': self.fields,
+            'max_id': self.max_id,
+            'row_count': self.row_count,
+            'stamp': stamp,
+        }
+        path = self._get_sidecar_path('.meta')
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, mode='w', encoding='utf-8') as file:
+            json.dump(meta, file)
+        os.replace(temp_path, path)
+        self._meta_stamp = stamp
 
     def get_max_id(self) -> int:
         """Получаем максимальный id из файла."""
@@ -41,12 +284,155 @@ class CSVDataManager(DataManager):
     def _read(self) -> dict[int, ModelDict]:
         """Получаем все объекты из файле."""
         data = {}
-        with open(self.path, mode='r') as file:
-            reader = DictReader(file, fieldnames=self.fields)
+        with self._lock():
+            if self._staged is not None:
+                return self._staged
+            with open(self.path, mode='r', encoding=self.encoding) as file:
+                reader = DictReader(file, fieldnames=self.fields)
+                next(reader, None)
+                for row in reader:
+                    data[int(row['id'])] = row
+                return data
+
+    def _iter_rows(self) -> Iterator[ModelDict]:
+        """
+        Построчно читает объекты из файла, не загружая его целиком.
+
+        Блокировка держится только пока файл открывается: файл переписывается подменой,
+        а дописанные позже строки отсекаются по размеру, поэтому чтение видит снимок файла.
+        """
+        with self._lock():
+            staged = None if self._staged is None else list(self._staged.values())
+            if staged is None:
+                file = open(self.path, mode='rb')
+                size = os.fstat(file.fileno()).st_size
+        if staged is not None:
+            yield from staged
+            return
+        with file:
+            reader = DictReader(self._iter_lines(file, size), fieldnames=self.fields)
             next(reader, None)
-            for row in reader:
-                data[int(row['id'])] = row
-            return data
+            yield from reader
+
+    def _iter_lines(self, file: IO[bytes], size: int) -> Iterator[str]:
+        for line in file:
+            if size <= 0:
+                return
+            size -= len(line)
+            yield line.decode(self.encoding)
+
+    def _export(self, row: ModelDict) -> ModelDict:
+        """Подготавливает прочитанную запись к выдаче наружу: записи транзакции отдаются копиями."""
+        return row if self._staged is None else row.copy()
+
+    def _to_row(self, model_data: ModelDict) -> ModelDict:
+        """Приводит значения к строкам, как если бы запись была прочитана из файла."""
+        return {key: str(value) for key, value in model_data.items()}
+
+    def _get_stamp(self) -> tuple[int, ...] | None:
+        """Возвращает отпечаток файла (inode, размер, mtime) для проверки изменений."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _get_sidecar_path(self, suffix: str) -> str:
+        """Возвращает путь служебного файла рядом с файлом данных."""
+        return f'{self.path}{suffix}'
+
+    def _get_index_path(self, index: Index) -> str:
+        return self._get_sidecar_path(f'.{index.name}.idx')
+
+    def _load_indexes(self) -> None:
+        """Загружает сохраненные индексы, а устаревшие или отсутствующие строит заново."""
+        self._indexes_stamp = self._get_stamp()
+        self._indexes_dirty = False
+        stale = [index for index in self.indexes if not index.load(self._get_index_path(index), self._indexes_stamp)]
+        if stale:
+            rows = self._read()
+            for index in stale:
+                index.build(rows)
+            self._indexes_dirty = True
+
+    def _sync_indexes(self) -> None:
+        """Перестраивает индексы, если файл данных изменили в обход этого менеджера."""
+        if not self.indexes or self._get_stamp() == self._indexes_stamp:
+            return
+        rows = self._read()
+        for index in self.indexes:
+            index.build(rows)
+        self._indexes_stamp = self._get_stamp()
+        self._indexes_dirty = True
+
+    def _update_indexes(self, id: int, old: ModelDict | None, new: ModelDict | None) -> None:
+        """Применяет изменение записи к индексам и счетчику записей после записи в файл."""
+        if self._staged is not None:
+            self._stage(id, old, new)
+        self.row_count += (new is not None) - (old is not None)
+        if not self.indexes:
+            return
+        for index in self.indexes:
+            if old is not None:
+                index.remove(id, old)
+            if new is not None:
+                index.add(id, new)
+        self._indexes_stamp = self._get_stamp()
+        self._indexes_dirty = True
+
+    def _get_index(self, field: str) -> Index | None:
+        return next((index for index in self.indexes if index.field == field), None)
+
+    def _read_many(self, ids: list[int]) -> list[ModelDict]:
+        """
+        Возвращает записи с указанными id.
+
+        Файл просматривается без разбора CSV: разбираются только записи с запрошенными id,
+        а просмотр заканчивается, как только найдены все.
+        """
+        if not ids:
+            return []
+        wanted = {str(id).encode() for id in ids}
+        found: dict[int, bytes] = {}
+        with self._lock():
+            if self._staged is not None:
+                return [self._export(self._staged[id]) for id in ids if id in self._staged]
+            with open(self.path, mode='rb') as file:
+                for record in self._iter_records(file):
+                    prefix = record[: record.find(b',')]
+                    if prefix in wanted:
+                        found[int(prefix)] = record
+                        if len(found) == len(wanted):
+                            break
+        rows = {int(row[self.id_field]): row for row in self._parse_records(found.values())}
+        return [rows[id] for id in ids if id in rows]
+
+    def _iter_records(self, file: IO[bytes]) -> Iterator[bytes]:
+        """Читает записи CSV как байты: запись продолжается на следующей строке, пока в ней нечетное число кавычек."""
+        record = b''
+        for line in file:
+            record += line
+            if record.count(b'"') % 2:
+                continue
+            yield record
+            record = b''
+
+    def _parse_records(self, records: Iterable[bytes]) -> list[ModelDict]:
+        """Разбирает записи, прочитанные из файла как байты. У последней строки файла может не быть перевода строки."""
+        lines = (record if record.endswith(b'\n') else record + b'\n' for record in records)
+        return list(DictReader(StringIO(b''.join(lines).decode(self.encoding), newline=''), fieldnames=self.fields))
+
+    def close(self) -> None:
+        """Сохраняет измененные индексы на диск и останавливает пул параллельного поиска."""
+        if self._search_pool is not None:
+            self._search_pool.shutdown()
+            self._search_pool = None
+        if not self._indexes_dirty:
+            return
+        for index in self.indexes:
+            with self._atomic_write(self._get_index_path(index)) as file:
+                index.save(file, self._indexes_stamp)
+        self._indexes_dirty = False
 
     def _is_csv(self) -> bool:
         """Проверяет, что файл имеет расширение .csv."""
@@ -59,58 +445,865 @@ class CSVDataManager(DataManager):
 
     def _write(self, data: ModelDict) -> None:
         """Перезаписывает файл с нуля."""
-        with open(self.path, mode='w') as file:
+        if self._staged is not None:
+            return
+        with self._atomic_write(self.path) as file:
             writer = DictWriter(file, fieldnames=self.fields)
             writer.writeheader()
             writer.writerows(list(data.values()))
 
+    def _append(self, rows: list[ModelDict]) -> None:
+        """Дописывает записи в конец файла."""
+        if self._staged is not None:
+            return
+        with open(self.path, mode='a', encoding=self.encoding) as file:
+            writer = DictWriter(f=file, fieldnames=self.fields)
+            if file.tell() == 0:
+                writer.writeheader()
+            writer.writerows(rows)
+
     def _get_model_dict(self, id: int, data: dict[int, ModelDict]) -> ModelDict:
         try:
             return data[id]
         except KeyError:
             raise IDErorr(message=f'ID {id} не существует.')
 
+    def _check_ids(self, ids: Iterable[int], existing: Container[int]) -> None:
+        """Проверяет, что все id существуют, до того как что-либо менять."""
+        missing = [str(id) for id in ids if id not in existing]
+        if missing:
+            raise IDErorr(message=f'ID {", ".join(missing)} не существует.')
+
+    def _get_changes(
+        self, data: Mapping[int, Model], objects: dict[int, ModelDict]
+    ) -> list[tuple[int, ModelDict, ModelDict]]:
+        """Возвращает для каждого изменения id, прежнюю и новую версии записи."""
+        self._check_ids(data, objects)
+        return [(id, objects[id], {self.id_field: id} | model.to_dict()) for id, model in data.items()]
+
     def create(self, data: Model | Sequence[Model]) -> ModelDict | list[ModelDict]:
-        with open(self.path, mode='a') as file:
-            writer = DictWriter(f=file, fieldnames=self.fields)
-            if file.tell() == 0:
-                writer.writeheader()
+        with self._lock(exclusive=True):
+            self._sync_indexes()
             write_data: ModelDict | list[ModelDict]
             if isinstance(data, Sequence):
                 write_data = [d.to_dict() | {self.id_field: self.get_id()} for d in data]
-                writer.writerows(write_data)
+                self._append(write_data)
             else:
                 write_data = data.to_dict() | {self.id_field: self.get_id()}
-                writer.writerow(write_data)
-            return write_data
+                self._append([write_data])
+            for model_data in write_data if isinstance(write_data, list) else [write_data]:
+                self._update_indexes(model_data[self.id_field], None, model_data)
+        return write_data
 
     def read_list(self) -> list[ModelDict]:
-        return list(self._read().values())
+        return list(map(self._export, self._read().values()))
 
     def read_detail(self, id: int) -> ModelDict:
-        return self._get_model_dict(id, self._read())
+        return self._export(self._get_model_dict(id, self._read()))
 
     def udate(self, id: int, data: Model) -> ModelDict:
-        objects = self._read()
-        model_data = {self.id_field: id} | data.to_dict()
-        self._get_model_dict(id, objects)
-        objects[id] = model_data
-        self._write(objects)
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            objects = self._read()
+            model_data = {self.id_field: id} | data.to_dict()
+            old = self._get_model_dict(id, objects)
+            objects[id] = model_data
+            self._write(objects)
+            self._update_indexes(id, old, model_data)
         return model_data
 
     def delete(self, id: int) -> ModelDict:
-        objects = self._read()
-        obj = self._get_model_dict(id, objects)
-        del objects[id]
-        self._write(objects)
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            objects = self._read()
+            obj = self._get_model_dict(id, objects)
+            del objects[id]
+            self._write(objects)
+            self._update_indexes(id, obj, None)
         return obj
 
+    def read_many(self, ids: Sequence[int]) -> list[ModelDict]:
+        objects = self._read_many(list(dict.fromkeys(ids)))
+        self._check_ids(ids, {int(obj[self.id_field]) for obj in objects})
+        return objects
+
+    def udate_many(self, data: Mapping[int, Model]) -> list[ModelDict]:
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            objects = self._read()
+            changes = self._get_changes(data, objects)
+            for id, _, model_data in changes:
+                objects[id] = self._to_row(model_data)
+            self._write(objects)
+            for id, old, model_data in changes:
+                self._update_indexes(id, old, model_data)
+        return [model_data for _, _, model_data in changes]
+
+    def delete_many(self, ids: Sequence[int]) -> list[ModelDict]:
+        ids = list(dict.fromkeys(ids))
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            objects = self._read()
+            self._check_ids(ids, objects)
+            deleted = [objects.pop(id) for id in ids]
+            self._write(objects)
+            for id, obj in zip(ids, deleted):
+                self._update_indexes(id, obj, None)
+        return deleted
+
+    def iter_list(self, offset: int = 0, limit: int | None = None) -> Iterator[ModelDict]:
+        stop = None if limit is None else offset + limit
+        return map(self._export, islice(self._iter_rows(), offset, stop))
+
     def search(self, field: str, value: str) -> list[ModelDict]:
+        return list(self.iter_search(field, value))
+
+    def _use_parallel_search(self, field: str) -> bool:
+        """Параллельный поиск включается для неиндексированных полей, если файл не меньше `parallel_threshold`."""
+        return (
+            self.PARALLEL_SEARCH
+            and self._staged is None
+            and self.parallel_threshold is not None
+            and field in self.fieldnames
+            and self._get_index(field) is None
+            and os.path.getsize(self.path) >= self.parallel_threshold
+        )
+
+    def _get_search_workers(self) -> int:
+        return self.search_workers or os.cpu_count() or 1
+
+    def _split_ranges(self, count: int) -> list[tuple[int, int]]:
+        """
+        Делит файл на `count` диапазонов байт по границам записей.
+
+        Граница ставится на первый перевод строки после нужного смещения, перед которым четное число кавычек,
+        то есть не внутри значения в кавычках. Для этого файл один раз просматривается блоками.
+        """
+        size = os.path.getsize(self.path)
+        targets = [size * i // count for i in range(1, count)]
+        bounds = [0]
+        offset = quotes = 0
+        with open(self.path, mode='rb') as file:
+            while targets and (block := file.read(2**20)):
+                while targets and offset + len(block) > targets[0]:
+                    newline = block.find(b'\n', max(targets[0] - offset, 0))
+                    while newline != -1 and (quotes + block.count(b'"', 0, newline)) % 2:
+                        newline = block.find(b'\n', newline + 1)
+                    if newline == -1:
+                        break
+                    bounds.append(offset + newline + 1)
+                    targets = [target for target in targets if target >= bounds[-1]]
+                quotes += block.count(b'"')
+                offset += len(block)
+        bounds.append(size)
+        return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+    def _search_parallel(self, field: str, value: str) -> list[ModelDict]:
+        """
+        Ищет по диапазонам файла в пуле процессов.
+
+        Результаты склеиваются в порядке диапазонов, то есть в порядке файла и по возрастанию id.
+        Разделяемая блокировка держится до конца поиска, чтобы все процессы читали одну версию файла.
+        """
+        workers = self._get_search_workers()
+        with self._mutex:
+            if self._search_pool is None:
+                self._search_pool = create_search_pool(workers)
+            pool = self._search_pool
+        with self._lock():
+            futures = [
+                pool.submit(search_chunk, self.path, self.encoding, self.fields, start, end, field, normalize(value))
+                for start, end in self._split_ranges(workers)
+            ]
+            return [self._export(row) for future in futures for row in future.result()]
+
+    def iter_search(self, field: str, value: str, offset: int = 0, limit: int | None = None) -> Iterator[ModelDict]:
+        """
+        Лениво отдает страницу результатов поиска.
+
+        Все результаты сразу (без `offset` и `limit`) ищутся в пуле процессов, если файл достаточно велик
+        (см. `_use_parallel_search`). Страницы ищутся одним проходом, который заканчивается, как только
+        страница набрана.
+        """
+        if field not in self.fieldnames:
+            raise ValueError('Поля %s нет в файле.' % field)
+        self._check_page(offset, limit)
+        if not offset and limit is None and self._use_parallel_search(field):
+            return iter(self._search_parallel(field, value))
+        stop = None if limit is None else offset + limit
+        index = self._get_index(field)
+        if index is not None:
+            self._sync_indexes()
+            ids = index.search(value)
+            if ids is not None:
+                return iter(self._read_many(ids[offset:stop]))
+        value = normalize(value)
+        rows = (row for row in self._iter_rows() if value in normalize(row[field]))
+        return map(self._export, islice(rows, offset, stop))
+
+    def search_range(self, field: str, start: int, end: int) -> list[ModelDict]:
         if field not in self.fieldnames:
             raise ValueError('Поля %s нет в файле.' % field)
-        objects = self.read_list()
-        data = []
-        for obj in objects:
-            if value.lower() in obj[field].lower():
-                data.append(obj)
+        index = self._get_index(field)
+        if isinstance(index, SortedIndex):
+            self._sync_indexes()
+            return self._read_many(index.range(start, end))
+        objects = [obj for obj in self.read_list() if start <= int(obj[field]) <= end]
+        return sorted(objects, key=lambda obj: int(obj[field]))
+
+    def fuzzy_search(self, field: str, value: str, limit: int = 10) -> list[ModelDict]:
+        if field not in self.fieldnames:
+            raise ValueError('Поля %s нет в файле.' % field)
+        index = self._get_index(field)
+        if isinstance(index, TrigramIndex):
+            self._sync_indexes()
+            return self._read_many(index.fuzzy_search(value, limit))
+        return super().fuzzy_search(field, value, limit)
+
+    def _plan(self, predicates: Sequence[Predicate]) -> tuple[Index, Predicate] | None:
+        """
+        Выбирает индекс для составного запроса.
+
+        Из условий, которые поддерживает какой-либо индекс, берется то, у которого оценка числа
+        кандидатов меньше всего. Если ни одно условие индексы не поддерживают, возвращается None
+        и запрос выполняется одним проходом по файлу.
+        """
+        best: tuple[int, Index, Predicate] | None = None
+        for predicate in predicates:
+            index = self._get_index(predicate.field)
+            estimate = None if index is None else index.estimate(predicate)
+            if index is not None and estimate is not None and (best is None or estimate < best[0]):
+                best = estimate, index, predicate
+        return None if best is None else best[1:]
+
+    def query(self, predicates: Sequence[Predicate], offset: int = 0, limit: int | None = None) -> Iterator[ModelDict]:
+        for predicate in predicates:
+            if predicate.field not in self.fieldnames:
+                raise ValueError('Поля %s нет в файле.' % predicate.field)
+        self._check_page(offset, limit)
+        stop = None if limit is None else offset + limit
+        self._sync_indexes()
+        plan = self._plan(predicates)
+        if plan is None:
+            rows = (row for row in self._iter_rows() if all(predicate.matches(row) for predicate in predicates))
+            return map(self._export, islice(rows, offset, stop))
+        index, predicate = plan
+        objects = self._read_many(sorted(index.lookup(predicate)))
+        return islice((obj for obj in objects if all(predicate.matches(obj) for predicate in predicates)), offset, stop)
+
+
+@dataclass
+class CachedCSVDataManager(CSVDataManager):
+    """
+    CSV-менеджер, который держит разобранные записи в памяти.
+
+    Изменения применяются к кэшу напрямую. Файл перечитывается целиком только тогда,
+    когда его отпечаток (inode, размер, mtime) показывает, что файл изменил другой процесс.
+    """
+
+    # Поиск идет по кэшу в памяти, передавать его в другие процессы дороже, чем искать на месте.
+    PARALLEL_SEARCH = False
+
+    def __post_init__(self) -> None:
+        self._cache: dict[int, ModelDict] = {}
+        self._stamp: tuple[int, ...] | None = None
+        self.max_id = 0
+        super().__post_init__()
+
+    def _load(self) -> dict[int, ModelDict]:
+        """Читает записи с диска для кэша."""
+        return super()._read()
+
+    def _read(self) -> dict[int, ModelDict]:
+        """Возвращает кэш, перечитывая файл, если он был изменен извне."""
+        with self._lock():
+            if self._staged is not None:
+                return self._staged
+            stamp = self._get_stamp()
+            if stamp != self._stamp:
+                self._cache = self._load()
+                self._stamp = stamp
+                self.max_id = max(self.max_id, max(self._cache, default=0))
+        return self._cache
+
+    def _write(self, data: ModelDict) -> None:
+        if self._staged is not None:
+            return
+        super()._write(data)
+        self._cache = data
+        self._stamp = self._get_stamp()
+
+    def _commit(self, rows: dict[int, ModelDict], changes: list[Change]) -> None:
+        super()._commit(rows, changes)
+        self._cache = rows
+        self._stamp = self._get_stamp()
+
+    def create(self, data: Model | Sequence[Model]) -> ModelDict | list[ModelDict]:
+        with self._lock(exclusive=True):
+            objects = self._read()
+            write_data = super().create(data)
+            for model_data in write_data if isinstance(write_data, list) else [write_data]:
+                objects[model_data[self.id_field]] = self._to_row(model_data)
+            self._stamp = self._get_stamp()
+        return write_data
+
+    def read_list(self) -> list[ModelDict]:
+        with self._lock():
+            return [obj.copy() for obj in self._read().values()]
+
+    def read_detail(self, id: int) -> ModelDict:
+        return self._get_model_dict(id, self._read()).copy()
+
+    def udate(self, id: int, data: Model) -> ModelDict:
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            objects = self._read()
+            model_data = {self.id_field: id} | data.to_dict()
+            old = self._get_model_dict(id, objects)
+            objects[id] = self._to_row(model_data)
+            self._write(objects)
+            self._update_indexes(id, old, model_data)
+        return model_data
+
+    def _iter_rows(self) -> Iterator[ModelDict]:
+        """Отдает снимок кэша: изменения из других потоков во время обхода его не затрагивают."""
+        with self._lock():
+            return iter(list(self._read().values()))
+
+    def _read_many(self, ids: list[int]) -> list[ModelDict]:
+        objects = self._read()
+        return [self._export(objects[id]) for id in ids if id in objects]
+
+    def _export(self, row: ModelDict) -> ModelDict:
+        return row.copy()
+
+
+@dataclass
+class JournaledCSVDataManager(CachedCSVDataManager):
+    """
+    CSV-менеджер с журналом предзаписи (write-ahead log).
+
+    Изменения не переписывают файл данных, а дописываются в журнал `<path>.journal`
+    по JSON-строке на операцию и применяются к кэшу. Журнал сбрасывается на диск (`fsync`)
+    группами: раз в `group_size` записей, а также при `sync` и закрытии. Записи неполной группы
+    сбрасывает таймер не позже чем через `group_interval` секунд после предыдущего сброса.
+    Когда в журнале набирается `checkpoint_records` записей, выполняется контрольная точка: файл данных
+    атомарно переписывается из кэша, а журнал очищается. При открытии журнал, оставшийся после сбоя,
+    применяется к файлу данных; оборванная последняя строка пропускается.
+    """
+
+    group_size: int = 64
+    group_interval: float = 1.0
+    checkpoint_records: int = 10_000
+
+    def __post_init__(self) -> None:
+        self.journal_path = self._get_sidecar_path('.journal')
+        self._journal_records = 0
+        self._pending = 0
+        self._synced_at = time.monotonic()
+        self._sync_timer: threading.Timer | None = None
+        super().__post_init__()
+        self._journal = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        with self._lock(exclusive=True):
+            if os.path.getsize(self.journal_path):
+                self.checkpoint()
+
+    def _get_stamp(self) -> tuple[int, ...] | None:
+        """Отпечаток файла данных вместе с отпечатком журнала."""
+        stamp = super()._get_stamp() or ()
+        try:
+            journal = os.stat(self.journal_path)
+        except FileNotFoundError:
+            return stamp
+        return stamp + (journal.st_ino, journal.st_size, journal.st_mtime_ns)
+
+    def _load(self) -> dict[int, ModelDict]:
+        """
+        Читает файл данных и применяет к нему журнал.
+
+        Пропускается только оборванная последняя строка журнала: испорченная строка,
+        за которой следуют другие записи, означает повреждение журнала, и вызывается ValueError.
+        """
+        data = super()._load()
+        self._journal_records = 0
+        try:
+            file = open(self.journal_path, mode='r', encoding=self.encoding)
+        except FileNotFoundError:
+            return data
+        with file:
+            broken = None
+            for number, line in enumerate(file, start=1):
+                if broken is not None:
+                    raise ValueError(f'Журнал {self.journal_path} поврежден в строке {broken}.')
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    broken = number
+                    continue
+                self._journal_records += 1
+                if record['op'] == 'put':
+                    data[int(record['row'][self.id_field])] = self._to_row(record['row'])
+                else:
+                    data.pop(int(record[self.id_field]), None)
+        return data
+
+    def _append_journal(self, records: list[dict]) -> None:
+        """Дописывает записи в журнал и сбрасывает его на диск, если набралась группа."""
+        if self._staged is not None:
+            return
+        os.write(self._journal, ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records).encode())
+        self._journal_records += len(records)
+        self._pending += len(records)
+        if self._pending >= self.group_size or time.monotonic() - self._synced_at >= self.group_interval:
+            self.sync()
+        else:
+            self._schedule_sync()
+        self._stamp = self._get_stamp()
+
+    def _schedule_sync(self) -> None:
+        """Запускает таймер, который сбросит журнал на диск, если он еще не запущен."""
+        if self._sync_timer is not None:
+            return
+        delay = max(self.group_interval - (time.monotonic() - self._synced_at), 0)
+        self._sync_timer = threading.Timer(delay, self._sync_by_timer)
+        self._sync_timer.daemon = True
+        self._sync_timer.start()
+
+    def _sync_by_timer(self) -> None:
+        with self._mutex:
+            self._sync_timer = None
+            if self._journal >= 0:
+                self.sync()
+
+    def _commit(self, rows: dict[int, ModelDict], changes: list[Change]) -> None:
+        """Дописывает изменения транзакции в журнал одной записью."""
+        self._cache = rows
+        self._append_journal(
+            [{'op': 'put', 'row': new} if new else {'op': 'delete', self.id_field: id} for id, _, new in changes]
+        )
+        self._maybe_checkpoint()
+
+    def _maybe_checkpoint(self) -> None:
+        if self._staged is None and self._journal_records >= self.checkpoint_records:
+            self.checkpoint()
+
+    def sync(self) -> None:
+        """Сбрасывает журнал на диск."""
+        if self._pending:
+            os.fsync(self._journal)
+            self._pending = 0
+        self._synced_at = time.monotonic()
+
+    def checkpoint(self) -> None:
+        """Переписывает файл данных из кэша и очищает журнал. Внутри транзакции вызывает RuntimeError."""
+        with self._lock(exclusive=True):
+            self._check_not_staged()
+            self._sync_indexes()
+            self._write(self._read())
+            os.ftruncate(self._journal, 0)
+            os.fsync(self._journal)
+            self._journal_records = self._pending = 0
+            self._stamp = self._indexes_stamp = self._get_stamp()
+
+    def close(self) -> None:
+        if self._journal < 0:
+            return
+        with self._lock(exclusive=True):
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            self.sync()
+        os.close(self._journal)
+        self._journal = -1
+        super().close()
+
+    def create(self, data: Model | Sequence[Model]) -> ModelDict | list[ModelDict]:
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            objects = self._read()
+            models = data if isinstance(data, Sequence) else [data]
+            write_data = [model.to_dict() | {self.id_field: self.get_id()} for model in models]
+            for model_data in write_data:
+                objects[model_data[self.id_field]] = self._to_row(model_data)
+            self._append_journal([{'op': 'put', 'row': model_data} for model_data in write_data])
+            for model_data in write_data:
+                self._update_indexes(model_data[self.id_field], None, model_data)
+            self._maybe_checkpoint()
+        return write_data if isinstance(data, Sequence) else write_data[0]
+
+    def udate(self, id: int, data: Model) -> ModelDict:
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            objects = self._read()
+            model_data = {self.id_field: id} | data.to_dict()
+            old = self._get_model_dict(id, objects)
+            objects[id] = self._to_row(model_data)
+            self._append_journal([{'op': 'put', 'row': model_data}])
+            self._update_indexes(id, old, model_data)
+            self._maybe_checkpoint()
+        return model_data
+
+    def delete(self, id: int) -> ModelDict:
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            objects = self._read()
+            obj = self._get_model_dict(id, objects)
+            del objects[id]
+            self._append_journal([{'op': 'delete', self.id_field: id}])
+            self._update_indexes(id, obj, None)
+            self._maybe_checkpoint()
+        return obj.copy()
+
+    def udate_many(self, data: Mapping[int, Model]) -> list[ModelDict]:
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            objects = self._read()
+            changes = self._get_changes(data, objects)
+            for id, _, model_data in changes:
+                objects[id] = self._to_row(model_data)
+            self._append_journal([{'op': 'put', 'row': model_data} for _, _, model_data in changes])
+            for id, old, model_data in changes:
+                self._update_indexes(id, old, model_data)
+            self._maybe_checkpoint()
+        return [model_data for _, _, model_data in changes]
+
+    def delete_many(self, ids: Sequence[int]) -> list[ModelDict]:
+        ids = list(dict.fromkeys(ids))
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            objects = self._read()
+            self._check_ids(ids, objects)
+            deleted = [objects.pop(id) for id in ids]
+            self._append_journal([{'op': 'delete', self.id_field: id} for id in ids])
+            for id, obj in zip(ids, deleted):
+                self._update_indexes(id, obj, None)
+            self._maybe_checkpoint()
+        return [obj.copy() for obj in deleted]
+
+
+@dataclass
+class LogCSVDataManager(CSVDataManager):
+    """
+    CSV-менеджер с журнальной (append-only) записью.
+
+    Обновления дописываются в конец файла новой версией записи, удаления - записью-надгробием.
+    При чтении для каждого id берется последняя версия. Файл переписывается (уплотняется)
+    только тогда, когда доля устаревших записей превышает `compaction_threshold`.
+    """
+
+    compaction_threshold: float = 0.5
+    background_compaction: bool = False
+    deleted_field: str = 'deleted'
+
+    # Строка журнала может быть устаревшей версией записи, поэтому файл нельзя искать по частям.
+    PARALLEL_SEARCH = False
+
+    def __post_init__(self) -> None:
+        self._records = 0
+        self._live = 0
+        self._compaction: threading.Thread | None = None
+        self._compaction_pending = False
+        super().__post_init__()
+
+    @property
+    def log_fields(self) -> list[str]:
+        return self.fields + [self.deleted_field]
+
+    @property
+    def dead_ratio(self) -> float:
+        """Доля устаревших версий и надгробий среди всех записей файла."""
+        if not self._records:
+            return 0.0
+        return (self._records - self._live) / self._records
+
+    def _read(self) -> dict[int, ModelDict]:
+        """Собирает последние версии записей, пропуская удаленные."""
+        data: dict[int, ModelDict] = {}
+        records = 0
+        with self._lock():
+            if self._staged is not None:
+                return self._staged
+            with open(self.path, mode='r', encoding=self.encoding) as file:
+                reader = DictReader(file, fieldnames=self.log_fields)
+                next(reader, None)
+                for row in reader:
+                    records += 1
+                    id = int(row[self.id_field])
+                    if row.pop(self.deleted_field):
+                        data.pop(id, None)
+                    else:
+                        data[id] = row
+        self._records = records
+        self._live = len(data)
         return data
+
+    def _iter_rows(self) -> Iterator[ModelDict]:
+        """Последние версии записей можно получить только прочитав весь журнал."""
+        return iter(self._read().values())
+
+    def _read_many(self, ids: list[int]) -> list[ModelDict]:
+        objects = self._read()
+        return [self._export(objects[id]) for id in ids if id in objects]
+
+    def _write(self, data: ModelDict) -> None:
+        if self._staged is not None:
+            return
+        with self._atomic_write(self.path) as file:
+            writer = DictWriter(file, fieldnames=self.log_fields)
+            writer.writeheader()
+            writer.writerows(list(data.values()))
+        self._records = self._live = len(data)
+
+    def _append(self, rows: list[ModelDict]) -> None:
+        """Дописывает записи в конец файла."""
+        if self._staged is not None:
+            return
+        with open(self.path, mode='a', encoding=self.encoding) as file:
+            writer = DictWriter(file, fieldnames=self.log_fields)
+            if file.tell() == 0:
+                writer.writeheader()
+            writer.writerows(rows)
+        self._records += len(rows)
+
+    def compact(self) -> None:
+        """Переписывает файл, оставляя только последние версии живых записей. Внутри транзакции - RuntimeError."""
+        with self._lock(exclusive=True):
+            self._check_not_staged()
+            self._sync_indexes()
+            self._write(self._read())
+            self._indexes_stamp = self._get_stamp()
+            self._compaction_pending = False
+
+    def _commit(self, rows: dict[int, ModelDict], changes: list[Change]) -> None:
+        """Дописывает новые версии и надгробия всех изменений транзакции одной записью."""
+        self._append([new or {self.id_field: id, self.deleted_field: 1} for id, _, new in changes])
+        self._maybe_compact()
+
+    def _rollback(self, rows: dict[int, ModelDict]) -> None:
+        super()._rollback(rows)
+        self._live = len(rows)
+
+    def _maybe_compact(self) -> None:
+        with self._mutex:
+            if self._staged is not None or self._compaction_pending or self.dead_ratio <= self.compaction_threshold:
+                return
+            if not self.background_compaction:
+                self.compact()
+                return
+            self._compaction_pending = True
+            self._compaction = threading.Thread(target=self.compact, daemon=True)
+            self._compaction.start()
+
+    def create(self, data: Model | Sequence[Model]) -> ModelDict | list[ModelDict]:
+        with self._lock(exclusive=True):
+            write_data = super().create(data)
+            self._live += len(write_data) if isinstance(write_data, list) else 1
+            return write_data
+
+    def udate(self, id: int, data: Model) -> ModelDict:
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            old = self._get_model_dict(id, self._read())
+            model_data = {self.id_field: id} | data.to_dict()
+            self._append([model_data])
+            self._update_indexes(id, old, model_data)
+        self._maybe_compact()
+        return model_data
+
+    def delete(self, id: int) -> ModelDict:
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            obj = self._get_model_dict(id, self._read())
+            self._append([{self.id_field: id, self.deleted_field: 1}])
+            self._live -= 1
+            self._update_indexes(id, obj, None)
+        self._maybe_compact()
+        return obj
+
+    def udate_many(self, data: Mapping[int, Model]) -> list[ModelDict]:
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            changes = self._get_changes(data, self._read())
+            self._append([model_data for _, _, model_data in changes])
+            for id, old, model_data in changes:
+                self._update_indexes(id, old, model_data)
+        self._maybe_compact()
+        return [model_data for _, _, model_data in changes]
+
+    def delete_many(self, ids: Sequence[int]) -> list[ModelDict]:
+        ids = list(dict.fromkeys(ids))
+        with self._lock(exclusive=True):
+            self._sync_indexes()
+            objects = self._read()
+            self._check_ids(ids, objects)
+            self._append([{self.id_field: id, self.deleted_field: 1} for id in ids])
+            self._live -= len(ids)
+            for id in ids:
+                self._update_indexes(id, objects[id], None)
+        self._maybe_compact()
+        return [objects[id] for id in ids]
+
+
+@dataclass
+class IndexedCSVDataManager(CSVDataManager):
+    """
+    CSV-менеджер с постоянным индексом смещений записей.
+
+    Рядом с файлом данных хранится индекс `<path>.idx`: в первой строке - отпечаток файла данных,
+    в остальных - `id смещение длина` для каждой записи. `read_detail` читает с диска одну строку
+    через `seek`. Если индекс отсутствует или его отпечаток не совпадает с файлом данных, он перестраивается.
+    """
+
+    HEADER_FMT = b'%020d %020d %020d\n'
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.index_path = self._get_sidecar_path('.idx')
+        self._offsets: dict[int, tuple[int, int]] = {}
+        self._index_stamp: tuple[int, ...] | None = None
+        with self._lock():
+            if not self._load_index():
+                self._rebuild_index()
+
+    def _scan_offsets(self, start: int = 0) -> dict[int, tuple[int, int]]:
+        """Находит смещения и длины записей в файле данных, начиная с байта `start`."""
+        offsets = {}
+        with open(self.path, mode='rb') as file:
+            file.seek(start)
+            offset = start
+            is_header = start == 0
+            for record in self._iter_records(file):
+                if is_header:
+                    is_header = False
+                elif record.strip():
+                    offsets[int(record.split(b',', 1)[0])] = (offset, len(record))
+                offset += len(record)
+        return offsets
+
+    def _load_index(self) -> bool:
+        """Загружает индекс с диска, если он соответствует файлу данных."""
+        try:
+            with open(self.index_path, mode='rb') as file:
+                header = file.readline()
+                stamp = tuple(int(value) for value in header.split())
+                if stamp != self._get_stamp():
+                    return False
+                offsets = {}
+                for line in file:
+                    id, offset, length = line.split()
+                    offsets[int(id)] = (int(offset), int(length))
+        except (FileNotFoundError, ValueError):
+            return False
+        self._offsets = offsets
+        self._index_stamp = self._get_stamp()
+        return True
+
+    def _save_index(self, offsets: dict[int, tuple[int, int]], append: bool = False) -> None:
+        """
+        Сохраняет индекс: целиком или дописывая новые записи и обновляя отпечаток.
+
+        При дозаписи отпечаток обновляется только после того, как записи сброшены на диск: если запись
+        оборвется раньше, старый отпечаток не совпадет с файлом данных и индекс будет перестроен.
+        """
+        stamp = self._get_stamp()
+        assert stamp is not None
+        if append and not os.path.exists(self.index_path):
+            append, offsets = False, self._offsets
+        entries = b''.join(b'%d %d %d\n' % (id, offset, length) for id, (offset, length) in offsets.items())
+        if append:
+            with open(self.index_path, mode='r+b') as file:
+                file.seek(0, os.SEEK_END)
+                file.write(entries)
+                file.flush()
+                os.fsync(file.fileno())
+                file.seek(0)
+                file.write(self.HEADER_FMT % stamp)
+        else:
+            with self._atomic_write(self.index_path, 'wb') as file:
+                file.write(self.HEADER_FMT % stamp)
+                file.write(entries)
+        self._index_stamp = stamp
+
+    def _rebuild_index(self) -> None:
+        self._offsets = self._scan_offsets()
+        self._save_index(self._offsets)
+
+    def _write(self, data: ModelDict) -> None:
+        """Перезаписывает файл с нуля, сразу вычисляя смещения записей."""
+        if self._staged is not None:
+            return
+        buffer = StringIO()
+        writer = DictWriter(buffer, fieldnames=self.fields)
+
+        def pop_buffer() -> bytes:
+            raw = buffer.getvalue().encode(self.encoding)
+            buffer.seek(0)
+            buffer.truncate()
+            return raw
+
+        offsets = {}
+        with self._atomic_write(self.path, 'wb') as file:
+            writer.writeheader()
+            file.write(pop_buffer())
+            for row in data.values():
+                writer.writerow(row)
+                raw = pop_buffer()
+                offsets[int(row[self.id_field])] = (file.tell(), len(raw))
+                file.write(raw)
+        self._offsets = offsets
+        self._save_index(offsets)
+
+    def _commit(self, rows: dict[int, ModelDict], changes: list[Change]) -> None:
+        """Записывает изменения транзакции; если записи были дописаны в конец файла, дописывает и их смещения."""
+        if self._get_stamp() != self._index_stamp:
+            self._rebuild_index()
+        start = os.path.getsize(self.path)
+        super()._commit(rows, changes)
+        if self._get_stamp() != self._index_stamp:
+            offsets = self._scan_offsets(start)
+            self._offsets.update(offsets)
+            self._save_index(offsets, append=True)
+
+    def create(self, data: Model | Sequence[Model]) -> ModelDict | list[ModelDict]:
+        with self._lock(exclusive=True):
+            if self._staged is not None:
+                return super().create(data)
+            if self._get_stamp() != self._index_stamp:
+                self._rebuild_index()
+            start = os.path.getsize(self.path)
+            write_data = super().create(data)
+            offsets = self._scan_offsets(start)
+            self._offsets.update(offsets)
+            self._save_index(offsets, append=True)
+        return write_data
+
+    def read_detail(self, id: int) -> ModelDict:
+        with self._lock():
+            if self._staged is not None:
+                return super().read_detail(id)
+            if self._get_stamp() != self._index_stamp:
+                self._rebuild_index()
+            try:
+                offset, length = self._offsets[id]
+            except KeyError:
+                raise IDErorr(message=f'ID {id} не существует.')
+            with open(self.path, mode='rb') as file:
+                file.seek(offset)
+                raw = file.read(length)
+        return self._parse_records([raw])[0]
+
+    def _read_many(self, ids: list[int]) -> list[ModelDict]:
+        """Читает записи по смещениям из индекса, не просматривая файл."""
+        with self._lock():
+            if self._staged is not None:
+                return super()._read_many(ids)
+            if self._get_stamp() != self._index_stamp:
+                self._rebuild_index()
+            with open(self.path, mode='rb') as file:
+                records = []
+                for id in ids:
+                    if id in self._offsets:
+                        offset, length = self._offsets[id]
+                        file.seek(offset)
+                        records.append(file.read(length))
+        return self._parse_records(records)
@@ -0,0 +1,184 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Sequence
+
+from core.data_types import Model
+from core.interfaces import DataManager
+from core.query import Predicate
+
+LATENCY_BOUNDS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float('inf'))
+IO_STATS_PATH = '/proc/thread-self/io'
+
+
+def get_io_counters() -> tuple[int, int]:
+    """Возвращает байты, прочитанные и записанные текущим потоком, или нули, если счетчики недоступны."""
+    try:
+        with open(IO_STATS_PATH, mode='rb') as file:
+            stats = dict(line.split(b': ') for line in file.read().splitlines())
+    except OSError:
+        return 0, 0
+    return int(stats[b'rchar']), int(stats[b'wchar'])
+
+
+@dataclass
+class OperationStats:
+    """Счетчики одной операции: вызовы, ошибки, гистограмма задержек, строки и байты ввода-вывода."""
+
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    histogram: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BOUNDS))
+    rows: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def percentile(self, value: float) -> float:
+        """Оценивает перцентиль задержки верхней границей корзины гистограммы."""
+        rank, seen = value * self.calls, 0
+        for bound, count in zip(LATENCY_BOUNDS, self.histogram):
+            seen += count
+            if seen and seen >= rank:
+                return bound
+        return 0.0
+
+
+@dataclass
+class Metrics:
+    """Потокобезопасный сборщик статистики операций."""
+
+    operations: dict[str, OperationStats] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def record(
+        self, name: str, elapsed: float, rows: int = 0, io: tuple[int, int] = (0, 0), error: bool = False
+    ) -> None:
+        with self._lock:
+            stats = self.operations.setdefault(name, OperationStats())
+            stats.calls += 1
+            stats.errors += error
+            stats.total_time += elapsed
+            stats.histogram[bisect_left(LATENCY_BOUNDS, elapsed)] += 1
+            stats.rows += rows
+            stats.bytes_read += io[0]
+            stats.bytes_written += io[1]
+
+    def measure(self, name: str, func: Callable[[], Any]) -> Any:
+        """Выполняет `func`, записывая время, число возвращенных строк и объем ввода-вывода."""
+        read, written = get_io_counters()
+        start = time.perf_counter()
+        try:
+            result = func()
+        except Exception:
+            self.record(name, time.perf_counter() - start, error=True)
+            raise
+        elapsed = time.perf_counter() - start
+        io = get_io_counters()
+        rows = len(result) if isinstance(result, list) else int(result is not None)
+        self.record(name, elapsed, rows, (io[0] - read, io[1] - written))
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                name: asdict(stats) | {'mean': stats.mean, 'bounds': list(LATENCY_BOUNDS[:-1])}
+                for name, stats in self.operations.items()
+            }
+
+    def dump(self, path: str | Path) -> None:
+        with open(path, mode='w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+
+
+@dataclass
+class InstrumentedDataManager(DataManager):
+    """
+    Хранилище-обертка, которое собирает статистику по каждой операции `manager`.
+
+    Для ленивых выборок время и строки считаются по мере чтения, а запись в статистику
+    происходит, когда выборка прочитана до конца или закрыта.
+    """
+
+    manager: DataManager
+    metrics: Metrics = field(default_factory=Metrics)
+
+    def __getattr__(self, name: str) -> Any:
+        """Остальные атрибуты (например, `migrate`) берутся у исходного хранилища."""
+        if name == 'manager':
+            raise AttributeError(name)
+        return getattr(self.manager, name)
+
+    def _iter(self, name: str, rows: Iterator[Any]) -> Iterator[Any]:
+        count, elapsed, error = 0, 0.0, False
+        read, written = get_io_counters()
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    row = next(rows)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - start
+                count += 1
+                yield row
+        except Exception:
+            error = True
+            raise
+        finally:
+            io = get_io_counters()
+            self.metrics.record(name, elapsed, count, (io[0] - read, io[1] - written), error)
+
+    def close(self) -> None:
+        self.metrics.measure('close', self.manager.close)
+
+    def create(self, data: Model | Sequence[Model]) -> Any:
+        return self.metrics.measure('create', lambda: self.manager.create(data))
+
+    def read_list(self) -> Any:
+        return self.metrics.measure('read_list', self.manager.read_list)
+
+    def iter_list(self, offset: int = 0, limit: int | None = None) -> Iterator[Any]:
+        return self._iter('iter_list', self.manager.iter_list(offset, limit))
+
+    def read_detail(self, id: int) -> Any:
+        return self.metrics.measure('read_detail', lambda: self.manager.read_detail(id))
+
+    def udate(self, id: int, data: Model) -> Any:
+        return self.metrics.measure('udate', lambda: self.manager.udate(id, data))
+
+    def delete(self, id: int) -> Any:
+        return self.metrics.measure('delete', lambda: self.manager.delete(id))
+
+    def read_many(self, ids: Sequence[int]) -> Any:
+        return self.metrics.measure('read_many', lambda: self.manager.read_many(ids))
+
+    def udate_many(self, data: Mapping[int, Model]) -> Any:
+        return self.metrics.measure('udate_many', lambda: self.manager.udate_many(data))
+
+    def delete_many(self, ids: Sequence[int]) -> Any:
+        return self.metrics.measure('delete_many', lambda: self.manager.delete_many(ids))
+
+    def search(self, field: str, value: str) -> Any:
+        return self.metrics.measure(f'search:{field}', lambda: self.manager.search(field, value))
+
+    def iter_search(self, field: str, value: str, offset: int = 0, limit: int | None = None) -> Iterator[Any]:
+        return self._iter(f'iter_search:{field}', self.manager.iter_search(field, value, offset, limit))
+
+    def search_range(self, field: str, start: int, end: int) -> Any:
+        return self.metrics.measure(f'search_range:{field}', lambda: self.manager.search_range(field, start, end))
+
+    def query(self, predicates: Sequence[Predicate], offset: int = 0, limit: int | None = None) -> Iterator[Any]:
+        return self._iter('query', self.manager.query(predicates, offset, limit))
+
+    def fuzzy_search(self, field: str, value: str, limit: int = 10) -> Any:
+        return self.metrics.measure(f'fuzzy_search:{field}', lambda: self.manager.fuzzy_search(field, value, limit))
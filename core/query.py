@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from enum import Enum
+from functools import cached_property
+from typing import Any, Self
+
+from core.data_types import ModelDict
+from core.text import normalize
+
+
+class Operator(Enum):
+    CONTAINS = 'contains'
+    EQ = 'eq'
+    RANGE = 'range'
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """
+    Условие на одно поле записи для составного запроса.
+
+    `contains` - подстрока, `eq` - точное совпадение (оба сравниваются по нормализованным ключам),
+    `range` - числовое значение в диапазоне [start, end], где отсутствующая граница не ограничивает.
+    """
+
+    field: str
+    operator: Operator
+    value: str = ''
+    start: int | None = None
+    end: int | None = None
+
+    @cached_property
+    def key(self) -> str:
+        """Нормализованное значение условия, вычисляется один раз."""
+        return normalize(self.value)
+
+    @classmethod
+    def contains(cls, field: str, value: str) -> Self:
+        return cls(field, Operator.CONTAINS, value=value)
+
+    @classmethod
+    def eq(cls, field: str, value: str) -> Self:
+        return cls(field, Operator.EQ, value=value)
+
+    @classmethod
+    def range(cls, field: str, start: int | None = None, end: int | None = None) -> Self:
+        return cls(field, Operator.RANGE, start=start, end=end)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Создает условие из словаря вида `{"field": ..., "op": ..., "value": ...}` или с `start`/`end`."""
+        try:
+            operator = Operator(data.get('op'))
+        except ValueError:
+            raise ValueError(f'Неизвестное условие `{data.get("op")}`.')
+        if not data.get('field'):
+            raise ValueError('Не заполнено поле `field`.')
+        if operator is Operator.RANGE:
+            start, end = data.get('start'), data.get('end')
+            if not all(bound is None or isinstance(bound, int) for bound in (start, end)):
+                raise ValueError('Границы диапазона должны быть числами.')
+            return cls.range(data['field'], start, end)
+        return cls(data['field'], operator, value=str(data.get('value', '')))
+
+    def matches(self, row: ModelDict) -> bool:
+        value = row[self.field]
+        if self.operator is Operator.RANGE:
+            try:
+                number = int(value)
+            except ValueError:
+                raise ValueError(f'Условие range применимо только к числовым полям, а `{self.field}` - не число.')
+            return (self.start is None or self.start <= number) and (self.end is None or number <= self.end)
+        if self.operator is Operator.EQ:
+            return normalize(value) == self.key
+        return self.key in normalize(value)
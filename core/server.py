@@ -0,0 +1,164 @@
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+from core.batch import BookCommands
+from core.exceptions import IDErorr
+from core.interfaces import BaseService
+from core.metrics import Metrics
+
+# Метод, шаблон пути и команда `BookCommands`, которая его обслуживает.
+ROUTES = [
+    ('GET', r'/books', 'list'),
+    ('POST', r'/books', 'add'),
+    ('GET', r'/books/search', 'search'),
+    ('GET', r'/books/range', 'range'),
+    ('GET', r'/books/fuzzy', 'fuzzy'),
+    ('POST', r'/books/query', 'query'),
+    ('POST', r'/books/status', 'status_many'),
+    ('GET', r'/books/(?P<id>\d+)', 'get'),
+    ('PUT', r'/books/(?P<id>\d+)', 'update'),
+    ('DELETE', r'/books/(?P<id>\d+)', 'delete'),
+]
+MAX_BODY_SIZE = 2**20
+
+logger = logging.getLogger(__name__)
+
+
+class BookRequestHandler(BaseHTTPRequestHandler):
+    """Разбирает HTTP-запрос и передает его в `BookHTTPService`. Соединения переиспользуются (HTTP/1.1)."""
+
+    protocol_version = 'HTTP/1.1'
+    # Заголовки и тело ответа пишутся отдельно, без TCP_NODELAY тело ждало бы подтверждения (Nagle).
+    disable_nagle_algorithm = True
+
+    def __init__(self, *args: Any, service: 'BookHTTPService', **kwargs: Any) -> None:
+        self.service = service
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self) -> None:
+        self.handle_request()
+
+    def do_POST(self) -> None:
+        self.handle_request()
+
+    def do_PUT(self) -> None:
+        self.handle_request()
+
+    def do_DELETE(self) -> None:
+        self.handle_request()
+
+    def read_body(self) -> dict[str, Any]:
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise ValueError('Некорректный заголовок Content-Length.')
+        if length > MAX_BODY_SIZE:
+            raise ValueError('Слишком большое тело запроса.')
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ValueError(f'Некорректный JSON: {e}.')
+        if not isinstance(body, dict):
+            raise ValueError('Тело запроса должно быть объектом.')
+        return body
+
+    def handle_request(self) -> None:
+        url = urlsplit(self.path)
+        try:
+            params = dict(parse_qsl(url.query)) | self.read_body()
+        except ValueError as e:
+            status, result = HTTPStatus.BAD_REQUEST, {'ok': False, 'error': str(e)}
+            self.close_connection = True
+        else:
+            status, result = self.service.handle(self.command, url.path, params)
+        body = json.dumps(result, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.service.access_log:
+            super().log_message(format, *args)
+
+
+@dataclass
+class BookHTTPService(BookCommands, BaseService):
+    """
+    HTTP-сервер с JSON API для работы с книгами.
+
+    Запросы обслуживаются в потоках `ThreadingHTTPServer` одним долгоживущим хранилищем, которое
+    прогревается при запуске (для `CachedCSVDataManager` это загрузка кэша). Операции хранилища
+    выполняются по одной под общей блокировкой, поэтому подходят любые хранилища, а разбор запросов
+    и сериализация ответов идут параллельно. Ответ - объект `{"ok": true, "result": ...}`
+    или `{"ok": false, "error": "..."}` с кодом 400 (ошибка в данных), 404, 405 или 500
+    (непредвиденная ошибка, подробности пишутся в лог).
+    """
+
+    host: str = '127.0.0.1'
+    port: int = 8000
+    metrics: Metrics = field(default_factory=Metrics)
+    access_log: bool = False
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.routes = [(method, re.compile(pattern), command) for method, pattern, command in ROUTES]
+        self._lock = threading.Lock()
+
+    def match(self, method: str, path: str) -> tuple[HTTPStatus, dict[str, Any] | None]:
+        """Находит команду для запроса: возвращает параметры пути с именем команды или код ошибки."""
+        status = HTTPStatus.NOT_FOUND
+        for route_method, pattern, command in self.routes:
+            if match := pattern.fullmatch(path.rstrip('/') or '/'):
+                if route_method == method:
+                    return HTTPStatus.OK, match.groupdict() | {'command': command}
+                status = HTTPStatus.METHOD_NOT_ALLOWED
+        return status, None
+
+    def handle(self, method: str, path: str, params: dict[str, Any]) -> tuple[HTTPStatus, dict[str, Any]]:
+        if path == '/stats' and method == 'GET':
+            return HTTPStatus.OK, {'ok': True, 'result': self.metrics.to_dict()}
+        status, route = self.match(method, path)
+        if route is None:
+            return status, {'ok': False, 'error': status.phrase}
+        try:
+            with self._lock:
+                result = self.run(params | route)
+        except IDErorr as e:
+            return HTTPStatus.NOT_FOUND, {'ok': False, 'error': e.message}
+        except ValueError as e:
+            return HTTPStatus.BAD_REQUEST, {'ok': False, 'error': str(e)}
+        except Exception:
+            logger.exception('Ошибка при обработке %s %s', method, path)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'ok': False, 'error': 'Внутренняя ошибка сервера.'}
+        status = HTTPStatus.CREATED if route['command'] == 'add' else HTTPStatus.OK
+        return status, {'ok': True, 'result': result}
+
+    def create_server(self) -> ThreadingHTTPServer:
+        """Прогревает хранилище и создает сервер (порт 0 - любой свободный)."""
+        list(self.manager.iter_list(0, 1))
+        return ThreadingHTTPServer((self.host, self.port), partial(BookRequestHandler, service=self))
+
+    def act(self) -> None:
+        server = self.create_server()
+        host, port = server.server_address[:2]
+        print(f'Сервер запущен на http://{host!s}:{port}, для остановки нажмите Ctrl+C.')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
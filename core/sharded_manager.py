@@ -0,0 +1,266 @@
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from itertools import chain, islice
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping, Sequence
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from core.data_types import Model, ModelDict
+from core.exceptions import IDErorr
+from core.interfaces import DataManager
+from core.managers import PARALLEL_SEARCH_THRESHOLD, CSVDataManager, create_search_pool, search_chunk
+from core.text import normalize
+
+
+@dataclass
+class ShardedCSVDataManager(DataManager):
+    """
+    Хранилище, разбитое по диапазонам id на несколько CSV-файлов (шардов).
+
+    Книги с id от `k * shard_size + 1` до `(k + 1) * shard_size` лежат в файле `<path>/shard-<k>.csv`.
+    В манифесте `<path>/manifest.json` хранятся размер шарда, максимальный id и список шардов.
+    Чтение, изменение и удаление книги по id читают и переписывают только ее шард, а выборки
+    и поиск обходят шарды по очереди, не загружая их все сразу. Если шарды вместе не меньше
+    `parallel_threshold` байт, `search` ищет по ним в пуле процессов.
+    """
+
+    path: str | Path
+    fieldnames: list[str]
+    id_field: str = 'id'
+    encoding: str = 'utf-8'
+    shard_size: int = 10_000
+    parallel_threshold: int | None = PARALLEL_SEARCH_THRESHOLD
+    search_workers: int | None = None
+
+    VERSION = 1
+
+    def __post_init__(self) -> None:
+        if self.shard_size < 1:
+            raise ValueError('Размер шарда должен быть положительным.')
+        os.makedirs(self.path, exist_ok=True)
+        self.manifest_path = os.path.join(self.path, 'manifest.json')
+        self._mutex = threading.RLock()
+        self._shards: dict[int, CSVDataManager] = {}
+        self._shard_ids: list[int] = []
+        self._search_pool: ProcessPoolExecutor | None = None
+        self.max_id = 0
+        with self._lock():
+            self._load_manifest()
+            self._recover()
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Монопольная блокировка манифеста: под ней выдаются id и добавляются шарды."""
+        with self._mutex, open(f'{self.manifest_path}.lock', mode='a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load_manifest(self) -> None:
+        """Читает манифест; размер шарда из манифеста важнее переданного, чтобы не потерять записи."""
+        try:
+            with open(self.manifest_path, encoding='utf-8') as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            return
+        if manifest.get('version') != self.VERSION:
+            raise ValueError(f'Манифест {self.manifest_path} имеет неизвестную версию.')
+        self.shard_size = manifest['shard_size']
+        self.max_id = max(self.max_id, manifest['max_id'])
+        self._shard_ids = sorted(int(name[6:-4]) for name in manifest['shards'])
+
+    def _recover(self) -> None:
+        """Сверяет манифест с файлами шардов, если после дозаписи в шард манифест не успел записаться."""
+        shard_ids = sorted(
+            int(name[6:-4]) for name in os.listdir(self.path) if name.startswith('shard-') and name.endswith('.csv')
+        )
+        if not shard_ids:
+            return
+        max_id = self._get_shard(shard_ids[-1]).max_id
+        if shard_ids != self._shard_ids or max_id > self.max_id:
+            self._shard_ids = shard_ids
+            self.max_id = max(self.max_id, max_id)
+            self._save_manifest()
+
+    def _save_manifest(self) -> None:
+        manifest = {
+            'version': self.VERSION,
+            'shard_size': self.shard_size,
+            'max_id': self.max_id,
+            'shards': [self._get_shard_name(shard_id) for shard_id in self._shard_ids],
+        }
+        temp_path = f'{self.manifest_path}.{os.getpid()}.tmp'
+        with open(temp_path, mode='w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=2)
+        os.replace(temp_path, self.manifest_path)
+
+    def _get_shard_name(self, shard_id: int) -> str:
+        return f'shard-{shard_id:06d}.csv'
+
+    def _get_shard_id(self, id: int) -> int:
+        return (id - 1) // self.shard_size
+
+    def _get_shard(self, shard_id: int) -> CSVDataManager:
+        with self._mutex:
+            if shard_id not in self._shards:
+                path = os.path.join(self.path, self._get_shard_name(shard_id))
+                self._shards[shard_id] = CSVDataManager(path, self.fieldnames, self.id_field, self.encoding)
+            return self._shards[shard_id]
+
+    def _find_shard(self, id: int) -> CSVDataManager:
+        """Возвращает шард с книгой `id`, перечитывая манифест, если шард мог добавить другой процесс."""
+        shard_id = self._get_shard_id(id)
+        if shard_id not in self._shard_ids:
+            with self._lock():
+                self._load_manifest()
+        if id < 1 or shard_id not in self._shard_ids:
+            raise IDErorr(message=f'ID {id} не существует.')
+        return self._get_shard(shard_id)
+
+    def _iter_shards(self) -> Iterator[CSVDataManager]:
+        with self._lock():
+            self._load_manifest()
+            shard_ids = list(self._shard_ids)
+        return map(self._get_shard, shard_ids)
+
+    def close(self) -> None:
+        if self._search_pool is not None:
+            self._search_pool.shutdown()
+            self._search_pool = None
+        for shard in self._shards.values():
+            shard.close()
+
+    def create(self, data: Model | Sequence[Model]) -> ModelDict | list[ModelDict]:
+        models = data if isinstance(data, Sequence) else [data]
+        with self._lock():
+            self._load_manifest()
+            write_data = []
+            for model in models:
+                self.max_id += 1
+                write_data.append(model.to_dict() | {self.id_field: self.max_id})
+            groups: dict[int, list[ModelDict]] = {}
+            for model_data in write_data:
+                groups.setdefault(self._get_shard_id(model_data[self.id_field]), []).append(model_data)
+            for shard_id, rows in groups.items():
+                shard = self._get_shard(shard_id)
+                with shard._lock(exclusive=True):
+                    shard._append(rows)
+                    shard.max_id = max(shard.max_id, rows[-1][self.id_field])
+                    shard.row_count += len(rows)
+            self._shard_ids = sorted(set(self._shard_ids) | groups.keys())
+            self._save_manifest()
+        return write_data if isinstance(data, Sequence) else write_data[0]
+
+    def read_list(self) -> list[ModelDict]:
+        return list(self.iter_list())
+
+    def iter_list(self, offset: int = 0, limit: int | None = None) -> Iterator[ModelDict]:
+        stop = None if limit is None else offset + limit
+        rows = chain.from_iterable(shard.iter_list() for shard in self._iter_shards())
+        return islice(rows, offset, stop)
+
+    def read_detail(self, id: int) -> ModelDict:
+        return self._find_shard(id).read_detail(id)
+
+    def udate(self, id: int, data: Model) -> ModelDict:
+        return self._find_shard(id).udate(id, data)
+
+    def delete(self, id: int) -> ModelDict:
+        return self._find_shard(id).delete(id)
+
+    def _group_ids(self, ids: Iterable[int]) -> list[tuple[CSVDataManager, list[int]]]:
+        """Раскладывает id по шардам; если шарда для какого-то id нет, вызывает IDErorr."""
+        groups: dict[int, list[int]] = {}
+        for id in dict.fromkeys(ids):
+            groups.setdefault(self._get_shard_id(id), []).append(id)
+        return [(self._find_shard(shard_ids[0]), shard_ids) for _, shard_ids in sorted(groups.items())]
+
+    @contextmanager
+    def _lock_shards(self, groups: list[tuple[CSVDataManager, list[int]]]) -> Iterator[None]:
+        """Берет монопольные блокировки шардов по возрастанию их номеров: так процессы не заблокируют друг друга."""
+        with ExitStack() as stack:
+            for shard, _ in groups:
+                stack.enter_context(shard._lock(exclusive=True))
+            yield
+
+    def read_many(self, ids: Sequence[int]) -> list[ModelDict]:
+        objects: dict[int, ModelDict] = {}
+        for shard, shard_ids in self._group_ids(ids):
+            objects.update(zip(shard_ids, shard.read_many(shard_ids)))
+        return [objects[id] for id in dict.fromkeys(ids)]
+
+    def udate_many(self, data: Mapping[int, Model]) -> list[ModelDict]:
+        """
+        Переписывает каждый затронутый шард один раз.
+
+        Все затронутые шарды заблокированы на время проверки id и записи, поэтому другой процесс
+        не удалит книгу между проверкой и изменением.
+        """
+        groups = self._group_ids(data)
+        objects: dict[int, ModelDict] = {}
+        with self._lock_shards(groups):
+            self.read_many(list(data))
+            for shard, shard_ids in groups:
+                objects.update(zip(shard_ids, shard.udate_many({id: data[id] for id in shard_ids})))
+        return [objects[id] for id in data]
+
+    def delete_many(self, ids: Sequence[int]) -> list[ModelDict]:
+        """Удаляет книги, переписывая каждый затронутый шард один раз под блокировкой всех затронутых шардов."""
+        groups = self._group_ids(ids)
+        objects: dict[int, ModelDict] = {}
+        with self._lock_shards(groups):
+            self.read_many(ids)
+            for shard, shard_ids in groups:
+                objects.update(zip(shard_ids, shard.delete_many(shard_ids)))
+        return [objects[id] for id in dict.fromkeys(ids)]
+
+    def search(self, field: str, value: str) -> list[ModelDict]:
+        return list(self.iter_search(field, value))
+
+    def _use_parallel_search(self, shards: list[CSVDataManager]) -> bool:
+        return (
+            self.parallel_threshold is not None
+            and len(shards) > 1
+            and sum(os.path.getsize(shard.path) for shard in shards) >= self.parallel_threshold
+        )
+
+    def _search_parallel(self, shards: list[CSVDataManager], field: str, value: str) -> list[ModelDict]:
+        """Ищет по шардам в пуле процессов, по одному шарду на задачу."""
+        with self._mutex:
+            if self._search_pool is None:
+                self._search_pool = create_search_pool(self.search_workers or os.cpu_count() or 1)
+            pool = self._search_pool
+        fields, value = [self.id_field] + self.fieldnames, normalize(value)
+        futures = [
+            pool.submit(search_chunk, shard.path, self.encoding, fields, 0, None, field, value) for shard in shards
+        ]
+        return [row for future in futures for row in future.result()]
+
+    def iter_search(self, field: str, value: str, offset: int = 0, limit: int | None = None) -> Iterator[ModelDict]:
+        """Все результаты сразу (без `offset` и `limit`) ищутся по шардам параллельно, страницы - по очереди."""
+        if field not in self.fieldnames:
+            raise ValueError('Поля %s нет в файле.' % field)
+        shards = list(self._iter_shards())
+        if not offset and limit is None and self._use_parallel_search(shards):
+            return iter(self._search_parallel(shards, field, value))
+        stop = None if limit is None else offset + limit
+        rows = chain.from_iterable(shard.iter_search(field, value) for shard in shards)
+        return islice(rows, offset, stop)
+
+    def search_range(self, field: str, start: int, end: int) -> list[ModelDict]:
+        if field not in self.fieldnames:
+            raise ValueError('Поля %s нет в файле.' % field)
+        objects = [obj for obj in self.iter_list() if start <= int(obj[field]) <= end]
+        return sorted(objects, key=lambda obj: int(obj[field]))
@@ -0,0 +1,225 @@
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, Mapping, Sequence
+
+from core.data_types import Model, ModelDict
+from core.exceptions import IDErorr
+from core.interfaces import DataManager
+from core.text import normalize
+
+# Значение `PRAGMA user_version` после переноса записей из другого хранилища.
+MIGRATED_VERSION = 1
+
+
+@dataclass
+class SQLiteDataManager(DataManager):
+    """
+    Хранилище на основе SQLite.
+
+    Записи лежат в таблице с целочисленным первичным ключом. По полям из `fts_fields`
+    ведется полнотекстовый поиск подстроки через FTS5 с токенизатором trigram: в FTS-таблицу
+    триггеры кладут значения, приведенные `normalize`, поэтому поиск, как и в остальных хранилищах,
+    не различает регистр и `ё`/`е`. По полям из `indexed_fields` (целочисленных) строятся обычные
+    индексы для поиска по диапазону; `search` по ним, как и в остальных хранилищах, ищет подстроку.
+    База работает в режиме WAL, запросы параметризованы и переиспользуются из кэша
+    подготовленных выражений модуля `sqlite3`.
+    """
+
+    path: str | Path
+    fieldnames: list[str]
+    id_field: str = 'id'
+    table: str = 'data'
+    fts_fields: list[str] = field(default_factory=list)
+    indexed_fields: list[str] = field(default_factory=list)
+    fetch_size: int = 500
+
+    def __post_init__(self) -> None:
+        for name in self.fts_fields + self.indexed_fields:
+            self._check_field(name)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.fields = [self.id_field] + self.fieldnames
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.create_function('normalize', 1, normalize, deterministic=True)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self._create_schema()
+        columns = ', '.join(self.fieldnames)
+        placeholders = ', '.join('?' * len(self.fieldnames))
+        assignments = ', '.join(f'{name} = ?' for name in self.fieldnames)
+        self.sql_insert = f'INSERT INTO {self.table} ({columns}) VALUES ({placeholders})'
+        self.sql_insert_with_id = f'INSERT INTO {self.table} ({self.id_field}, {columns}) VALUES (?, {placeholders})'
+        self.sql_select = f'SELECT {", ".join(self.fields)} FROM {self.table}'
+        self.sql_select_one = f'{self.sql_select} WHERE {self.id_field} = ?'
+        self.sql_update = f'UPDATE {self.table} SET {assignments} WHERE {self.id_field} = ?'
+        self.sql_delete = f'DELETE FROM {self.table} WHERE {self.id_field} = ?'
+
+    def _create_schema(self) -> None:
+        fts_table = f'{self.table}_search'
+        columns = ', '.join(f'{name} INTEGER' if name in self.indexed_fields else name for name in self.fieldnames)
+        statements = [f'CREATE TABLE IF NOT EXISTS {self.table} ({self.id_field} INTEGER PRIMARY KEY, {columns})']
+        statements += [
+            f'CREATE INDEX IF NOT EXISTS {self.table}_{name}_idx ON {self.table} ({name}, {self.id_field})'
+            for name in self.indexed_fields
+        ]
+        if self.fts_fields:
+            columns = ', '.join(self.fts_fields)
+            new_values = ', '.join(f'normalize(new.{name})' for name in self.fts_fields)
+            old_values = ', '.join(f'normalize(old.{name})' for name in self.fts_fields)
+            delete = (
+                f"INSERT INTO {fts_table} ({fts_table}, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});"
+            )
+            insert = f'INSERT INTO {fts_table} (rowid, {columns}) VALUES (new.rowid, {new_values});'
+            if not self._table_exists(fts_table):
+                normalized = ', '.join(f'normalize({name})' for name in self.fts_fields)
+                statements += [
+                    f"CREATE VIRTUAL TABLE {fts_table} USING fts5({columns}, content='', tokenize='trigram')",
+                    f'INSERT INTO {fts_table} (rowid, {columns}) '
+                    f'SELECT {self.id_field}, {normalized} FROM {self.table}',
+                ]
+            statements += [
+                f'CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {self.table} BEGIN {insert} END',
+                f'CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {self.table} BEGIN {delete} END',
+                f'CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE ON {self.table} '
+                f'BEGIN {delete} {insert} END',
+            ]
+        with self._lock, self.connection:
+            for statement in statements:
+                self.connection.execute(statement)
+
+    def _table_exists(self, name: str) -> bool:
+        with self._lock:
+            sql = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+            return self.connection.execute(sql, (name,)).fetchone() is not None
+
+    def _check_field(self, name: str) -> None:
+        if name not in self.fieldnames:
+            raise ValueError('Поля %s нет в таблице.' % name)
+
+    def _get_values(self, data: Model) -> list:
+        model_dict = data.to_dict()
+        return [model_dict[name] for name in self.fieldnames]
+
+    def _fetch(self, sql: str, parameters: Sequence = ()) -> list[ModelDict]:
+        with self._lock:
+            return [dict(row) for row in self.connection.execute(sql, parameters)]
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self.connection.execute(f'SELECT 1 FROM {self.table} LIMIT 1').fetchone() is None
+
+    @property
+    def migrated(self) -> bool:
+        """Переносились ли уже записи в базу: отметка хранится в `PRAGMA user_version`."""
+        with self._lock:
+            return self.connection.execute('PRAGMA user_version').fetchone()[0] >= MIGRATED_VERSION
+
+    def migrate(self, source: DataManager) -> int:
+        """
+        Однократно переносит записи из другого хранилища с сохранением id.
+
+        Перенос отмечается в базе в той же транзакции, поэтому он не повторяется, даже если потом
+        из базы удалят все записи. Непустая база без отметки считается уже заполненной и только отмечается.
+        """
+        if self.migrated:
+            return 0
+        rows = source.read_list() if self.is_empty() else []
+        with self._lock, self.connection:
+            self.connection.executemany(self.sql_insert_with_id, ([row[name] for name in self.fields] for row in rows))
+            self.connection.execute(f'PRAGMA user_version = {MIGRATED_VERSION}')
+        return len(rows)
+
+    def create(self, data: Model | Sequence[Model]) -> ModelDict | list[ModelDict]:
+        models = data if isinstance(data, Sequence) else [data]
+        write_data = []
+        with self._lock, self.connection:
+            for model in models:
+                cursor = self.connection.execute(self.sql_insert, self._get_values(model))
+                write_data.append(model.to_dict() | {self.id_field: cursor.lastrowid})
+        return write_data if isinstance(data, Sequence) else write_data[0]
+
+    def read_list(self) -> list[ModelDict]:
+        return self._fetch(f'{self.sql_select} ORDER BY {self.id_field}')
+
+    def _iter_pages(self, sql: str, parameters: Sequence, offset: int, limit: int | None) -> Iterator[ModelDict]:
+        """Выполняет запрос с LIMIT/OFFSET, отдавая строки по мере чтения курсора."""
+        with self._lock:
+            cursor = self.connection.execute(
+                f'{sql} LIMIT ? OFFSET ?', [*parameters, -1 if limit is None else limit, offset]
+            )
+            rows = cursor.fetchmany(self.fetch_size)
+        while rows:
+            yield from (dict(row) for row in rows)
+            with self._lock:
+                rows = cursor.fetchmany(self.fetch_size)
+
+    def iter_list(self, offset: int = 0, limit: int | None = None) -> Iterator[ModelDict]:
+        return self._iter_pages(f'{self.sql_select} ORDER BY {self.id_field}', (), offset, limit)
+
+    def read_detail(self, id: int) -> ModelDict:
+        rows = self._fetch(self.sql_select_one, (id,))
+        if not rows:
+            raise IDErorr(message=f'ID {id} не существует.')
+        return rows[0]
+
+    def udate(self, id: int, data: Model) -> ModelDict:
+        with self._lock, self.connection:
+            cursor = self.connection.execute(self.sql_update, self._get_values(data) + [id])
+            if not cursor.rowcount:
+                raise IDErorr(message=f'ID {id} не существует.')
+        return {self.id_field: id} | data.to_dict()
+
+    def delete(self, id: int) -> ModelDict:
+        with self._lock, self.connection:
+            obj = self.read_detail(id)
+            self.connection.execute(self.sql_delete, (id,))
+        return obj
+
+    def udate_many(self, data: Mapping[int, Model]) -> list[ModelDict]:
+        """Обновляет записи в одной транзакции: если какого-то id нет, изменения откатываются."""
+        with self._lock, self.connection:
+            for id, model in data.items():
+                cursor = self.connection.execute(self.sql_update, self._get_values(model) + [id])
+                if not cursor.rowcount:
+                    raise IDErorr(message=f'ID {id} не существует.')
+        return [{self.id_field: id} | model.to_dict() for id, model in data.items()]
+
+    def delete_many(self, ids: Sequence[int]) -> list[ModelDict]:
+        """Удаляет записи в одной транзакции: если какого-то id нет, изменения откатываются."""
+        with self._lock, self.connection:
+            objects = [self.read_detail(id) for id in dict.fromkeys(ids)]
+            self.connection.executemany(self.sql_delete, [(obj[self.id_field],) for obj in objects])
+        return objects
+
+    def search(self, field: str, value: str) -> list[ModelDict]:
+        return list(self.iter_search(field, value))
+
+    def iter_search(self, field: str, value: str, offset: int = 0, limit: int | None = None) -> Iterator[ModelDict]:
+        self._check_field(field)
+        value = normalize(value)
+        if field in self.indexed_fields:
+            sql = f'{self.sql_select} WHERE instr(CAST({field} AS TEXT), ?) > 0 ORDER BY {self.id_field}'
+            return self._iter_pages(sql, (value,), offset, limit)
+        if field in self.fts_fields and len(value) >= 3:
+            sql = (
+                f'{self.sql_select} WHERE {self.id_field} IN '
+                f'(SELECT rowid FROM {self.table}_search WHERE {self.table}_search MATCH ?) ORDER BY {self.id_field}'
+            )
+            query = '%s : "%s"' % (field, value.replace('"', '""'))
+            return self._iter_pages(sql, (query,), offset, limit)
+        rows = (obj for obj in self.iter_list() if value in normalize(obj[field]))
+        return islice(rows, offset, None if limit is None else offset + limit)
+
+    def search_range(self, field: str, start: int, end: int) -> list[ModelDict]:
+        self._check_field(field)
+        return self._fetch(
+            f'{self.sql_select} WHERE {field} BETWEEN ? AND ? ORDER BY {field}, {self.id_field}', (start, end)
+        )
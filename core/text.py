@@ -0,0 +1,38 @@
+import unicodedata
+
+
+def normalize(value: object) -> str:
+    """
+    Приводит значение поля к ключу поиска.
+
+    Строка нормализуется в NFKC (совместимые символы и составные буквы сводятся к одному виду),
+    приводится к нижнему регистру через `casefold`, а `ё` заменяется на `е`.
+    """
+    return unicodedata.normalize('NFKC', str(value)).casefold().replace('ё', 'е')
+
+
+def get_max_distance(query: str) -> int:
+    """Допустимое число опечаток для запроса: одна на каждые четыре символа, но не меньше одной."""
+    return max(1, len(query) // 4)
+
+
+def fuzzy_distance(query: str, text: str, max_distance: int) -> int:
+    """
+    Возвращает наименьшее расстояние редактирования между `query` и подстрокой `text`.
+
+    Считается динамическим программированием по Левенштейну, в котором начало и конец совпадения
+    в `text` бесплатны. Если расстояние заведомо больше `max_distance`, возвращается `max_distance + 1`.
+    """
+    if query in text:
+        return 0
+    previous = list(range(len(query) + 1))
+    best = previous[-1]
+    for char in text:
+        current = [0]
+        for i, query_char in enumerate(query, start=1):
+            current.append(min(previous[i] + 1, current[i - 1] + 1, previous[i - 1] + (query_char != char)))
+        best = min(best, current[-1])
+        if best == 0:
+            return 0
+        previous = current
+    return best if best <= max_distance else max_distance + 1
@@ -1,7 +1,106 @@
+import os
+import sys
+from argparse import ArgumentParser
+from typing import Callable
+
+from core.batch import BookBatchService
+from core.binary_manager import BinaryDataManager
 from core.console import BookConsoleService
 from core.data_types import Book
-from core.managers import CSVDataManager
+from core.importers import BulkImporter
+from core.indexes import SortedIndex, TrigramIndex
+from core.interfaces import DataManager, Index
+from core.managers import CachedCSVDataManager, CSVDataManager
+from core.metrics import InstrumentedDataManager, Metrics
+from core.server import BookHTTPService
+from core.sqlite_manager import SQLiteDataManager
+
+CSV_PATH = 'data/db.csv'
+SQLITE_PATH = 'data/db.sqlite3'
+BINARY_PATH = 'data/db.bin'
+
+
+def get_indexes() -> list[Index]:
+    return [TrigramIndex('title'), TrigramIndex('author'), SortedIndex('year')]
+
+
+def get_csv_manager() -> CSVDataManager:
+    return CSVDataManager(CSV_PATH, Book.get_fields(), indexes=get_indexes())
+
+
+def get_cached_manager() -> CachedCSVDataManager:
+    return CachedCSVDataManager(CSV_PATH, Book.get_fields(), indexes=get_indexes())
+
+
+def get_sqlite_manager() -> SQLiteDataManager:
+    manager = SQLiteDataManager(
+        SQLITE_PATH, Book.get_fields(), table='books', fts_fields=['title', 'author'], indexed_fields=['year']
+    )
+    if os.path.exists(CSV_PATH) and not manager.migrated:
+        manager.migrate(CSVDataManager(CSV_PATH, Book.get_fields()))
+    return manager
+
+
+def get_binary_manager() -> BinaryDataManager:
+    manager = BinaryDataManager(BINARY_PATH)
+    if os.path.exists(CSV_PATH) and not manager.count:
+        manager.migrate(CSVDataManager(CSV_PATH, Book.get_fields()))
+    return manager
+
+
+BACKENDS: dict[str, Callable[[], DataManager]] = {
+    'csv': get_csv_manager,
+    'cached': get_cached_manager,
+    'sqlite': get_sqlite_manager,
+    'binary': get_binary_manager,
+}
+
+
+def import_books(manager: DataManager, path: str, batch_size: int) -> None:
+    report = BulkImporter(manager, Book, batch_size=batch_size).run(path)
+    for number, error in report.rejects:
+        print(f'Строка {number}: {error}')
+    print(f'Импортировано книг: {report.created}, отклонено строк: {len(report.rejects)}.')
+
+
+def run_batch(manager: DataManager, path: str) -> int:
+    if path == '-':
+        return BookBatchService(manager, sys.stdin, sys.stdout)()
+    with open(path, mode='r', encoding='utf-8') as source:
+        return BookBatchService(manager, source, sys.stdout)()
+
 
-if '__main__' in __name__:
-    book_manager = CSVDataManager('data/db.csv', Book.get_fields())
-    BookConsoleService(book_manager)()
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Консольная библиотека.')
+    parser.add_argument(
+        '--backend', choices=BACKENDS, help='Хранилище данных (по умолчанию csv, для сервера - cached).'
+    )
+    parser.add_argument('--metrics', help='Сохранить статистику операций в JSON файл при выходе.')
+    commands = parser.add_subparsers(dest='command')
+    import_parser = commands.add_parser('import', help='Импортировать книги из CSV или JSONL файла.')
+    import_parser.add_argument('path', help='Путь к файлу .csv или .jsonl.')
+    import_parser.add_argument('--batch-size', type=int, default=1000, help='Размер пачки записей.')
+    batch_parser = commands.add_parser('batch', help='Выполнить команды из JSONL файла без диалога.')
+    batch_parser.add_argument('path', nargs='?', default='-', help='Путь к файлу с командами, по умолчанию stdin.')
+    serve_parser = commands.add_parser('serve', help='Запустить HTTP-сервер с JSON API.')
+    serve_parser.add_argument('--host', default='127.0.0.1', help='Адрес сервера.')
+    serve_parser.add_argument('--port', type=int, default=8000, help='Порт сервера.')
+    serve_parser.add_argument('--access-log', action='store_true', help='Печатать каждый запрос.')
+    args = parser.parse_args()
+    backend = args.backend or ('cached' if args.command == 'serve' else 'csv')
+    exit_code = 0
+    metrics = Metrics()
+    try:
+        with InstrumentedDataManager(BACKENDS[backend](), metrics) as book_manager:
+            if args.command == 'import':
+                import_books(book_manager, args.path, args.batch_size)
+            elif args.command == 'batch':
+                exit_code = 1 if run_batch(book_manager, args.path) else 0
+            elif args.command == 'serve':
+                BookHTTPService(book_manager, args.host, args.port, metrics, args.access_log)()
+            else:
+                BookConsoleService(book_manager, metrics)()
+    finally:
+        if args.metrics:
+            metrics.dump(args.metrics)
+    sys.exit(exit_code)
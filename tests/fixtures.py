@@ -1,10 +1,28 @@
 import os
+import shutil
+from glob import glob
 
 import pytest
 
+from core.binary_manager import BinaryDataManager
 from core.console import BookConsoleService
 from core.data_types import Book
-from core.managers import CSVDataManager
+from core.indexes import TrigramIndex
+from core.managers import (
+    CachedCSVDataManager,
+    CSVDataManager,
+    IndexedCSVDataManager,
+    JournaledCSVDataManager,
+    LogCSVDataManager,
+)
+from core.sharded_manager import ShardedCSVDataManager
+from core.sqlite_manager import SQLiteDataManager
+
+
+def remove_files(path: str) -> None:
+    """Удаляет файл данных вместе со служебными файлами рядом с ним."""
+    for file_path in glob(f'{path}*'):
+        os.remove(file_path)
 
 
 @pytest.fixture
@@ -13,8 +31,98 @@ def csv_manager():
     TEST_CSV_FILE = 'data/test_data.csv'
     manager = CSVDataManager(path=TEST_CSV_FILE, fieldnames=Book.get_fields())
     yield manager
-    if os.path.exists(TEST_CSV_FILE):
-        os.remove(TEST_CSV_FILE)
+    remove_files(TEST_CSV_FILE)
+
+
+@pytest.fixture
+def cached_manager():
+    """Фикстура для создания CachedCSVDataManager с тестовыми данными."""
+    TEST_CSV_FILE = 'data/test_cached_data.csv'
+    manager = CachedCSVDataManager(path=TEST_CSV_FILE, fieldnames=Book.get_fields())
+    yield manager
+    remove_files(TEST_CSV_FILE)
+
+
+@pytest.fixture
+def log_manager():
+    """Фикстура для создания LogCSVDataManager с тестовыми данными."""
+    TEST_CSV_FILE = 'data/test_log_data.csv'
+    manager = LogCSVDataManager(path=TEST_CSV_FILE, fieldnames=Book.get_fields(), compaction_threshold=0.6)
+    yield manager
+    remove_files(TEST_CSV_FILE)
+
+
+@pytest.fixture
+def journaled_manager():
+    """Фикстура для создания JournaledCSVDataManager с тестовыми данными."""
+    TEST_CSV_FILE = 'data/test_journaled_data.csv'
+    manager = JournaledCSVDataManager(
+        path=TEST_CSV_FILE, fieldnames=Book.get_fields(), group_size=2, checkpoint_records=5
+    )
+    yield manager
+    manager.close()
+    remove_files(TEST_CSV_FILE)
+
+
+@pytest.fixture
+def indexed_manager():
+    """Фикстура для создания IndexedCSVDataManager с тестовыми данными."""
+    TEST_CSV_FILE = 'data/test_indexed_data.csv'
+    manager = IndexedCSVDataManager(path=TEST_CSV_FILE, fieldnames=Book.get_fields())
+    yield manager
+    remove_files(TEST_CSV_FILE)
+
+
+@pytest.fixture
+def sharded_manager():
+    """Фикстура для создания ShardedCSVDataManager с шардами по две книги."""
+    TEST_SHARDS_DIR = 'data/test_sharded_data'
+    manager = ShardedCSVDataManager(path=TEST_SHARDS_DIR, fieldnames=Book.get_fields(), shard_size=2)
+    yield manager
+    manager.close()
+    shutil.rmtree(TEST_SHARDS_DIR)
+
+
+@pytest.fixture
+def locking_path():
+    """Фикстура пути к файлу, с которым параллельно работают несколько процессов."""
+    TEST_CSV_FILE = 'data/test_locking_data.csv'
+    remove_files(TEST_CSV_FILE)
+    yield TEST_CSV_FILE
+    remove_files(TEST_CSV_FILE)
+
+
+@pytest.fixture
+def trigram_manager():
+    """Фикстура для создания CSVDataManager с триграммными индексами по названию и автору."""
+    TEST_CSV_FILE = 'data/test_trigram_data.csv'
+    manager = CSVDataManager(
+        path=TEST_CSV_FILE, fieldnames=Book.get_fields(), indexes=[TrigramIndex('title'), TrigramIndex('author')]
+    )
+    yield manager
+    remove_files(TEST_CSV_FILE)
+
+
+@pytest.fixture
+def sqlite_manager():
+    """Фикстура для создания SQLiteDataManager с тестовыми данными."""
+    TEST_DB_FILE = 'data/test_data.sqlite3'
+    manager = SQLiteDataManager(
+        path=TEST_DB_FILE, fieldnames=Book.get_fields(), fts_fields=['title', 'author'], indexed_fields=['year']
+    )
+    yield manager
+    manager.close()
+    remove_files(TEST_DB_FILE)
+
+
+@pytest.fixture
+def binary_manager():
+    """Фикстура для создания BinaryDataManager с тестовыми данными."""
+    TEST_BIN_FILE = 'data/test_data.bin'
+    manager = BinaryDataManager(path=TEST_BIN_FILE, initial_capacity=2)
+    yield manager
+    manager.close()
+    remove_files(TEST_BIN_FILE)
 
 
 @pytest.fixture
@@ -34,4 +142,6 @@ def book_models() -> list[Book]:
 
 @pytest.fixture
 def console(csv_manager: CSVDataManager) -> BookConsoleService:
-    return BookConsoleService(csv_manager)
+    console = BookConsoleService(csv_manager)
+    console.use_colors = False
+    return console
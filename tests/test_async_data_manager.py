@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from core.async_managers import ThreadPoolDataManager
+from core.data_types import Book
+from core.exceptions import IDErorr
+from core.managers import CSVDataManager
+
+
+def test_crud(csv_manager: CSVDataManager, book_models: list[Book]):
+    """Тест того, что адаптер выполняет операции хранилища и пробрасывает его ошибки."""
+
+    async def run() -> None:
+        async with ThreadPoolDataManager(csv_manager) as manager:
+            await manager.create(book_models)
+            await manager.udate(1, Book(title='Updated Book', author='Author A', year=2023))
+            assert (await manager.read_detail(1))['title'] == 'Updated Book'
+            assert [obj['id'] for obj in await manager.search('author', 'author b')] == ['2']
+            assert [obj['id'] for obj in await manager.search_range('year', 2020, 2023)] == ['1']
+            await manager.delete(2)
+            assert len(await manager.read_list()) == 1
+            with pytest.raises(IDErorr):
+                await manager.read_detail(2)
+
+    asyncio.run(run())
+
+
+def test_concurrent_creates(csv_manager: CSVDataManager):
+    """Тест того, что одновременные запросы из разных задач не выдают одинаковые id."""
+
+    async def run() -> list[int]:
+        async with ThreadPoolDataManager(csv_manager, max_workers=8) as manager:
+            books = [Book(title=f'Book {number}', author='Author', year=2000) for number in range(40)]
+            created = await asyncio.gather(*(manager.create(book) for book in books))
+        return sorted(obj['id'] for obj in created)
+
+    assert asyncio.run(run()) == list(range(1, 41))
+    assert len(csv_manager.read_list()) == 40
+
+
+def test_iter_chunks(csv_manager: CSVDataManager):
+    """Тест ленивой выборки пачками из пула потоков."""
+    csv_manager.create([Book(title=f'Book {number}', author='Author', year=2000) for number in range(1, 8)])
+
+    async def run() -> tuple[list[str], list[str]]:
+        async with ThreadPoolDataManager(csv_manager, chunk_size=2) as manager:
+            page = [obj['id'] async for obj in manager.iter_list(offset=2, limit=3)]
+            found = [obj['title'] async for obj in manager.iter_search('title', 'book 1')]
+        return page, found
+
+    assert asyncio.run(run()) == (['3', '4', '5'], ['Book 1'])
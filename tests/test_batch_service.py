@@ -0,0 +1,124 @@
+import json
+from io import StringIO
+from unittest.mock import Mock
+
+import pytest
+
+from core.batch import BookBatchService
+from core.data_types import Book
+from core.managers import CSVDataManager
+
+
+def run_commands(manager: CSVDataManager, *commands: dict | str) -> tuple[int, list[dict]]:
+    source = StringIO('\n'.join(command if isinstance(command, str) else json.dumps(command) for command in commands))
+    output = StringIO()
+    errors = BookBatchService(manager, source, output)()
+    return errors, [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_commands(csv_manager: CSVDataManager):
+    """Тест выполнения команд и машиночитаемого вывода результатов."""
+    errors, results = run_commands(
+        csv_manager,
+        {'command': 'add', 'title': 'Book 1', 'author': 'Author A', 'year': 2020},
+        {'command': 'add', 'title': 'Book 2', 'author': 'Author B', 'year': '2024'},
+        {'command': 'status', 'id': 1, 'status': 'Выдана'},
+        {'command': 'get', 'id': 1},
+        {'command': 'search', 'field': 'author', 'value': 'author b'},
+        {'command': 'range', 'start': 2021, 'end': 2024},
+        {'command': 'delete', 'id': 2},
+        {'command': 'list'},
+    )
+    assert errors == 0
+    assert all(result['ok'] for result in results)
+    assert [result['line'] for result in results] == list(range(1, 9))
+    assert results[0]['result']['id'] == 1
+    assert results[3]['result']['status'] == 'Выдана'
+    assert [obj['id'] for obj in results[4]['result']] == ['2']
+    assert [obj['id'] for obj in results[5]['result']] == ['2']
+    assert [obj['id'] for obj in results[7]['result']] == ['1']
+
+
+def test_errors(csv_manager: CSVDataManager):
+    """Тест того, что ошибочные команды попадают в вывод и не прерывают обработку."""
+    errors, results = run_commands(
+        csv_manager,
+        '{"command": "get"',
+        {'command': 'unknown'},
+        {'command': 'add', 'title': 'Book 1', 'author': 'Author A'},
+        {'command': 'get', 'id': 'one'},
+        {'command': 'delete', 'id': 5},
+        {'command': 'add', 'title': 'Book 1', 'author': 'Author A', 'year': 2020},
+    )
+    assert errors == 5
+    assert [result['ok'] for result in results] == [False] * 5 + [True]
+    assert results[0]['error'].startswith('Некорректный JSON')
+    assert results[1]['error'] == 'Неизвестная команда `unknown`.'
+    assert results[2]['error'] == 'Не заполнено поле `year`.'
+    assert results[3]['error'] == 'Поле `id` должно быть числом.'
+    assert results[4]['error'] == 'ID 5 не существует.'
+
+
+def test_unexpected_errors(csv_manager: CSVDataManager, monkeypatch: pytest.MonkeyPatch):
+    """Тест того, что команда неверного типа и непредвиденное исключение не прерывают обработку."""
+    csv_manager.create(Book(title='Book 1', author='Author A', year=2020))
+    monkeypatch.setattr(csv_manager, 'delete', Mock(side_effect=RuntimeError('disk failure')))
+    errors, results = run_commands(
+        csv_manager,
+        {'command': []},
+        {'command': 'delete', 'id': 1},
+        {'command': 'get', 'id': 1},
+    )
+    assert errors == 2
+    assert [result['line'] for result in results] == [1, 2, 3]
+    assert results[0]['error'] == 'Неизвестная команда `[]`.'
+    assert results[1]['error'] == 'Внутренняя ошибка: RuntimeError: disk failure.'
+    assert results[2]['result']['title'] == 'Book 1'
+
+
+def test_fuzzy_command(csv_manager: CSVDataManager):
+    """Тест команды поиска с опечатками."""
+    errors, results = run_commands(
+        csv_manager,
+        {'command': 'add', 'title': 'Война и мир', 'author': 'Лев Толстой', 'year': 1869},
+        {'command': 'fuzzy', 'field': 'author', 'value': 'Толстои', 'limit': 1},
+    )
+    assert errors == 0
+    assert [obj['id'] for obj in results[1]['result']] == ['1']
+
+
+def test_query_command(csv_manager: CSVDataManager):
+    """Тест команды составного запроса."""
+    errors, results = run_commands(
+        csv_manager,
+        {'command': 'add', 'title': 'Book 1', 'author': 'Author A', 'year': 2020},
+        {'command': 'add', 'title': 'Book 2', 'author': 'Author A', 'year': 2024},
+        {
+            'command': 'query',
+            'where': [
+                {'field': 'author', 'op': 'eq', 'value': 'author a'},
+                {'field': 'year', 'op': 'range', 'start': 2021},
+            ],
+        },
+        {'command': 'query', 'where': {'field': 'year'}},
+    )
+    assert errors == 1
+    assert [obj['id'] for obj in results[2]['result']] == ['2']
+    assert results[3]['error'] == 'Поле `where` должно быть списком условий.'
+
+
+def test_bulk_commands(csv_manager: CSVDataManager):
+    """Тест пакетных команд изменения статуса и удаления."""
+    errors, results = run_commands(
+        csv_manager,
+        *({'command': 'add', 'title': f'Book {i}', 'author': 'Author', 'year': 2020} for i in range(1, 4)),
+        {'command': 'status_many', 'ids': [1, 3], 'status': 'Выдана'},
+        {'command': 'delete_many', 'ids': [2, 5]},
+        {'command': 'delete_many', 'ids': ['x']},
+        {'command': 'delete_many', 'ids': [2]},
+    )
+    assert errors == 2
+    assert [obj['status'] for obj in results[3]['result']] == ['Выдана', 'Выдана']
+    assert results[4]['error'] == 'ID 5 не существует.'
+    assert results[5]['error'] == 'Поле `ids` должно быть числом.'
+    assert [obj['id'] for obj in csv_manager.read_list()] == ['1', '3']
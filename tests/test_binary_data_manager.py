@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+from core.binary_manager import BinaryDataManager
+from core.data_types import Book
+from core.exceptions import IDErorr
+from core.managers import CSVDataManager
+
+
+def test_create_and_read(binary_manager: BinaryDataManager, book_models: list[Book]):
+    """Тест создания записей с ростом файла и чтения по id."""
+    binary_manager.create(book_models)
+    result = binary_manager.create(Book(title='Война и мир', author='Лев Толстой', year=1869))
+    assert isinstance(result, dict)
+    assert result['id'] == 3
+    assert binary_manager.read_detail(3) == {
+        'id': 3,
+        'title': 'Война и мир',
+        'author': 'Лев Толстой',
+        'year': 1869,
+        'status': 'В наличии',
+    }
+    assert [obj['id'] for obj in binary_manager.read_list()] == [1, 2, 3]
+    assert [obj['id'] for obj in binary_manager.iter_list(1, 1)] == [2]
+
+
+def test_persisted(binary_manager: BinaryDataManager, book_models: list[Book]):
+    """Тест повторного открытия файла."""
+    binary_manager.create(book_models)
+    binary_manager.close()
+    reopened = BinaryDataManager(path=binary_manager.path)
+    assert reopened.count == 2
+    assert reopened.read_detail(2)['title'] == 'Book 2'
+    reopened.close()
+
+
+def test_status_update_in_place(binary_manager: BinaryDataManager, book_models: list[Book]):
+    """Тест изменения статуса записью одного байта на месте."""
+    binary_manager.create(book_models)
+    with open(binary_manager.path, mode='rb') as file:
+        before = file.read()
+    binary_manager.udate(2, Book(title='Book 2', author='Author B', year=2024, status='Выдана'))
+    binary_manager.map.flush()
+    with open(binary_manager.path, mode='rb') as file:
+        after = file.read()
+    assert len(before) == len(after)
+    assert sum(a != b for a, b in zip(before, after)) == 1
+    assert binary_manager.read_detail(2)['status'] == 'Выдана'
+    binary_manager.udate(1, Book(title='Updated Book', author='Author A', year=2020))
+    assert binary_manager.read_detail(1)['title'] == 'Updated Book'
+
+
+def test_delete(binary_manager: BinaryDataManager, book_models: list[Book]):
+    """Тест удаления записи."""
+    binary_manager.create(book_models)
+    assert binary_manager.delete(1)['title'] == 'Book 1'
+    assert [obj['id'] for obj in binary_manager.read_list()] == [2]
+    for id in (1, 3, 0):
+        with pytest.raises(IDErorr, match=f'ID {id} не существует'):
+            binary_manager.read_detail(id)
+
+
+def test_search(binary_manager: BinaryDataManager, book_models: list[Book]):
+    """Тест поиска по полю и по диапазону."""
+    binary_manager.create(book_models + [Book(title='Another Book', author='Author A', year=1999)])
+    assert [obj['id'] for obj in binary_manager.search('author', 'author a')] == [1, 3]
+    assert [obj['id'] for obj in binary_manager.search_range('year', 1990, 2000)] == [3]
+    with pytest.raises(ValueError, match='Поля some_field нет в файле.'):
+        binary_manager.search(field='some_field', value='Test')
+
+
+def test_too_long_title(binary_manager: BinaryDataManager):
+    """Тест отказа сохранять слишком длинное название."""
+    with pytest.raises(ValueError, match='не должно превышать 192 байт'):
+        binary_manager.create(Book(title='Ж' * 100, author='Автор', year=2000))
+    assert binary_manager.count == 0
+
+
+def test_invalid_file():
+    """Тест открытия файла другого формата."""
+    path = 'data/test_invalid.bin'
+    with open(path, mode='wb') as file:
+        file.write(b'not a library file')
+    try:
+        with pytest.raises(ValueError, match='не является файлом библиотеки'):
+            BinaryDataManager(path=path)
+    finally:
+        os.remove(path)
+
+
+def test_migrate(binary_manager: BinaryDataManager, csv_manager: CSVDataManager, book_models: list[Book]):
+    """Тест переноса данных из CSV с сохранением id."""
+    csv_manager.create(book_models + [Book(title='Book 3', author='Author C', year=1999)])
+    csv_manager.delete(2)
+    assert binary_manager.migrate(csv_manager) == 2
+    assert binary_manager.migrate(csv_manager) == 0
+    assert [obj['id'] for obj in binary_manager.read_list()] == [1, 3]
+    result = binary_manager.create(Book(title='Book 4', author='Author D', year=2000))
+    assert isinstance(result, dict)
+    assert result['id'] == 4
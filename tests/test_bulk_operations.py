@@ -0,0 +1,86 @@
+from unittest.mock import Mock
+
+import pytest
+
+from core.console import BookConsoleService
+from core.constants import BOOKS_STATUS_UPDATE, MAX_BOOK_IDS
+from core.data_types import Book
+from core.exceptions import IDErorr
+from core.interfaces import DataManager
+from core.managers import CSVDataManager
+
+MANAGERS = [
+    'csv_manager',
+    'cached_manager',
+    'log_manager',
+    'journaled_manager',
+    'indexed_manager',
+    'sharded_manager',
+    'sqlite_manager',
+]
+
+
+def get_books(count: int) -> list[Book]:
+    return [Book(title=f'Book {i}', author=f'Author {i}', year=2000 + i) for i in range(1, count + 1)]
+
+
+@pytest.mark.parametrize('name', MANAGERS)
+def test_bulk_operations(name: str, request: pytest.FixtureRequest):
+    """Тест пакетных чтения, изменения и удаления и того, что отсутствующий ID не меняет ни одну запись."""
+    manager: DataManager = request.getfixturevalue(name)
+    manager.create(get_books(5))
+    before = manager.read_list()
+    with pytest.raises(IDErorr, match='ID 7 не существует.'):
+        manager.udate_many({1: Book(title='New', author='Author', year=2000), 7: get_books(1)[0]})
+    with pytest.raises(IDErorr, match='ID 7 не существует.'):
+        manager.delete_many([2, 7])
+    assert manager.read_list() == before
+    given = {id: Book(title=f'Book {id}', author=f'Author {id}', year=2000 + id, status='Выдана') for id in (4, 1)}
+    assert [(str(obj['id']), obj['status']) for obj in manager.udate_many(given)] == [('4', 'Выдана'), ('1', 'Выдана')]
+    assert [str(obj['id']) for obj in manager.delete_many([5, 2])] == ['5', '2']
+    assert [obj['status'] for obj in manager.read_many([1, 3, 4])] == ['Выдана', 'В наличии', 'Выдана']
+    assert [str(obj['id']) for obj in manager.read_list()] == ['1', '3', '4']
+    with pytest.raises(IDErorr):
+        manager.read_many([3, 5])
+
+
+def test_update_many_rewrites_once(csv_manager: CSVDataManager, monkeypatch: pytest.MonkeyPatch):
+    """Тест того, что пакетное изменение переписывает файл один раз."""
+    csv_manager.create(get_books(4))
+    writes = []
+    write = csv_manager._write
+
+    def count_write(data: dict) -> None:
+        writes.append(data)
+        write(data)
+
+    monkeypatch.setattr(csv_manager, '_write', count_write)
+    csv_manager.udate_many({id: Book(title='New', author='Author', year=2000) for id in (1, 2, 3)})
+    csv_manager.delete_many([1, 4])
+    assert len(writes) == 2
+
+
+def test_get_ids(console: BookConsoleService):
+    """Тест разбора списка и диапазонов ID."""
+    assert console.get_ids('3, 1,5-7,6') == [3, 1, 5, 6, 7]
+    for value in ('1,,2', '5-3', 'a-b', '1-'):
+        with pytest.raises(ValueError, match='ID должны быть числами или диапазонами'):
+            console.get_ids(value)
+    assert len(console.get_ids(f'1-{MAX_BOOK_IDS}')) == MAX_BOOK_IDS
+    assert len(console.get_ids(f'1-{MAX_BOOK_IDS},1-{MAX_BOOK_IDS},{MAX_BOOK_IDS}')) == MAX_BOOK_IDS
+    for value in (f'1-{MAX_BOOK_IDS + 1}', '1-1000000000', f'0,1-{MAX_BOOK_IDS}'):
+        with pytest.raises(ValueError, match=f'не больше {MAX_BOOK_IDS} ID'):
+            console.get_ids(value)
+
+
+def test_change_status_many(console: BookConsoleService, csv_manager: CSVDataManager):
+    """Тест изменения статуса нескольких книг из меню."""
+    csv_manager.create(get_books(4))
+    csv_manager.udate(2, Book(title='Book 2', author='Author 2', year=2002, status='Выдана'))
+    console.input = Mock(side_effect=['1-3', '2'])  # type: ignore[method-assign]
+    console.handle_action('7')
+    assert [obj['status'] for obj in csv_manager.read_list()] == ['Выдана', 'Выдана', 'Выдана', 'В наличии']
+    assert console.buffer[-1].endswith(BOOKS_STATUS_UPDATE.format(status='Выдана', changed='1, 3', skipped='2'))
+    console.input = Mock(side_effect=['1,9'])  # type: ignore[method-assign]
+    with pytest.raises(IDErorr):
+        console.change_status_many()
@@ -0,0 +1,66 @@
+import os
+
+from core.data_types import Book
+from core.managers import CachedCSVDataManager, CSVDataManager
+
+
+def test_read_uses_cache(cached_manager: CachedCSVDataManager, book_models: list[Book]):
+    """Тест чтения из кэша без повторного разбора файла."""
+    cached_manager.create(book_models)
+    stamp = cached_manager._stamp
+    cache = cached_manager._cache
+    assert cached_manager.read_detail(2)['title'] == 'Book 2'
+    assert len(cached_manager.read_list()) == 2
+    assert cached_manager._stamp == stamp
+    assert cached_manager._cache is cache
+
+
+def test_read_returns_copies(cached_manager: CachedCSVDataManager, book_model: Book):
+    """Тест того, что изменение результата не портит кэш."""
+    cached_manager.create(book_model)
+    cached_manager.read_detail(1).pop('title')
+    cached_manager.read_list()[0]['author'] = 'Other'
+    assert cached_manager.read_detail(1)['title'] == 'Test Book'
+    assert cached_manager.read_detail(1)['author'] == 'Author 1'
+
+
+def test_mutations_match_file(cached_manager: CachedCSVDataManager, book_models: list[Book]):
+    """Тест того, что кэш после изменений совпадает с содержимым файла."""
+    cached_manager.create(book_models)
+    cached_manager.udate(1, Book(title='Updated Book', author='Updated Author', year=2023, status='Выдана'))
+    cached_manager.delete(2)
+    plain_manager = CSVDataManager(path=cached_manager.path, fieldnames=Book.get_fields())
+    assert cached_manager.read_list() == plain_manager.read_list()
+    assert cached_manager.read_detail(1)['year'] == '2023'
+
+
+def test_reload_on_external_change(cached_manager: CachedCSVDataManager, book_model: Book):
+    """Тест перечитывания файла, если его изменил другой процесс."""
+    cached_manager.create(book_model)
+    other_manager = CSVDataManager(path=cached_manager.path, fieldnames=Book.get_fields())
+    other_manager.create(Book(title='External Book', author='Author X', year=2000))
+    assert os.path.getsize(cached_manager.path) > 0
+    assert [obj['title'] for obj in cached_manager.search('title', 'book')] == ['Test Book', 'External Book']
+    result = cached_manager.create(book_model)
+    assert isinstance(result, dict)
+    assert result['id'] == 3
+
+
+def test_iter_list_returns_copies(cached_manager: CachedCSVDataManager, book_models: list[Book]):
+    """Тест постраничного чтения из кэша."""
+    cached_manager.create(book_models)
+    page = list(cached_manager.iter_list(1, 1))
+    assert [obj['id'] for obj in page] == ['2']
+    page[0]['title'] = 'Changed'
+    assert cached_manager.read_detail(2)['title'] == 'Book 2'
+
+
+def test_iter_list_during_changes(cached_manager: CachedCSVDataManager, book_models: list[Book]):
+    """Тест того, что обход кэша не прерывается, если во время него добавляют и удаляют записи."""
+    cached_manager.create(book_models)
+    rows = cached_manager.iter_list()
+    assert next(rows)['id'] == '1'
+    cached_manager.create(Book(title='Book 3', author='Author C', year=2000))
+    cached_manager.delete(2)
+    assert [obj['id'] for obj in rows] == ['2']
+    assert [obj['id'] for obj in cached_manager.iter_list()] == ['1', '3']
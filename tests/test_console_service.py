@@ -4,11 +4,25 @@ from unittest.mock import Mock
 import pytest
 
 from core.console import BookConsoleService
-from core.constants import BOOK_ADD, BOOK_DELETE, BOOK_GET, BOOK_UPDATE, ERORR_CHOISE, MENU
+from core.constants import (
+    BOOK_ADD,
+    BOOK_DELETE,
+    BOOK_GET,
+    BOOK_LIST,
+    BOOK_UPDATE,
+    ERORR_CHOISE,
+    MENU,
+    MENU_PAGE,
+    PAGE_SIZE,
+)
 from core.data_types import Book, Status, TextFormat
 from core.managers import CSVDataManager
 
 
+def book_fields(number: int) -> dict:
+    return {'title': f'Book {number}', 'author': 'Author', 'year': '2000', 'status': Status.IN_STOCK.value}
+
+
 def test_is_correct_menu_intenger_valide(console: BookConsoleService):
     """Проверяет корректную обработку допустимого значения меню."""
     assert console.is_correct_menu_intenger('1', MENU) is True
@@ -71,7 +85,7 @@ def test_add_book_invalid_year(console: BookConsoleService):
 
 def test_get_list_empty(console: BookConsoleService, csv_manager: CSVDataManager):
     """Проверяет вывод сообщения при отсутствии записей."""
-    csv_manager.read_list = Mock(return_value=[])  # type: ignore[method-assign]
+    csv_manager.iter_list = Mock(return_value=iter([]))  # type: ignore[method-assign]
     console.write = Mock()  # type: ignore[method-assign]
     console.get_list()
     console.write.assert_called_with('\nПо вашему запросу ничего не найдено.', TextFormat.YELLOW)
@@ -80,10 +94,38 @@ def test_get_list_empty(console: BookConsoleService, csv_manager: CSVDataManager
 def test_get_list_with_data(console: BookConsoleService, csv_manager: CSVDataManager, book_model: Book):
     """Проверяет корректный вывод списка книг."""
     model_dict = {'id': 1} | book_model.to_dict()
-    csv_manager.read_list = Mock(return_value=[model_dict, model_dict, model_dict])  # type: ignore[method-assign]
+    csv_manager.iter_list = Mock(return_value=iter([model_dict, model_dict, model_dict]))  # type: ignore[method-assign]
+    console.write = Mock()  # type: ignore[method-assign]
+    console.get_list()
+    csv_manager.iter_list.assert_called_once_with(0, PAGE_SIZE + 1)
+    assert console.write.call_count == 2
+    assert console.buffer == [BOOK_LIST.format(**model_dict)] * 3
+
+
+def test_get_list_pages(console: BookConsoleService, csv_manager: CSVDataManager):
+    """Проверяет постраничный вывод с переходом на следующую и предыдущую страницу."""
+    csv_manager.create([Book(title=f'Book {i}', author='Author', year=2000) for i in range(PAGE_SIZE + 5)])
+    csv_manager.iter_list = Mock(wraps=csv_manager.iter_list)  # type: ignore[method-assign]
+    console.input = Mock(side_effect=['1', '2', 'q'])  # type: ignore[method-assign]
     console.write = Mock()  # type: ignore[method-assign]
     console.get_list()
-    assert console.write.call_count == 5
+    assert [call.args for call in csv_manager.iter_list.call_args_list] == [
+        (0, PAGE_SIZE + 1),
+        (PAGE_SIZE, PAGE_SIZE + 1),
+        (0, PAGE_SIZE + 1),
+    ]
+    console.write.assert_any_call(MENU_PAGE.format(2), TextFormat.BLUE)
+    assert BOOK_LIST.format(id=PAGE_SIZE + 5, **book_fields(PAGE_SIZE + 4)) in console.buffer
+
+
+def test_search_book_pages(console: BookConsoleService, csv_manager: CSVDataManager):
+    """Проверяет постраничный вывод результатов поиска."""
+    csv_manager.create([Book(title=f'Book {i}', author='Author', year=2000) for i in range(PAGE_SIZE + 1)])
+    console.input = Mock(side_effect=['1', 'Book', '1', 'q'])  # type: ignore[method-assign]
+    console.write = Mock()  # type: ignore[method-assign]
+    console.search_book()
+    books = [line for line in console.buffer if line.startswith('|')]
+    assert len(books) == PAGE_SIZE + 1
 
 
 def test_request_id_valid(console: BookConsoleService):
@@ -131,3 +173,56 @@ def test_delete_book_valid(console: BookConsoleService, csv_manager: CSVDataMana
     console.write = Mock()  # type: ignore[method-assign]
     console.delete_book()
     console.write.assert_called_with(BOOK_DELETE.format(**model_dict), TextFormat.GREEN)
+
+
+def test_search_book_range(console: BookConsoleService, csv_manager: CSVDataManager, book_model: Book):
+    """Проверяет поиск книг по диапазону годов издания."""
+    model_dict = {'id': 1} | book_model.to_dict()
+    csv_manager.search_range = Mock(return_value=[model_dict])  # type: ignore[method-assign]
+    console.input = Mock(side_effect=['4', '1990', '2024'])  # type: ignore[method-assign]
+    console.write = Mock()  # type: ignore[method-assign]
+    console.search_book()
+    csv_manager.search_range.assert_called_with('year', 1990, 2024)
+    assert console.write.call_count == 3
+    assert console.buffer == [BOOK_LIST.format(**model_dict)]
+
+
+def test_search_book_range_invalid(console: BookConsoleService):
+    """Проверяет вызов исключения при нечисловой границе диапазона."""
+    console.input = Mock(side_effect=['4', 'abc'])  # type: ignore[method-assign]
+    console.write = Mock()  # type: ignore[method-assign]
+    with pytest.raises(ValueError, match='Границы диапазона должны быть числами.'):
+        console.search_book()
+
+
+def test_write_is_buffered(console: BookConsoleService, capsys: pytest.CaptureFixture):
+    """Проверяет, что вывод копится в буфере и печатается одним вызовом."""
+    console.write('Книги:')
+    console.write_many(['| 1 |', '| 2 |'])
+    assert capsys.readouterr().out == ''
+    console.flush()
+    assert capsys.readouterr().out == 'Книги:\n| 1 |\n| 2 |\n'
+    assert console.buffer == []
+
+
+def test_write_colors(console: BookConsoleService):
+    """Проверяет, что цвета выводятся только в терминал."""
+    console.use_colors = True
+    console.write('text', TextFormat.RED)
+    console.write_many(['a', 'b'], TextFormat.GREEN, bold=False)
+    reset = TextFormat.RESET.value
+    assert console.buffer == [
+        f'{TextFormat.BOLD.value}{TextFormat.RED.value}text{reset}',
+        f'{TextFormat.GREEN.value}a{reset}',
+        f'{TextFormat.GREEN.value}b{reset}',
+    ]
+
+
+def test_search_book_fuzzy(console: BookConsoleService, csv_manager: CSVDataManager):
+    """Проверяет поиск книг с опечатками."""
+    csv_manager.create([Book(title='Война и мир', author='Лев Толстой', year=1869)])
+    console.input = Mock(side_effect=['6', 'толстои'])  # type: ignore[method-assign]
+    console.write = Mock()  # type: ignore[method-assign]
+    console.search_book()
+    book_dict = {'id': 1, 'title': 'Война и мир', 'author': 'Лев Толстой', 'year': 1869, 'status': 'В наличии'}
+    assert console.buffer == [BOOK_LIST.format(**book_dict)]
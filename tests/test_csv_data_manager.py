@@ -1,3 +1,6 @@
+import os
+from glob import glob
+
 import pytest
 
 from core.data_types import Book, ModelDict
@@ -110,3 +113,70 @@ def test_is_csv():
     """Тест проверки расширения файла."""
     with pytest.raises(ValueError, match='Файл data/test_data.txt не является CSV файлом.'):
         CSVDataManager(path='data/test_data.txt', fieldnames=['title', 'author'])
+
+
+def test_iter_list_pages(csv_manager: CSVDataManager):
+    """Тест постраничного чтения записей."""
+    csv_manager.create([Book(title=f'Book {i}', author='Author', year=2024) for i in range(1, 6)])
+    assert [obj['id'] for obj in csv_manager.iter_list(0, 2)] == ['1', '2']
+    assert [obj['id'] for obj in csv_manager.iter_list(4, 2)] == ['5']
+    assert [obj['id'] for obj in csv_manager.iter_list(2)] == ['3', '4', '5']
+
+
+def test_iter_search_pages(csv_manager: CSVDataManager, book_models: list[Book]):
+    """Тест постраничного поиска записей."""
+    csv_manager.create(book_models + [Book(title='Another Book', author='Author A', year=2024)])
+    assert [obj['title'] for obj in csv_manager.iter_search('author', 'author a', 1, 5)] == ['Another Book']
+    with pytest.raises(ValueError, match='Поля some_field нет в файле.'):
+        csv_manager.iter_search(field='some_field', value='Test')
+
+
+def test_write_is_atomic(csv_manager: CSVDataManager, book_models: list[Book]):
+    """Тест того, что сбой во время перезаписи оставляет прежний файл целым."""
+    csv_manager.create(book_models)
+    with open(csv_manager.path) as file:
+        content = file.read()
+    with pytest.raises(ValueError):
+        csv_manager._write({1: {'unknown': 'value'}})
+    with open(csv_manager.path) as file:
+        assert file.read() == content
+    assert not glob(f'{csv_manager.path}.*.tmp')
+
+
+def test_parallel_search(csv_manager: CSVDataManager):
+    """Тест параллельного поиска по диапазонам файла в пуле процессов."""
+    csv_manager.create(
+        [Book(title=f'Book {i}\n"part", two' if i % 3 else f'Other {i}', author='Author', year=2000) for i in range(30)]
+    )
+    expected = csv_manager.search('title', 'book')
+    csv_manager.parallel_threshold, csv_manager.search_workers = 0, 3
+    ranges = csv_manager._split_ranges(3)
+    assert len(ranges) == 3
+    assert ranges[0][0] == 0 and ranges[-1][1] == os.path.getsize(csv_manager.path)
+    try:
+        assert [obj['id'] for obj in csv_manager.iter_search('title', 'book', 2, 3)] == ['5', '6', '8']
+        assert csv_manager._search_pool is None
+        assert list(csv_manager.iter_search('title', 'book')) == expected
+        assert csv_manager._search_pool is not None
+        assert csv_manager.search('title', 'book') == expected
+    finally:
+        csv_manager.close()
+    assert len(expected) == 20
+    assert [obj['id'] for obj in expected] == sorted((obj['id'] for obj in expected), key=int)
+
+
+def test_startup_uses_meta(csv_manager: CSVDataManager, book_models: list[Book], monkeypatch: pytest.MonkeyPatch):
+    """Тест запуска по метаданным без чтения файла и полного прохода при несовпадении отпечатка."""
+    csv_manager.create(book_models)
+    csv_manager.create(Book(title='Book 3', author='Author C', year=2024))
+    csv_manager.delete(1)
+    reads = []
+    monkeypatch.setattr(CSVDataManager, '_scan', lambda self: reads.append(self.path))
+    manager = CSVDataManager(path=csv_manager.path, fieldnames=Book.get_fields())
+    assert (manager.max_id, manager.row_count) == (3, 2)
+    assert not reads
+    monkeypatch.undo()
+    with open(csv_manager.path, mode='a', encoding='utf-8') as file:
+        file.write('7,Book 7,Author D,2024,В наличии\n')
+    manager = CSVDataManager(path=csv_manager.path, fieldnames=Book.get_fields())
+    assert (manager.max_id, manager.row_count) == (7, 3)
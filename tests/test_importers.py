@@ -0,0 +1,97 @@
+import json
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from core.data_types import Book
+from core.importers import BulkImporter
+from core.managers import CSVDataManager
+
+TEST_SOURCE_FILE = 'data/test_import'
+
+
+@pytest.fixture
+def csv_source():
+    path = f'{TEST_SOURCE_FILE}.csv'
+    with open(path, mode='w', encoding='utf-8') as file:
+        file.write('title,author,year,status\n')
+        file.write('Война и мир,Лев Толстой,1869,\n')
+        file.write(',Автор,2000,\n')
+        file.write('Книга,Автор,3000,\n')
+        file.write('"Книга, том 2",Автор,2001,Выдана\n')
+        file.write('Книга,Автор,2001,Потеряна\n')
+    yield path
+    os.remove(path)
+
+
+@pytest.fixture
+def jsonl_source():
+    path = f'{TEST_SOURCE_FILE}.jsonl'
+    rows = [{'title': f'Book {i}', 'author': 'Author', 'year': 2000 + i} for i in range(5)]
+    with open(path, mode='w', encoding='utf-8') as file:
+        file.writelines(json.dumps(row) + '\n' for row in rows)
+        file.write('{broken\n')
+        file.write(json.dumps({'title': 'No author', 'year': 2000}) + '\n')
+    yield path
+    os.remove(path)
+
+
+def test_import_csv(csv_manager: CSVDataManager, csv_source: str):
+    """Тест импорта CSV с отклонением некорректных строк."""
+    report = BulkImporter(csv_manager).run(csv_source)
+    assert report.created == 2
+    assert [number for number, _ in report.rejects] == [3, 4, 6]
+    assert report.rejects[0][1] == 'Не заполнено поле `title`.'
+    assert 'Год издания' in report.rejects[1][1]
+    assert 'status' in report.rejects[2][1]
+    books = csv_manager.read_list()
+    assert [book['title'] for book in books] == ['Война и мир', 'Книга, том 2']
+    assert [book['status'] for book in books] == ['В наличии', 'Выдана']
+
+
+def test_import_jsonl_in_batches(csv_manager: CSVDataManager, jsonl_source: str):
+    """Тест импорта JSONL пачками с одним вычислением границ на пачку."""
+    with patch.object(Book, 'get_bounds', wraps=Book.get_bounds) as get_bounds:
+        with patch.object(csv_manager, 'create', wraps=csv_manager.create) as create:
+            report = BulkImporter(csv_manager, batch_size=3).run(jsonl_source)
+    assert report.created == 5
+    assert [number for number, _ in report.rejects] == [6, 7]
+    assert report.rejects[0][1].startswith('Некорректный JSON')
+    assert report.rejects[1][1] == 'Не заполнено поле `author`.'
+    assert get_bounds.call_count == 3
+    assert [len(call.args[0]) for call in create.call_args_list] == [3, 2]
+    assert [book['id'] for book in csv_manager.read_list()] == ['1', '2', '3', '4', '5']
+
+
+def test_import_rejects_year_types(csv_manager: CSVDataManager):
+    """Тест отклонения года неверного типа без прерывания импорта."""
+    path = f'{TEST_SOURCE_FILE}.jsonl'
+    with open(path, mode='w', encoding='utf-8') as file:
+        for year in ([1999], True, 1999.7, 1999.0, 2001):
+            file.write(json.dumps({'title': 'Книга', 'author': 'Автор', 'year': year}) + '\n')
+    try:
+        report = BulkImporter(csv_manager).run(path)
+    finally:
+        os.remove(path)
+    assert report.created == 2
+    assert [number for number, _ in report.rejects] == [1, 2, 3]
+    assert all('Год издания' in error for _, error in report.rejects)
+    assert [book['year'] for book in csv_manager.read_list()] == ['1999', '2001']
+
+
+def test_import_unknown_format(csv_manager: CSVDataManager):
+    """Тест отказа импортировать файл неизвестного формата."""
+    with pytest.raises(ValueError, match='должен быть в формате CSV или JSONL'):
+        BulkImporter(csv_manager).run('data/test_import.txt')
+
+
+def test_construct_skips_validation():
+    """Тест создания модели без валидации и последующей проверки с готовыми границами."""
+    book = Book.construct(title='Книга', author='Автор', year='2030')
+    assert book.status == 'В наличии'
+    book.validate_fields(max_year=2030)
+    assert book.year == 2030
+    with pytest.raises(ValueError, match=f'0-{datetime.now().year - 1}'):
+        Book.construct(title='Книга', author='Автор', year=2030).validate_fields(max_year=datetime.now().year - 1)
@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+from core.data_types import Book
+from core.managers import CSVDataManager, IndexedCSVDataManager
+
+
+def test_read_detail_by_offset(indexed_manager: IndexedCSVDataManager, book_models: list[Book]):
+    """Тест чтения одной записи по смещению из индекса."""
+    book_models.append(Book(title='Война и мир, "том 1"', author='Лев Толстой', year=1869))
+    indexed_manager.create(book_models)
+    plain_manager = CSVDataManager(path=indexed_manager.path, fieldnames=Book.get_fields())
+    for id in (1, 2, 3):
+        assert indexed_manager.read_detail(id) == plain_manager.read_detail(id)
+    assert indexed_manager.read_detail(3)['title'] == 'Война и мир, "том 1"'
+
+
+def test_index_maintained_on_mutations(indexed_manager: IndexedCSVDataManager, book_models: list[Book]):
+    """Тест обновления индекса при изменении и удалении записей."""
+    indexed_manager.create(book_models)
+    indexed_manager.udate(1, Book(title='Очень длинное новое название', author='Author A', year=2020))
+    indexed_manager.delete(2)
+    indexed_manager.create(Book(title='Book 3', author='Author C', year=2024))
+    assert indexed_manager.read_detail(1)['title'] == 'Очень длинное новое название'
+    assert indexed_manager.read_detail(3)['title'] == 'Book 3'
+    assert sorted(indexed_manager._offsets) == [1, 3]
+    reopened = IndexedCSVDataManager(path=indexed_manager.path, fieldnames=Book.get_fields())
+    assert reopened._offsets == indexed_manager._offsets
+
+
+def test_index_rebuilt_when_stale(indexed_manager: IndexedCSVDataManager, book_models: list[Book]):
+    """Тест перестроения индекса после изменения файла другим менеджером."""
+    indexed_manager.create(book_models)
+    plain_manager = CSVDataManager(path=indexed_manager.path, fieldnames=Book.get_fields())
+    plain_manager.delete(1)
+    plain_manager.create(Book(title='Book 3', author='Author C', year=2024))
+    assert indexed_manager.read_detail(3)['title'] == 'Book 3'
+    assert sorted(indexed_manager._offsets) == [2, 3]
+
+
+def test_index_rebuilt_when_missing(indexed_manager: IndexedCSVDataManager, book_models: list[Book]):
+    """Тест перестроения индекса, если файл индекса удален."""
+    indexed_manager.create(book_models)
+    os.remove(indexed_manager.index_path)
+    reopened = IndexedCSVDataManager(path=indexed_manager.path, fieldnames=Book.get_fields())
+    assert os.path.exists(reopened.index_path)
+    assert reopened.read_detail(2)['title'] == 'Book 2'
+
+
+def test_index_consistent_after_interrupted_append(
+    indexed_manager: IndexedCSVDataManager, book_models: list[Book], monkeypatch: pytest.MonkeyPatch
+):
+    """Тест того, что оборванная дозапись индекса не оставляет новый отпечаток без записей."""
+    indexed_manager.create(book_models)
+
+    def crash(fd: int) -> None:
+        raise OSError
+
+    monkeypatch.setattr(os, 'fsync', crash)
+    with pytest.raises(OSError):
+        indexed_manager.create(Book(title='Book 3', author='Author C', year=2024))
+    monkeypatch.undo()
+    reopened = IndexedCSVDataManager(path=indexed_manager.path, fieldnames=Book.get_fields())
+    assert reopened.read_detail(3)['title'] == 'Book 3'
@@ -0,0 +1,172 @@
+from unittest.mock import Mock
+
+import pytest
+
+from core.data_types import Book
+from core.indexes import SortedIndex, TrigramIndex
+from core.managers import CachedCSVDataManager, CSVDataManager
+
+
+def test_trigram_index_search():
+    """Тест поиска подстроки по триграммному индексу."""
+    index = TrigramIndex('title')
+    index.build({1: {'title': 'Война и мир'}, 2: {'title': 'Мир приключений'}, 3: {'title': 'Анна Каренина'}})
+    assert index.search('МИР') == [1, 2]
+    assert index.search('и мир') == [1]
+    assert index.search('нет такой') == []
+    assert index.search('ми') is None
+
+
+def test_trigram_index_incremental():
+    """Тест добавления и удаления записей в индексе."""
+    index = TrigramIndex('title')
+    index.add(1, {'title': 'Война и мир'})
+    index.add(2, {'title': 'Мир'})
+    index.remove(1, {'title': 'Война и мир'})
+    assert index.search('мир') == [2]
+    assert index.search('война') == []
+    assert 'вой' not in index.postings
+
+
+def test_search_uses_index(trigram_manager: CSVDataManager, book_models: list[Book]):
+    """Тест того, что результаты поиска по индексу совпадают с полным перебором."""
+    book_models.append(Book(title='Another Book', author='Author A', year=2024))
+    trigram_manager.create(book_models)
+    trigram_manager.udate(2, Book(title='Renamed', author='Author A', year=2024))
+    trigram_manager.delete(1)
+    plain_manager = CSVDataManager(path=trigram_manager.path, fieldnames=Book.get_fields())
+    for field, value in [('author', 'author a'), ('title', 'book'), ('title', 'ren'), ('title', 'Bo')]:
+        assert trigram_manager.search(field, value) == plain_manager.search(field, value)
+    assert [obj['id'] for obj in trigram_manager.search('author', 'Author A')] == ['2', '3']
+    for manager in (trigram_manager, plain_manager):
+        for offset, limit in ((-1, None), (0, -1)):
+            with pytest.raises(ValueError, match='не могут быть отрицательными'):
+                manager.iter_search('title', 'book', offset, limit)
+
+
+def test_index_persisted(trigram_manager: CSVDataManager, book_models: list[Book]):
+    """Тест загрузки сохраненного индекса без перестроения."""
+    trigram_manager.create(book_models)
+    trigram_manager.close()
+    index = TrigramIndex('title')
+    reopened = CSVDataManager(path=trigram_manager.path, fieldnames=Book.get_fields(), indexes=[index])
+    assert reopened._indexes_dirty is False
+    assert index.keys == {1: 'book 1', 2: 'book 2'}
+    assert [obj['title'] for obj in reopened.search('title', 'book 2')] == ['Book 2']
+
+
+@pytest.mark.parametrize('name', ['trigram_manager', 'indexed_manager'])
+def test_read_many_without_full_read(name: str, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """Тест того, что записи по списку id читаются без разбора всего файла, в том числе многострочные."""
+    manager: CSVDataManager = request.getfixturevalue(name)
+    manager.create([Book(title=f'Book {i}', author='Author', year=2000) for i in range(1, 13)])
+    manager.udate(3, Book(title='Book "3"\nsecond line', author='Author', year=2000))
+    monkeypatch.setattr(manager, '_read', Mock(side_effect=AssertionError))
+    objects = manager._read_many([12, 3, 11, 20])
+    assert [obj['title'] for obj in objects] == ['Book 12', 'Book "3"\nsecond line', 'Book 11']
+    monkeypatch.setattr(manager, '_iter_records', Mock(side_effect=AssertionError))
+    assert manager._read_many([]) == []
+
+
+@pytest.mark.parametrize('content', ['', '{"version": 1, "field": "ti', 'not json', '[1, 2]'])
+def test_index_rebuilt_after_broken_file(trigram_manager: CSVDataManager, book_models: list[Book], content: str):
+    """Тест перестроения индекса, если файл индекса обрезан или испорчен."""
+    trigram_manager.create(book_models)
+    trigram_manager.close()
+    with open(trigram_manager._get_index_path(trigram_manager.indexes[0]), mode='w', encoding='utf-8') as file:
+        file.write(content)
+    reopened = CSVDataManager(path=trigram_manager.path, fieldnames=Book.get_fields(), indexes=[TrigramIndex('title')])
+    assert reopened._indexes_dirty is True
+    assert [obj['title'] for obj in reopened.search('title', 'book 2')] == ['Book 2']
+
+
+def test_index_rebuilt_after_external_change(trigram_manager: CSVDataManager, book_models: list[Book]):
+    """Тест перестроения индекса, если файл изменили в обход менеджера."""
+    trigram_manager.create(book_models)
+    trigram_manager.close()
+    plain_manager = CSVDataManager(path=trigram_manager.path, fieldnames=Book.get_fields())
+    plain_manager.create(Book(title='External Book', author='Author X', year=2000))
+    assert [obj['id'] for obj in trigram_manager.search('title', 'book')] == ['1', '2', '3']
+    reopened = CachedCSVDataManager(
+        path=trigram_manager.path, fieldnames=Book.get_fields(), indexes=[TrigramIndex('title')]
+    )
+    assert reopened._indexes_dirty is True
+    assert [obj['title'] for obj in reopened.search('title', 'external')] == ['External Book']
+
+
+def test_sorted_index_range():
+    """Тест поиска по диапазону и подстроке значения в отсортированном индексе."""
+    index = SortedIndex('year')
+    index.build({1: {'year': '2019'}, 2: {'year': '1950'}, 3: {'year': '1999'}, 4: {'year': '1950'}})
+    assert index.range(1900, 1999) == [2, 4, 3]
+    assert index.range(2000, 2010) == []
+    assert index.search('19') == [1, 2, 3, 4]
+    assert index.search('1950') == [2, 4]
+    assert index.search('abc') == []
+
+
+def test_sorted_index_incremental():
+    """Тест добавления и удаления записей в отсортированном индексе."""
+    index = SortedIndex('year')
+    index.add(1, {'year': 2000})
+    index.add(2, {'year': '1990'})
+    index.remove(1, {'year': '2000'})
+    index.add(1, {'year': 1980})
+    assert index.entries == [(1980, 1), (1990, 2)]
+    assert index.range(0, 3000) == [1, 2]
+
+
+def test_search_range(csv_manager: CSVDataManager):
+    """Тест поиска по диапазону с индексом и без него."""
+    csv_manager.create([Book(title=f'Book {year}', author='Author', year=year) for year in (2019, 1950, 1999, 1900)])
+    indexed = CSVDataManager(path=csv_manager.path, fieldnames=Book.get_fields(), indexes=[SortedIndex('year')])
+    for manager in (csv_manager, indexed):
+        assert [obj['year'] for obj in manager.search_range('year', 1900, 1999)] == ['1900', '1950', '1999']
+        assert [obj['year'] for obj in manager.search('year', '19')] == ['2019', '1950', '1999', '1900']
+        assert [obj['year'] for obj in manager.search('year', '2019')] == ['2019']
+        assert [obj['year'] for obj in manager.search('year', 'x')] == []
+
+
+def test_trigram_index_normalized_keys():
+    """Тест поиска по нормализованным ключам: регистр, `ё` и совместимые символы Unicode."""
+    index = TrigramIndex('author')
+    index.build({1: {'author': 'Пётр Ершов'}, 2: {'author': 'ＬＥＶ Tolstoy'}})
+    assert index.keys == {1: 'петр ершов', 2: 'lev tolstoy'}
+    assert index.search('ПЕТР') == [1]
+    assert index.search('lev') == [2]
+
+
+def test_trigram_index_fuzzy_search():
+    """Тест ранжированного поиска с опечатками с отбором кандидатов по триграммам."""
+    index = TrigramIndex('author')
+    index.build(
+        {
+            1: {'author': 'Лев Толстой'},
+            2: {'author': 'Алексей Толстой'},
+            3: {'author': 'Leo Tolstoy'},
+            4: {'author': 'Фёдор Достоевский'},
+        }
+    )
+    assert index.fuzzy_search('Толстои', 10) == [1, 2]
+    assert index.fuzzy_search('Tolstoi', 10) == [3]
+    assert index.fuzzy_search('достоевскии', 1) == [4]
+    assert index.fuzzy_search('Лев', 10) == [1, 2, 4]
+
+
+def test_fuzzy_search_uses_index(trigram_manager: CSVDataManager):
+    """Тест того, что нечеткий поиск по индексу совпадает с полным перебором."""
+    trigram_manager.create(
+        [
+            Book(title='Война и мир', author='Лев Толстой', year=1869),
+            Book(title='Анна Каренина', author='Лев Толстой', year=1877),
+            Book(title='Идиот', author='Фёдор Достоевский', year=1869),
+        ]
+    )
+    plain_manager = CSVDataManager(path=trigram_manager.path, fieldnames=Book.get_fields())
+    for field, value in [('author', 'Толстои'), ('title', 'Война и мр'), ('author', 'федор')]:
+        assert trigram_manager.fuzzy_search(field, value) == plain_manager.fuzzy_search(field, value)
+    assert [obj['id'] for obj in trigram_manager.fuzzy_search('title', 'Анна Коренина')] == ['2']
+    for limit in (0, -1):
+        assert trigram_manager.fuzzy_search('author', 'Толстои', limit) == []
+        assert plain_manager.fuzzy_search('author', 'Толстои', limit) == []
+    assert [obj['id'] for obj in trigram_manager.search('author', 'ФЁДОР')] == ['3']
@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from core.data_types import Book
+from core.managers import CSVDataManager, JournaledCSVDataManager
+
+
+def read_file(path: str | Path) -> str:
+    with open(path) as file:
+        return file.read()
+
+
+def test_changes_go_to_journal(journaled_manager: JournaledCSVDataManager, book_models: list[Book]):
+    """Тест того, что изменения дописываются в журнал, не переписывая файл данных."""
+    journaled_manager.create(book_models)
+    journaled_manager.udate(1, Book(title='Updated Book', author='Author A', year=2023, status='Выдана'))
+    journaled_manager.delete(2)
+    assert read_file(journaled_manager.path) == ''
+    records = [json.loads(line) for line in read_file(journaled_manager.journal_path).splitlines()]
+    assert [record['op'] for record in records] == ['put', 'put', 'put', 'delete']
+    assert journaled_manager.read_list() == [
+        {'id': '1', 'title': 'Updated Book', 'author': 'Author A', 'year': '2023', 'status': 'Выдана'}
+    ]
+
+
+def test_group_sync(journaled_manager: JournaledCSVDataManager, book_model: Book):
+    """Тест того, что журнал сбрасывается на диск группами."""
+    journaled_manager.group_interval = 60
+    journaled_manager.sync()
+    journaled_manager.create(book_model)
+    assert journaled_manager._pending == 1
+    journaled_manager.create(book_model)
+    assert journaled_manager._pending == 0
+
+
+def test_group_sync_by_timer(journaled_manager: JournaledCSVDataManager, book_model: Book):
+    """Тест того, что неполная группа сбрасывается на диск по таймеру без новых записей."""
+    journaled_manager.group_interval = 0.05
+    journaled_manager.sync()
+    journaled_manager.create(book_model)
+    assert journaled_manager._pending == 1
+    timer = journaled_manager._sync_timer
+    assert timer is not None
+    timer.join(5)
+    assert (journaled_manager._pending, journaled_manager._sync_timer) == (0, None)
+
+
+def test_checkpoint(journaled_manager: JournaledCSVDataManager, book_models: list[Book]):
+    """Тест контрольной точки: файл данных переписывается, а журнал очищается."""
+    journaled_manager.create(book_models)
+    journaled_manager.create(book_models)
+    assert read_file(journaled_manager.journal_path).count('\n') == 4
+    journaled_manager.delete(4)
+    assert read_file(journaled_manager.journal_path) == ''
+    plain_manager = CSVDataManager(path=journaled_manager.path, fieldnames=Book.get_fields())
+    assert [obj['id'] for obj in plain_manager.read_list()] == ['1', '2', '3']
+    created = journaled_manager.create(book_models[0])
+    assert isinstance(created, dict) and created['id'] == 5
+
+
+def test_recovery(journaled_manager: JournaledCSVDataManager, book_models: list[Book]):
+    """Тест восстановления после сбоя: журнал применяется при открытии, оборванная строка пропускается."""
+    journaled_manager.create(book_models)
+    journaled_manager.delete(1)
+    with open(journaled_manager.journal_path, mode='a') as file:
+        file.write('{"op": "put", "row": {"id": 3, "tit')
+    journaled_manager.close()
+    manager = JournaledCSVDataManager(path=journaled_manager.path, fieldnames=Book.get_fields())
+    assert read_file(manager.journal_path) == ''
+    assert [obj['title'] for obj in manager.read_list()] == ['Book 2']
+    created = manager.create(book_models[0])
+    assert isinstance(created, dict) and created['id'] == 3
+    manager.close()
+
+
+def test_corrupted_journal(journaled_manager: JournaledCSVDataManager, book_models: list[Book]):
+    """Тест того, что испорченная строка в середине журнала не пропускается молча."""
+    journaled_manager.create(book_models[0])
+    journaled_manager.close()
+    with open(journaled_manager.journal_path, mode='a') as file:
+        file.write('{"op": "put", "row": {"id": 2, "tit\n')
+        file.write(json.dumps({'op': 'delete', 'id': 1}) + '\n')
+    with pytest.raises(ValueError, match='строке 2'):
+        JournaledCSVDataManager(path=journaled_manager.path, fieldnames=Book.get_fields())
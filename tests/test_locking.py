@@ -0,0 +1,55 @@
+import multiprocessing
+
+import pytest
+
+from core.data_types import Book
+from core.managers import (
+    CachedCSVDataManager,
+    CSVDataManager,
+    IndexedCSVDataManager,
+    JournaledCSVDataManager,
+    LogCSVDataManager,
+)
+
+WORKERS = 4
+BOOKS_PER_WORKER = 15
+
+MANAGERS = [CSVDataManager, CachedCSVDataManager, LogCSVDataManager, IndexedCSVDataManager, JournaledCSVDataManager]
+
+
+def run_worker(manager_class: type[CSVDataManager], path: str, worker: int) -> None:
+    """Добавляет книги и сразу меняет у каждой год, работая с тем же файлом, что и другие процессы."""
+    manager = manager_class(path=path, fieldnames=Book.get_fields())
+    for number in range(BOOKS_PER_WORKER):
+        title = f'Book {worker}-{number}'
+        created = manager.create(Book(title=title, author=f'Author {worker}', year=2000))
+        assert isinstance(created, dict)
+        manager.udate(created['id'], Book(title=title, author=f'Author {worker}', year=2000 + number))
+    manager.close()
+
+
+@pytest.mark.parametrize('manager_class', MANAGERS)
+def test_concurrent_processes(locking_path: str, manager_class: type[CSVDataManager]):
+    """Тест того, что параллельные процессы не выдают одинаковые id и не теряют изменения друг друга."""
+    context = multiprocessing.get_context('fork')
+    processes = [
+        context.Process(target=run_worker, args=(manager_class, locking_path, worker)) for worker in range(WORKERS)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert all(process.exitcode == 0 for process in processes)
+    rows = manager_class(path=locking_path, fieldnames=Book.get_fields()).read_list()
+    assert sorted(int(row['id']) for row in rows) == list(range(1, WORKERS * BOOKS_PER_WORKER + 1))
+    expected = {
+        f'Book {worker}-{number}': str(2000 + number) for worker in range(WORKERS) for number in range(BOOKS_PER_WORKER)
+    }
+    assert {row['title']: row['year'] for row in rows} == expected
+
+
+def test_lock_upgrade_is_rejected(csv_manager: CSVDataManager):
+    """Тест того, что разделяемую блокировку нельзя повысить до монопольной."""
+    with csv_manager._lock(), pytest.raises(RuntimeError):
+        with csv_manager._lock(exclusive=True):
+            pass
@@ -0,0 +1,54 @@
+from core.data_types import Book
+from core.managers import LogCSVDataManager
+
+
+def read_file(manager: LogCSVDataManager) -> str:
+    with open(manager.path) as file:
+        return file.read()
+
+
+def test_update_appends_version(log_manager: LogCSVDataManager, book_models: list[Book]):
+    """Тест того, что обновление дописывает новую версию, не переписывая файл."""
+    log_manager.create(book_models)
+    before = read_file(log_manager)
+    log_manager.udate(1, Book(title='Updated Book', author='Author A', year=2024, status='Выдана'))
+    after = read_file(log_manager)
+    assert after.startswith(before)
+    assert log_manager.read_detail(1)['title'] == 'Updated Book'
+    assert log_manager.read_detail(1)['status'] == 'Выдана'
+    assert len(log_manager.read_list()) == 2
+
+
+def test_delete_appends_tombstone(log_manager: LogCSVDataManager, book_models: list[Book]):
+    """Тест того, что удаление дописывает надгробие и скрывает запись."""
+    log_manager.create(book_models + [Book(title='Book 3', author='Author C', year=2024)])
+    before = read_file(log_manager)
+    deleted = log_manager.delete(2)
+    assert deleted['title'] == 'Book 2'
+    assert read_file(log_manager).startswith(before)
+    assert [obj['id'] for obj in log_manager.read_list()] == ['1', '3']
+    assert 'deleted' not in log_manager.read_detail(1)
+
+
+def test_compaction_by_threshold(log_manager: LogCSVDataManager, book_models: list[Book]):
+    """Тест уплотнения файла после превышения доли устаревших записей."""
+    log_manager.create(book_models)
+    log_manager.udate(1, Book(title='Book 1', author='Author A', year=2023))
+    log_manager.delete(2)
+    assert log_manager.dead_ratio == 0.0
+    assert len(read_file(log_manager).splitlines()) == 2
+    assert log_manager.read_detail(1)['year'] == '2023'
+    reopened = LogCSVDataManager(path=log_manager.path, fieldnames=Book.get_fields())
+    assert reopened.read_list() == log_manager.read_list()
+
+
+def test_background_compaction(log_manager: LogCSVDataManager, book_models: list[Book]):
+    """Тест фонового уплотнения."""
+    log_manager.background_compaction = True
+    log_manager.create(book_models)
+    log_manager.delete(1)
+    log_manager.delete(2)
+    assert log_manager._compaction is not None
+    log_manager._compaction.join()
+    assert log_manager.dead_ratio == 0.0
+    assert log_manager.read_list() == []
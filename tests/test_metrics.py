@@ -0,0 +1,67 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from core.console import BookConsoleService
+from core.constants import STATS_EMPTY
+from core.data_types import Book
+from core.exceptions import IDErorr
+from core.managers import CSVDataManager
+from core.metrics import InstrumentedDataManager, Metrics, OperationStats
+
+
+def test_operation_stats_percentile():
+    """Проверяет оценку перцентиля по гистограмме задержек."""
+    metrics = Metrics()
+    for elapsed in [0.0005] * 90 + [0.02] * 10:
+        metrics.record('read', elapsed)
+    stats = metrics.operations['read']
+    assert stats.calls == 100
+    assert stats.percentile(0.5) == 0.001
+    assert stats.percentile(0.95) == 0.05
+    assert OperationStats().percentile(0.95) == 0.0
+
+
+def test_instrumented_manager(csv_manager: CSVDataManager, book_models: list[Book]):
+    """Проверяет подсчет вызовов, строк, ошибок и объема записи."""
+    manager = InstrumentedDataManager(csv_manager)
+    manager.create(book_models)
+    assert manager.read_detail(1)['title'] == 'Book 1'
+    with pytest.raises(IDErorr):
+        manager.delete(3)
+    assert len(list(manager.iter_list(limit=1))) == 1
+    assert manager.search_range('year', 2020, 2024)
+    operations = manager.metrics.operations
+    assert operations['create'].calls == 1
+    assert operations['create'].rows == 2
+    assert operations['create'].bytes_written > 0
+    assert operations['read_detail'].rows == 1
+    assert operations['delete'].errors == 1
+    assert operations['iter_list'].rows == 1
+    assert operations['search_range:year'].rows == 2
+    assert manager.max_id == 2
+
+
+def test_dump(csv_manager: CSVDataManager, tmp_path):
+    """Проверяет сохранение статистики в JSON."""
+    manager = InstrumentedDataManager(csv_manager)
+    manager.read_list()
+    manager.metrics.dump(tmp_path / 'metrics.json')
+    with open(tmp_path / 'metrics.json') as file:
+        data = json.load(file)
+    assert data['read_list']['calls'] == 1
+    assert len(data['read_list']['histogram']) == len(data['read_list']['bounds']) + 1
+
+
+def test_show_stats(console: BookConsoleService):
+    """Проверяет вывод статистики действий меню."""
+    console.show_stats()
+    assert console.buffer == [STATS_EMPTY]
+    console.buffer.clear()
+    console.input = Mock(return_value='invalid')  # type: ignore[method-assign]
+    with pytest.raises(ValueError):
+        console.handle_action('5')
+    console.handle_action('6')
+    assert console.metrics.operations['action:delete_book'].errors == 1
+    assert console.buffer[1].startswith('| action:delete_book | 1 | 1 |')
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 
 import pytest
 
@@ -30,9 +31,9 @@ def test_invalid_author(author: str):
 
 @pytest.mark.parametrize(
     'year',
-    ['abcd', -1, 3000],
+    ['abcd', -1, 3000, '²', True, 1999.7, [1999], None],
 )
-def test_invalid_year(year: str | int):
+def test_invalid_year(year: Any):
     """Тест на валидацию поля year."""
     current_year = datetime.now().year
     expected_error = f'Поле `Год издания` должно быть целым числом в диапазоне 0-{current_year}.'
@@ -51,3 +52,26 @@ def test_default_status():
     """Тест на значение поля status по умолчанию."""
     book = Book(title='Название книги', author='Автор', year=2023)
     assert book.status == Status.IN_STOCK.value
+
+
+def test_book_is_slotted():
+    """Тест того, что экземпляры книги не хранят `__dict__`."""
+    book = Book(title='Название книги', author='Автор', year=2023)
+    assert not hasattr(book, '__dict__')
+    with pytest.raises(AttributeError):
+        book.extra = 1  # type: ignore[attr-defined]
+
+
+def test_to_dict_and_fields():
+    """Тест получения полей и словаря модели."""
+    book = Book(title='Название книги', author='Автор', year=2023)
+    assert Book.get_fields() == ['title', 'author', 'year', 'status']
+    assert book.to_dict() == {'title': 'Название книги', 'author': 'Автор', 'year': 2023, 'status': 'В наличии'}
+
+
+def test_from_row():
+    """Тест создания книги из строки хранилища."""
+    status = ''.join(['Выд', 'ана'])
+    book = Book.from_row({'id': '1', 'title': 'Название книги', 'author': 'Автор', 'year': '2023', 'status': status})
+    assert book.year == 2023
+    assert book.status is Status.GIVEN.value
@@ -0,0 +1,77 @@
+from unittest.mock import Mock
+
+import pytest
+
+from core.console import BookConsoleService
+from core.constants import BOOK_LIST, QUERY_EMPTY
+from core.data_types import Book
+from core.indexes import SortedIndex, TrigramIndex
+from core.managers import CSVDataManager
+from core.query import Operator, Predicate
+from core.sqlite_manager import SQLiteDataManager
+
+BOOKS = [
+    Book(title='Война и мир', author='Лев Толстой', year=1869, status='Выдана'),
+    Book(title='Анна Каренина', author='Лев Толстой', year=1877),
+    Book(title='Идиот', author='Фёдор Достоевский', year=1869, status='Выдана'),
+    Book(title='Хаджи-Мурат', author='Лев Толстой', year=1912, status='Выдана'),
+]
+PREDICATES = [Predicate.contains('author', 'толстой'), Predicate.eq('status', 'выдана'), Predicate.range('year', 1860)]
+
+
+def test_predicate_matches():
+    """Тест проверки условий по нормализованным значениям и открытым границам диапазона."""
+    row = {'title': 'Ёжик в тумане', 'year': '1975', 'status': 'Выдана'}
+    assert Predicate.contains('title', 'ЕЖИК').matches(row)
+    assert Predicate.eq('status', 'выдана').matches(row)
+    assert not Predicate.eq('title', 'ёжик').matches(row)
+    assert Predicate.range('year', None, 1975).matches(row)
+    assert not Predicate.range('year', 1976).matches(row)
+    assert Predicate.from_dict({'field': 'year', 'op': 'range', 'start': 1900}) == Predicate.range('year', 1900)
+    with pytest.raises(ValueError, match='Неизвестное условие `like`.'):
+        Predicate.from_dict({'field': 'title', 'op': 'like', 'value': 'x'})
+
+
+def test_query_plan(csv_manager: CSVDataManager):
+    """Тест выбора самого избирательного индекса и совпадения результатов с полным проходом."""
+    csv_manager.create(BOOKS)
+    expected = list(csv_manager.query(PREDICATES))
+    assert [obj['id'] for obj in expected] == ['1', '4']
+    assert csv_manager._plan(PREDICATES) is None
+    indexed = CSVDataManager(csv_manager.path, Book.get_fields(), indexes=[TrigramIndex('author'), SortedIndex('year')])
+    plan = indexed._plan(PREDICATES + [Predicate.range('year', 1900, 1950)])
+    assert plan is not None
+    assert (plan[0].field, plan[1].end) == ('year', 1950)
+    plan = indexed._plan(PREDICATES)
+    assert plan is not None
+    assert plan[1].operator is Operator.CONTAINS
+    assert list(indexed.query(PREDICATES)) == expected
+    assert [obj['id'] for obj in indexed.query(PREDICATES, 1, 1)] == ['4']
+    with pytest.raises(ValueError):
+        csv_manager.query([Predicate.eq('unknown', 'x')])
+    assert list(indexed.query([Predicate.eq('year', '²')])) == []
+    for manager in (csv_manager, indexed):
+        with pytest.raises(ValueError, match='применимо только к числовым полям, а `title` - не число'):
+            list(manager.query([Predicate.range('title', 1900)]))
+
+
+def test_query_default_scan(sqlite_manager: SQLiteDataManager):
+    """Тест реализации запроса по умолчанию одним проходом по записям и проверки имен полей."""
+    sqlite_manager.create(BOOKS)
+    assert [obj['id'] for obj in sqlite_manager.query(PREDICATES)] == [1, 4]
+    with pytest.raises(ValueError, match='Поля unknown нет в таблице.'):
+        sqlite_manager.query([Predicate.eq('unknown', 'x')])
+    with pytest.raises(ValueError, match='Поля unknown нет в таблице.'):
+        sqlite_manager.fuzzy_search('unknown', 'x')
+
+
+def test_search_book_query(console: BookConsoleService, csv_manager: CSVDataManager):
+    """Проверяет расширенный поиск из меню с пропуском части условий."""
+    csv_manager.create(BOOKS)
+    console.input = Mock(side_effect=['7', '', 'толстой', '2', '1900', ''])  # type: ignore[method-assign]
+    console.write = Mock()  # type: ignore[method-assign]
+    console.search_book()
+    assert console.buffer == [BOOK_LIST.format(id=4, **BOOKS[3].to_dict())]
+    console.input = Mock(side_effect=['7', '', '', '', '', ''])  # type: ignore[method-assign]
+    with pytest.raises(ValueError, match=QUERY_EMPTY):
+        console.search_book()
@@ -0,0 +1,101 @@
+import json
+import threading
+from http.client import HTTPConnection
+from typing import Any, Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from core.managers import CachedCSVDataManager
+from core.server import BookHTTPService
+
+
+@pytest.fixture
+def server(cached_manager: CachedCSVDataManager) -> Iterator[tuple[str, int]]:
+    """Фикстура HTTP-сервера на свободном порту, работающего в отдельном потоке."""
+    http_server = BookHTTPService(cached_manager, port=0).create_server()
+    thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    yield '127.0.0.1', http_server.server_address[1]
+    http_server.shutdown()
+    http_server.server_close()
+
+
+def request(server: tuple[str, int], method: str, path: str, body: Any = None) -> tuple[int, dict]:
+    connection = HTTPConnection(*server)
+    connection.request(method, path, body=None if body is None else json.dumps(body))
+    response = connection.getresponse()
+    result = response.status, json.loads(response.read())
+    connection.close()
+    return result
+
+
+def test_crud(server: tuple[str, int]):
+    """Тест создания, чтения, изменения, поиска и удаления книг через HTTP."""
+    book = {'title': 'Война и мир', 'author': 'Лев Толстой', 'year': 1869}
+    status, result = request(server, 'POST', '/books', book)
+    assert (status, result['result']['id']) == (201, 1)
+    request(server, 'POST', '/books', {'title': 'Идиот', 'author': 'Фёдор Достоевский', 'year': 1869})
+    status, result = request(server, 'PUT', '/books/1', book | {'status': 'Выдана'})
+    assert (status, result['result']['status']) == (200, 'Выдана')
+    status, result = request(server, 'GET', '/books/1')
+    assert result['result']['status'] == 'Выдана'
+    status, result = request(server, 'GET', '/books/search?field=author&value=%D1%82%D0%BE%D0%BB%D1%81%D1%82')
+    assert [obj['id'] for obj in result['result']] == ['1']
+    status, result = request(server, 'POST', '/books/query', {'where': [{'field': 'year', 'op': 'range', 'end': 1900}]})
+    assert [obj['id'] for obj in result['result']] == ['1', '2']
+    status, result = request(server, 'POST', '/books/status', {'ids': [1, 2], 'status': 'В наличии'})
+    assert status == 200
+    status, result = request(server, 'DELETE', '/books/2')
+    assert (status, result['result']['title']) == (200, 'Идиот')
+    status, result = request(server, 'GET', '/books?limit=10')
+    assert [(obj['id'], obj['status']) for obj in result['result']] == [('1', 'В наличии')]
+
+
+def test_errors(server: tuple[str, int]):
+    """Тест кодов ответа на ошибочные запросы."""
+    assert request(server, 'GET', '/books/5') == (404, {'ok': False, 'error': 'ID 5 не существует.'})
+    assert request(server, 'GET', '/unknown')[0] == 404
+    assert request(server, 'DELETE', '/books')[0] == 405
+    status, result = request(server, 'POST', '/books', {'title': 'Book'})
+    assert (status, result['error']) == (400, 'Не заполнено поле `author`.')
+    assert request(server, 'POST', '/books', [1])[0] == 400
+    for length in ('-1', 'abc'):
+        connection = HTTPConnection(*server, timeout=5)
+        connection.request('POST', '/books', headers={'Content-Length': length})
+        response = connection.getresponse()
+        error = json.loads(response.read())['error']
+        assert (response.status, error) == (400, 'Некорректный заголовок Content-Length.')
+        connection.close()
+
+
+def test_internal_error(
+    server: tuple[str, int], cached_manager: CachedCSVDataManager, monkeypatch: pytest.MonkeyPatch
+):
+    """Тест того, что непредвиденная ошибка возвращает 500, а соединение продолжает работать."""
+    monkeypatch.setattr(cached_manager, 'read_detail', Mock(side_effect=RuntimeError('disk failure')))
+    connection = HTTPConnection(*server, timeout=5)
+    connection.request('GET', '/books/1')
+    response = connection.getresponse()
+    assert (response.status, json.loads(response.read())) == (500, {'ok': False, 'error': 'Внутренняя ошибка сервера.'})
+    connection.request('GET', '/books')
+    assert connection.getresponse().status == 200
+    connection.close()
+
+
+def test_concurrent_creates(server: tuple[str, int], cached_manager: CachedCSVDataManager):
+    """Тест того, что параллельные запросы получают разные ID."""
+    ids = []
+
+    def create(number: int) -> None:
+        for i in range(5):
+            book = {'title': f'Book {number}-{i}', 'author': 'Author', 'year': 2000}
+            ids.append(request(server, 'POST', '/books', book)[1]['result']['id'])
+
+    threads = [threading.Thread(target=create, args=(number,)) for number in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(ids) == list(range(1, 21))
+    assert len(cached_manager.read_list()) == 20
@@ -0,0 +1,99 @@
+import os
+from typing import Sequence
+
+import pytest
+
+from core.data_types import Book, ModelDict
+from core.exceptions import IDErorr
+from core.managers import CSVDataManager
+from core.sharded_manager import ShardedCSVDataManager
+
+
+def get_books(count: int) -> list[Book]:
+    return [Book(title=f'Book {i}', author=f'Author {i % 2}', year=2000 + i) for i in range(1, count + 1)]
+
+
+def test_create_splits_by_id_range(sharded_manager: ShardedCSVDataManager):
+    """Тест раскладки книг по шардам и записи манифеста."""
+    sharded_manager.create(get_books(4))
+    sharded_manager.create(Book(title='Book 5', author='Author 1', year=2005))
+    assert sorted(name for name in os.listdir(sharded_manager.path) if name.endswith(('.csv', '.json'))) == [
+        'manifest.json',
+        'shard-000000.csv',
+        'shard-000001.csv',
+        'shard-000002.csv',
+    ]
+    assert [obj['id'] for obj in sharded_manager._get_shard(1).read_list()] == ['3', '4']
+    assert [obj['id'] for obj in sharded_manager.read_list()] == ['1', '2', '3', '4', '5']
+    reopened = ShardedCSVDataManager(sharded_manager.path, Book.get_fields(), shard_size=100)
+    assert reopened.shard_size == 2
+    assert reopened.max_id == 5
+
+
+def test_point_operations_touch_one_shard(sharded_manager: ShardedCSVDataManager):
+    """Тест того, что изменение и удаление переписывают только шард с книгой."""
+    sharded_manager.create(get_books(4))
+    other_stamp = sharded_manager._get_shard(0)._get_stamp()
+    sharded_manager.udate(3, Book(title='Updated', author='Author 3', year=1999, status='Выдана'))
+    sharded_manager.delete(4)
+    assert sharded_manager._get_shard(0)._get_stamp() == other_stamp
+    assert sharded_manager.read_detail(3)['status'] == 'Выдана'
+    for id in (4, 7, 0):
+        with pytest.raises(IDErorr):
+            sharded_manager.read_detail(id)
+
+
+def test_batch_locks_all_shards(sharded_manager: ShardedCSVDataManager, monkeypatch: pytest.MonkeyPatch):
+    """Тест того, что пакетные операции держат блокировки всех затронутых шардов от проверки до записи."""
+    sharded_manager.create(get_books(5))
+    shards = [sharded_manager._get_shard(shard_id) for shard_id in (0, 2)]
+    locked = []
+    original = CSVDataManager.delete_many
+
+    def delete_many(self: CSVDataManager, ids: Sequence[int]) -> list[ModelDict]:
+        locked.append([shard._lock_depth > 0 and shard._lock_exclusive for shard in shards])
+        return original(self, ids)
+
+    monkeypatch.setattr(CSVDataManager, 'delete_many', delete_many)
+    with pytest.raises(IDErorr):
+        sharded_manager.delete_many([5, 1, 6])
+    assert locked == []
+    sharded_manager.delete_many([5, 1])
+    assert locked == [[True, True], [True, True]]
+    assert [shard._lock_depth for shard in shards] == [0, 0]
+    assert [obj['id'] for obj in sharded_manager.read_list()] == ['2', '3', '4']
+
+
+def test_iter_and_search(sharded_manager: ShardedCSVDataManager):
+    """Тест постраничного обхода и поиска по всем шардам."""
+    sharded_manager.create(get_books(5))
+    assert [obj['id'] for obj in sharded_manager.iter_list(1, 3)] == ['2', '3', '4']
+    assert [obj['id'] for obj in sharded_manager.search('author', 'author 1')] == ['1', '3', '5']
+    assert [obj['id'] for obj in sharded_manager.iter_search('author', 'author 1', 1, 1)] == ['3']
+    assert [obj['year'] for obj in sharded_manager.search_range('year', 2002, 2004)] == ['2002', '2003', '2004']
+    with pytest.raises(ValueError):
+        sharded_manager.search('unknown', 'value')
+
+
+def test_recovers_max_id_from_last_shard(sharded_manager: ShardedCSVDataManager):
+    """Тест восстановления максимального id, если манифест не успел записаться."""
+    sharded_manager.create(get_books(2))
+    sharded_manager._get_shard(1)._append([Book(title='Lost', author='Author', year=2000).to_dict() | {'id': 3}])
+    reopened = ShardedCSVDataManager(sharded_manager.path, Book.get_fields())
+    assert reopened.max_id == 3
+    assert reopened.read_detail(3)['title'] == 'Lost'
+    result = reopened.create(Book(title='Book 4', author='Author', year=2004))
+    assert isinstance(result, dict)
+    assert result['id'] == 4
+
+
+def test_parallel_search(sharded_manager: ShardedCSVDataManager):
+    """Тест параллельного поиска по шардам в пуле процессов."""
+    sharded_manager.create(get_books(5))
+    expected = sharded_manager.search('author', 'author 1')
+    sharded_manager.parallel_threshold, sharded_manager.search_workers = 0, 2
+    assert list(sharded_manager.iter_search('author', 'author', 1, 2)) == sharded_manager.read_list()[1:3]
+    assert sharded_manager._search_pool is None
+    assert list(sharded_manager.iter_search('author', 'author 1')) == expected
+    assert sharded_manager._search_pool is not None
+    assert sharded_manager.search('author', 'author 1') == expected
@@ -0,0 +1,110 @@
+import pytest
+
+from core.data_types import Book
+from core.exceptions import IDErorr
+from core.managers import CSVDataManager
+from core.sqlite_manager import SQLiteDataManager
+
+
+def test_create_and_read(sqlite_manager: SQLiteDataManager, book_models: list[Book]):
+    """Тест создания и чтения записей."""
+    results = sqlite_manager.create(book_models)
+    assert [result['id'] for result in results] == [1, 2]
+    result = sqlite_manager.create(Book(title='Book 3', author='Author C', year=2000))
+    assert isinstance(result, dict)
+    assert result['id'] == 3
+    assert sqlite_manager.read_detail(3) == {
+        'id': 3,
+        'title': 'Book 3',
+        'author': 'Author C',
+        'year': 2000,
+        'status': 'В наличии',
+    }
+    assert [obj['title'] for obj in sqlite_manager.read_list()] == ['Book 1', 'Book 2', 'Book 3']
+
+
+def test_update_and_delete(sqlite_manager: SQLiteDataManager, book_models: list[Book]):
+    """Тест обновления и удаления записей."""
+    sqlite_manager.create(book_models)
+    updated = sqlite_manager.udate(1, Book(title='Updated Book', author='Author A', year=2023, status='Выдана'))
+    assert updated['status'] == 'Выдана'
+    assert sqlite_manager.read_detail(1)['title'] == 'Updated Book'
+    deleted = sqlite_manager.delete(2)
+    assert deleted['title'] == 'Book 2'
+    assert [obj['id'] for obj in sqlite_manager.read_list()] == [1]
+    assert sqlite_manager.search('title', 'Book 2') == []
+
+
+def test_invalid_id(sqlite_manager: SQLiteDataManager, book_model: Book):
+    """Тест операций с несуществующей записью."""
+    with pytest.raises(IDErorr, match='ID 1 не существует'):
+        sqlite_manager.read_detail(1)
+    with pytest.raises(IDErorr, match='ID 1 не существует'):
+        sqlite_manager.udate(1, book_model)
+    with pytest.raises(IDErorr, match='ID 1 не существует'):
+        sqlite_manager.delete(1)
+
+
+def test_search(sqlite_manager: SQLiteDataManager):
+    """Тест полнотекстового поиска, точного поиска по году и поиска по диапазону."""
+    sqlite_manager.create(
+        [
+            Book(title='Война и мир', author='Лев Толстой', year=1869),
+            Book(title='Мир "Полудня"', author='Стругацкие', year=1962),
+            Book(title='Анна Каренина', author='Лев Толстой', year=1878),
+        ]
+    )
+    assert [obj['id'] for obj in sqlite_manager.search('title', 'МИР')] == [1, 2]
+    assert [obj['id'] for obj in sqlite_manager.search('title', '"Полудня"')] == [2]
+    assert [obj['id'] for obj in sqlite_manager.search('author', 'толстой')] == [1, 3]
+    assert [obj['id'] for obj in sqlite_manager.search('title', 'ир')] == [1, 2]
+    assert [obj['id'] for obj in sqlite_manager.search('year', '18')] == [1, 3]
+    assert [obj['id'] for obj in sqlite_manager.search('year', '1878')] == [3]
+    assert [obj['id'] for obj in sqlite_manager.search('year', 'x')] == []
+    assert [obj['id'] for obj in sqlite_manager.search_range('year', 1800, 1900)] == [1, 3]
+    with pytest.raises(ValueError, match='Поля some_field нет в таблице.'):
+        sqlite_manager.search(field='some_field', value='Test')
+
+
+def test_search_normalized(sqlite_manager: SQLiteDataManager):
+    """Тест того, что полнотекстовый поиск не различает `ё`/`е`, и заполнения отсутствующей FTS-таблицы."""
+    sqlite_manager.create(
+        [Book(title='Ёлка зелёная', author='Пётр', year=2000), Book(title='Елка', author='Автор', year=2000)]
+    )
+    sqlite_manager.udate(2, Book(title='Ель', author='Петр Иванов', year=2000))
+    assert [obj['id'] for obj in sqlite_manager.search('title', 'елка')] == [1]
+    assert [obj['id'] for obj in sqlite_manager.search('title', 'ЗЕЛЁН')] == [1]
+    assert [obj['id'] for obj in sqlite_manager.search('author', 'петр')] == [1, 2]
+    with sqlite_manager.connection:
+        sqlite_manager.connection.execute('DROP TABLE data_search')
+    sqlite_manager.close()
+    reopened = SQLiteDataManager(path=sqlite_manager.path, fieldnames=Book.get_fields(), fts_fields=['title', 'author'])
+    assert [obj['id'] for obj in reopened.search('author', 'пётр')] == [1, 2]
+    reopened.delete(1)
+    assert [obj['id'] for obj in reopened.search('author', 'пётр')] == [2]
+    reopened.close()
+
+
+def test_migrate(sqlite_manager: SQLiteDataManager, csv_manager: CSVDataManager, book_models: list[Book]):
+    """Тест однократного переноса данных из CSV с сохранением id."""
+    csv_manager.create(book_models + [Book(title='Book 3', author='Author C', year=1999)])
+    csv_manager.delete(1)
+    assert sqlite_manager.migrate(csv_manager) == 2
+    assert sqlite_manager.migrate(csv_manager) == 0
+    assert [obj['id'] for obj in sqlite_manager.read_list()] == [2, 3]
+    assert sqlite_manager.read_detail(3)['year'] == 1999
+    assert [obj['id'] for obj in sqlite_manager.search_range('year', 1990, 2000)] == [3]
+    assert [obj['id'] for obj in sqlite_manager.search('title', 'book')] == [2, 3]
+    sqlite_manager.delete_many([2, 3])
+    assert (sqlite_manager.migrated, sqlite_manager.migrate(csv_manager)) == (True, 0)
+    assert sqlite_manager.read_list() == []
+
+
+def test_iter_pages(sqlite_manager: SQLiteDataManager):
+    """Тест постраничного чтения и поиска записей."""
+    sqlite_manager.fetch_size = 2
+    sqlite_manager.create([Book(title=f'Book {i}', author='Author', year=2000 + i) for i in range(1, 6)])
+    assert [obj['id'] for obj in sqlite_manager.iter_list(1, 3)] == [2, 3, 4]
+    assert [obj['id'] for obj in sqlite_manager.iter_list(3)] == [4, 5]
+    assert [obj['id'] for obj in sqlite_manager.iter_search('title', 'book', 2, 2)] == [3, 4]
+    assert [obj['id'] for obj in sqlite_manager.iter_search('title', 'k', 4, 10)] == [5]
@@ -0,0 +1,128 @@
+import pytest
+
+from core.data_types import Book
+from core.managers import CSVDataManager
+
+MANAGERS = ['csv_manager', 'cached_manager', 'log_manager', 'journaled_manager', 'indexed_manager', 'trigram_manager']
+
+
+def get_books(count: int) -> list[Book]:
+    return [Book(title=f'Book {i}', author=f'Author {i}', year=2000 + i) for i in range(1, count + 1)]
+
+
+def read_files(manager: CSVDataManager) -> list[str]:
+    contents = []
+    for path in (manager.path, f'{manager.path}.journal'):
+        try:
+            with open(path, encoding='utf-8') as file:
+                contents.append(file.read())
+        except FileNotFoundError:
+            pass
+    return contents
+
+
+@pytest.mark.parametrize('name', MANAGERS)
+def test_transaction_commit(name: str, request: pytest.FixtureRequest):
+    """Тест того, что изменения видны внутри транзакции, но записываются только при выходе из нее."""
+    manager: CSVDataManager = request.getfixturevalue(name)
+    manager.create(get_books(3))
+    before = read_files(manager)
+    with manager.transaction():
+        manager.create(Book(title='Book 4', author='Author 4', year=2004))
+        manager.udate(1, Book(title='Updated', author='Author 1', year=2001, status='Выдана'))
+        manager.delete(2)
+        manager.udate_many({4: Book(title='Book 4', author='Author 4', year=2004, status='Выдана')})
+        assert read_files(manager) == before
+        assert manager.read_detail(1)['title'] == 'Updated'
+        assert [str(obj['id']) for obj in manager.read_list()] == ['1', '3', '4']
+        assert [str(obj['id']) for obj in manager.search('status', 'выдана')] == ['1', '4']
+    assert read_files(manager) != before
+    assert [(str(obj['id']), obj['status']) for obj in manager.read_list()] == [
+        ('1', 'Выдана'),
+        ('3', 'В наличии'),
+        ('4', 'Выдана'),
+    ]
+    assert [str(obj['id']) for obj in manager.search('title', 'updated')] == ['1']
+    reopened = type(manager)(path=manager.path, fieldnames=Book.get_fields())
+    assert [obj['title'] for obj in reopened.read_list()] == ['Updated', 'Book 3', 'Book 4']
+    assert (reopened.max_id, reopened.row_count) == (4, 3)
+
+
+@pytest.mark.parametrize('name', MANAGERS)
+def test_transaction_rollback(name: str, request: pytest.FixtureRequest):
+    """Тест того, что исключение внутри транзакции отменяет все ее изменения."""
+    manager: CSVDataManager = request.getfixturevalue(name)
+    manager.create(get_books(2))
+    before = read_files(manager)
+    with pytest.raises(RuntimeError):
+        with manager.transaction():
+            manager.create(Book(title='Lost', author='Author', year=2000))
+            manager.delete(1)
+            raise RuntimeError
+    assert read_files(manager) == before
+    assert [obj['title'] for obj in manager.read_list()] == ['Book 1', 'Book 2']
+    assert manager.search('title', 'lost') == []
+    assert (manager.max_id, manager.row_count) == (2, 2)
+    result = manager.create(Book(title='Book 3', author='Author 3', year=2003))
+    assert isinstance(result, dict)
+    assert result['id'] == 3
+
+
+def test_transaction_writes_once(csv_manager: CSVDataManager, monkeypatch: pytest.MonkeyPatch):
+    """Тест того, что транзакция записывает файл одной операцией: новые записи - дозаписью, остальное - перезаписью."""
+    calls = []
+
+    def track(name: str) -> None:
+        method = getattr(csv_manager, name)
+
+        def tracked(data: dict | list) -> None:
+            if csv_manager._staged is None:
+                calls.append(name)
+            method(data)
+
+        monkeypatch.setattr(csv_manager, name, tracked)
+
+    track('_write')
+    track('_append')
+    with csv_manager.transaction():
+        for book in get_books(3):
+            csv_manager.create(book)
+    assert calls == ['_append']
+    calls.clear()
+    with csv_manager.transaction():
+        csv_manager.create(Book(title='Book 4', author='Author 4', year=2004))
+        csv_manager.delete(1)
+        with csv_manager.transaction():
+            csv_manager.udate(2, Book(title='Updated', author='Author 2', year=2002))
+    assert calls == ['_write']
+    assert [obj['title'] for obj in csv_manager.read_list()] == ['Updated', 'Book 3', 'Book 4']
+
+
+@pytest.mark.parametrize('name', ['journaled_manager', 'log_manager'])
+def test_maintenance_refused_in_transaction(name: str, request: pytest.FixtureRequest):
+    """Тест того, что контрольная точка и уплотнение внутри транзакции не теряют записи журнала."""
+    manager = request.getfixturevalue(name)
+    manager.create(get_books(2))
+    maintenance = manager.checkpoint if name == 'journaled_manager' else manager.compact
+    with pytest.raises(RuntimeError):
+        with manager.transaction():
+            maintenance()
+    reopened = type(manager)(path=manager.path, fieldnames=Book.get_fields())
+    assert [obj['title'] for obj in reopened.read_list()] == ['Book 1', 'Book 2']
+
+
+@pytest.mark.parametrize('name', MANAGERS)
+def test_transaction_reads_return_copies(name: str, request: pytest.FixtureRequest):
+    """Тест того, что изменение прочитанных внутри транзакции записей не попадает в файл."""
+    manager: CSVDataManager = request.getfixturevalue(name)
+    manager.create(get_books(3))
+    with manager.transaction():
+        manager.read_detail(1)['title'] = 'mutated'
+        manager.read_list()[2]['title'] = 'mutated'
+        next(manager.iter_list())['author'] = 'mutated'
+        manager.delete(2)
+    reopened = type(manager)(path=manager.path, fieldnames=Book.get_fields())
+    assert [(obj['title'], obj['author']) for obj in reopened.read_list()] == [
+        ('Book 1', 'Author 1'),
+        ('Book 3', 'Author 3'),
+    ]